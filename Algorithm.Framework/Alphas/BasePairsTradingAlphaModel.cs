@@ -37,6 +37,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
         private readonly TimeSpan _predictionInterval;
         private readonly decimal _threshold;
         private readonly Dictionary<Tuple<Symbol, Symbol>, PairData> _pairs;
+        private PricePool _pricePool;
 
         /// <summary>
         /// List of security objects present in the universe
@@ -121,6 +122,8 @@ namespace QuantConnect.Algorithm.Framework.Alphas
 
         private void UpdatePairs(QCAlgorithm algorithm)
         {
+            _pricePool ??= new PricePool(algorithm);
+
             var assets = Securities.Select(x => x.Symbol).ToArray();
 
             for (var i = 0; i < assets.Length; i++)
@@ -144,12 +147,82 @@ namespace QuantConnect.Algorithm.Framework.Alphas
                         continue;
                     }
 
-                    var pairData = new PairData(algorithm, assetI, assetJ, _predictionInterval, _threshold);
+                    var pairData = new PairData(algorithm, assetI, assetJ, _predictionInterval, _threshold, _pricePool);
                     _pairs.Add(pairSymbol, pairData);
                 }
             }
         }
 
+        /// <summary>
+        /// Shares a single consolidator per symbol between all the pairs the symbol belongs to.
+        /// The consolidated prices are pushed to the price indicators of every pair and the consolidator
+        /// is removed from the subscription manager when the last of them is removed
+        /// </summary>
+        private class PricePool
+        {
+            private readonly QCAlgorithm _algorithm;
+            private readonly Dictionary<Symbol, IDataConsolidator> _consolidators = new();
+            private readonly Dictionary<Symbol, List<IndicatorBase<IndicatorDataPoint>>> _indicators = new();
+
+            public PricePool(QCAlgorithm algorithm)
+            {
+                _algorithm = algorithm;
+            }
+
+            /// <summary>
+            /// Adds a price indicator for the symbol, creating the consolidator on first use
+            /// </summary>
+            /// <param name="symbol">The symbol whose prices update the indicator</param>
+            /// <param name="indicator">The indicator updated with the consolidated prices</param>
+            public void Add(Symbol symbol, IndicatorBase<IndicatorDataPoint> indicator)
+            {
+                if (!_indicators.TryGetValue(symbol, out var indicators))
+                {
+                    var resolution = _algorithm.SubscriptionManager
+                        .SubscriptionDataConfigService
+                        .GetSubscriptionDataConfigs(symbol)
+                        .Min(x => x.Resolution);
+
+                    indicators = new List<IndicatorBase<IndicatorDataPoint>>();
+                    var consolidator = _algorithm.ResolveConsolidator(symbol, resolution);
+                    consolidator.DataConsolidated += (sender, consolidated) =>
+                    {
+                        foreach (var x in indicators)
+                        {
+                            x.Update(consolidated.EndTime, consolidated.Value);
+                        }
+                    };
+
+                    _algorithm.SubscriptionManager.AddConsolidator(symbol, consolidator);
+                    _consolidators[symbol] = consolidator;
+                    _indicators[symbol] = indicators;
+                }
+
+                indicators.Add(indicator);
+            }
+
+            /// <summary>
+            /// Removes a price indicator of the symbol, removing the consolidator once it is no longer used
+            /// </summary>
+            /// <param name="symbol">The symbol whose prices update the indicator</param>
+            /// <param name="indicator">The indicator to remove</param>
+            public void Remove(Symbol symbol, IndicatorBase<IndicatorDataPoint> indicator)
+            {
+                if (!_indicators.TryGetValue(symbol, out var indicators))
+                {
+                    return;
+                }
+
+                indicators.Remove(indicator);
+                if (indicators.Count == 0)
+                {
+                    _algorithm.SubscriptionManager.RemoveConsolidator(symbol, _consolidators[symbol]);
+                    _consolidators.Remove(symbol);
+                    _indicators.Remove(symbol);
+                }
+            }
+        }
+
         private class PairData : IDisposable
         {
             private enum State
@@ -165,8 +238,7 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             private readonly Symbol _asset1;
             private readonly Symbol _asset2;
 
-            private readonly IDataConsolidator _identityConsolidator1;
-            private readonly IDataConsolidator _identityConsolidator2;
+            private readonly PricePool _pricePool;
 
             private readonly IndicatorBase<IndicatorDataPoint> _asset1Price;
             private readonly IndicatorBase<IndicatorDataPoint> _asset2Price;
@@ -184,16 +256,17 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             /// <param name="asset2">The second asset's symbol in the pair</param>
             /// <param name="period">Period over which this insight is expected to come to fruition</param>
             /// <param name="threshold">The percent [0, 100] deviation of the ratio from the mean before emitting an insight</param>
-            public PairData(QCAlgorithm algorithm, Symbol asset1, Symbol asset2, TimeSpan period, decimal threshold)
+            /// <param name="pricePool">The pool of consolidators shared with other pairs</param>
+            public PairData(QCAlgorithm algorithm, Symbol asset1, Symbol asset2, TimeSpan period, decimal threshold, PricePool pricePool)
             {
                 _algorithm = algorithm;
                 _asset1 = asset1;
                 _asset2 = asset2;
+                _pricePool = pricePool;
 
-                // Created the Identity indicator for a given Symbol and
-                // the consolidator it is registered to. The consolidator reference 
-                // will be used to remove it from SubscriptionManager
-                (Identity, IDataConsolidator) CreateIdentityIndicator(Symbol symbol)
+                // Created the Identity indicator for a given Symbol. It is updated by
+                // the consolidator of the symbol shared in the price pool
+                Identity CreateIdentityIndicator(Symbol symbol)
                 {
                     var resolution = algorithm.SubscriptionManager
                         .SubscriptionDataConfigService
@@ -202,15 +275,13 @@ namespace QuantConnect.Algorithm.Framework.Alphas
 
                     var name = algorithm.CreateIndicatorName(symbol, "close", resolution);
                     var identity = new Identity(name);
+                    _pricePool.Add(symbol, identity);
 
-                    var consolidator = algorithm.ResolveConsolidator(symbol, resolution);
-                    algorithm.RegisterIndicator(symbol, identity, consolidator);
-
-                    return (identity, consolidator);
+                    return identity;
                 }
 
-                (_asset1Price, _identityConsolidator1) = CreateIdentityIndicator(asset1);
-                (_asset2Price, _identityConsolidator2) = CreateIdentityIndicator(asset2);
+                _asset1Price = CreateIdentityIndicator(asset1);
+                _asset2Price = CreateIdentityIndicator(asset2);
 
                 _ratio = _asset1Price.Over(_asset2Price);
                 _mean = new ExponentialMovingAverage(500).Of(_ratio);
@@ -225,12 +296,13 @@ namespace QuantConnect.Algorithm.Framework.Alphas
             }
 
             /// <summary>
-            /// On disposal, remove the consolidators from the subscription manager
+            /// On disposal, remove the price indicators from the pool so it can remove
+            /// the consolidators from the subscription manager once no other pair uses them
             /// </summary>
             public void Dispose()
             {
-                _algorithm.SubscriptionManager.RemoveConsolidator(_asset1, _identityConsolidator1);
-                _algorithm.SubscriptionManager.RemoveConsolidator(_asset2, _identityConsolidator2);
+                _pricePool.Remove(_asset1, _asset1Price);
+                _pricePool.Remove(_asset2, _asset2Price);
             }
 
             /// <summary>
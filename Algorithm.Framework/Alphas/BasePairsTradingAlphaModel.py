@@ -34,6 +34,7 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
         self.pairs = dict()
         self.Securities = list()
+        self.pricePool = None
 
         resolutionString = Extensions.GetEnumString(resolution, Resolution)
         self.Name = f'{self.__class__.__name__}({self.lookback},{resolutionString},{Extensions.NormalizeToStr(threshold)})'
@@ -76,6 +77,9 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
     def UpdatePairs(self, algorithm):
 
+        if self.pricePool is None:
+            self.pricePool = self.PricePool(algorithm)
+
         symbols = sorted([x.Symbol for x in self.Securities], key=lambda x: str(x.ID))
 
         for i in range(0, len(symbols)):
@@ -93,7 +97,7 @@ class BasePairsTradingAlphaModel(AlphaModel):
                 if not self.HasPassedTest(algorithm, asset_i, asset_j):
                     continue
 
-                pair = self.Pair(algorithm, asset_i, asset_j, self.predictionInterval, self.threshold)
+                pair = self.Pair(algorithm, asset_i, asset_j, self.predictionInterval, self.threshold, self.pricePool)
                 self.pairs[pair_symbol] = pair
 
     def HasPassedTest(self, algorithm, asset1, asset2):
@@ -106,6 +110,48 @@ class BasePairsTradingAlphaModel(AlphaModel):
             True if the statistical test for the pair is successful'''
         return True
 
+    class PricePool:
+        '''Shares a single consolidator per symbol between all the pairs the symbol belongs to.
+        The consolidated prices are pushed to the price indicators of every pair and the consolidator
+        is removed from the subscription manager when the last of them is removed'''
+
+        def __init__(self, algorithm):
+            self.algorithm = algorithm
+            self.consolidators = dict()
+            self.indicators = dict()
+
+        def Add(self, symbol, indicator):
+            '''Adds a price indicator for the symbol, creating the consolidator on first use
+            Args:
+                symbol: The symbol whose prices update the indicator
+                indicator: The indicator updated with the consolidated prices'''
+            if symbol not in self.consolidators:
+                resolution = min([x.Resolution for x in self.algorithm.SubscriptionManager.SubscriptionDataConfigService.GetSubscriptionDataConfigs(symbol)])
+                consolidator = self.algorithm.ResolveConsolidator(symbol, resolution)
+
+                def OnDataConsolidated(sender, consolidated):
+                    for x in self.indicators.get(symbol, []):
+                        x.Update(consolidated.EndTime, consolidated.Value)
+
+                consolidator.DataConsolidated += OnDataConsolidated
+                self.algorithm.SubscriptionManager.AddConsolidator(symbol, consolidator)
+                self.consolidators[symbol] = consolidator
+                self.indicators[symbol] = []
+
+            self.indicators[symbol].append(indicator)
+
+        def Remove(self, symbol, indicator):
+            '''Removes a price indicator of the symbol, removing the consolidator once it is no longer used
+            Args:
+                symbol: The symbol whose prices update the indicator
+                indicator: The indicator to remove'''
+            indicators = self.indicators.get(symbol, [])
+            if indicator in indicators:
+                indicators.remove(indicator)
+            if not indicators and symbol in self.consolidators:
+                self.algorithm.SubscriptionManager.RemoveConsolidator(symbol, self.consolidators.pop(symbol))
+                self.indicators.pop(symbol)
+
     class Pair:
 
         class State(Enum):
@@ -113,36 +159,36 @@ class BasePairsTradingAlphaModel(AlphaModel):
             FlatRatio = 0
             LongRatio = 1
 
-        def __init__(self, algorithm, asset1, asset2, predictionInterval, threshold):
+        def __init__(self, algorithm, asset1, asset2, predictionInterval, threshold, pricePool = None):
             '''Create a new pair
             Args:
                 algorithm: The algorithm instance that experienced the change in securities
                 asset1: The first asset's symbol in the pair
                 asset2: The second asset's symbol in the pair
                 predictionInterval: Period over which this insight is expected to come to fruition
-                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight'''
+                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
+                pricePool: The pool of consolidators shared with other pairs. If None, the pair uses its own'''
             self.state = self.State.FlatRatio
 
             self.algorithm = algorithm
             self.asset1 = asset1
             self.asset2 = asset2
 
-            # Created the Identity indicator for a given Symbol and
-            # the consolidator it is registered to. The consolidator reference 
-            # will be used to remove it from SubscriptionManager
+            self.pricePool = pricePool if pricePool is not None else BasePairsTradingAlphaModel.PricePool(algorithm)
+
+            # Created the Identity indicator for a given Symbol. It is updated by
+            # the consolidator of the symbol shared in the price pool
             def CreateIdentityIndicator(symbol: Symbol):
                 resolution = min([x.Resolution for x in algorithm.SubscriptionManager.SubscriptionDataConfigService.GetSubscriptionDataConfigs(symbol)])
 
                 name = algorithm.CreateIndicatorName(symbol, "close", resolution)
                 identity = Identity(name)
+                self.pricePool.Add(symbol, identity)
 
-                consolidator = algorithm.ResolveConsolidator(symbol, resolution)
-                algorithm.RegisterIndicator(symbol, identity, consolidator)
-
-                return identity, consolidator
+                return identity
 
-            self.asset1Price, self.identityConsolidator1 = CreateIdentityIndicator(asset1);
-            self.asset2Price, self.identityConsolidator2 = CreateIdentityIndicator(asset2);
+            self.asset1Price = CreateIdentityIndicator(asset1);
+            self.asset2Price = CreateIdentityIndicator(asset2);
 
             self.ratio = IndicatorExtensions.Over(self.asset1Price, self.asset2Price)
             self.mean = IndicatorExtensions.Of(ExponentialMovingAverage(500), self.ratio)
@@ -157,10 +203,11 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
         def dispose(self):
             '''
-            On disposal, remove the consolidators from the subscription manager
+            On disposal, remove the price indicators from the pool so it can remove
+            the consolidators from the subscription manager once no other pair uses them
             '''
-            self.algorithm.SubscriptionManager.RemoveConsolidator(self.asset1, self.identityConsolidator1)
-            self.algorithm.SubscriptionManager.RemoveConsolidator(self.asset2, self.identityConsolidator2)
+            self.pricePool.Remove(self.asset1, self.asset1Price)
+            self.pricePool.Remove(self.asset2, self.asset2Price)
 
         def GetInsightGroup(self):
             '''Gets the insights group for the pair
@@ -107,8 +107,7 @@ class SymbolData:
             algorithm.SubscriptionManager.RemoveConsolidator(self.Symbol, self.Consolidator)
 
     def WarmUpIndicators(self, history):
-        for tuple in history.itertuples():
-            self.ROC.Update(tuple.Index, tuple.close)
+        IndicatorExtensions.UpdateBatch(self.ROC, history.index, history.close)
 
     @property
     def Return(self):
@@ -13,7 +13,6 @@
 
 from AlgorithmImports import *
 from Alphas.BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
-from scipy.stats import pearsonr
 
 class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     ''' This alpha model is designed to rank every pair combination by its pearson correlation 
@@ -35,6 +34,9 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
         self.resolution = resolution
         self.minimumCorrelation = minimumCorrelation
         self.best_pair = ()
+        self.top_pairs = []
+        # Log prices of the current securities (rows: time, columns: symbol id) cached between universe changes
+        self.prices = pd.DataFrame()
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
@@ -49,25 +51,17 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
             if security in self.Securities:
                 self.Securities.remove(security)
 
-        symbols = [ x.Symbol for x in self.Securities ]
-        
-        history = algorithm.History(symbols, self.lookback, self.resolution).close.unstack(level=0)
+        symbols = { str(x.Symbol.ID): x.Symbol for x in self.Securities }
+        self.update_prices(algorithm, symbols)
 
-        if not history.empty:
+        if not self.prices.empty:
 
-            df = self.get_price_dataframe(history)
-            stop = len(df.columns)
+            df = self.get_price_dataframe(self.prices)
+            self.top_pairs = [(symbols[df.columns[i]], symbols[df.columns[j]], correlation)
+                for i, j, correlation in self.rank_pairs(df, 1)]
 
-            corr = dict()
-
-            for i in range(0, stop):
-                for j in range(i+1, stop):
-                    if (j, i) not in corr:
-                        corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
-
-            corr = sorted(corr.items(), key = lambda kv: kv[1])
-            if corr[-1][1] >= self.minimumCorrelation: 
-                self.best_pair = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+            if self.top_pairs and self.top_pairs[0][2] >= self.minimumCorrelation:
+                self.best_pair = self.top_pairs[0][:2]
 
         super().OnSecuritiesChanged(algorithm, changes)
 
@@ -81,11 +75,53 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
             True if the statistical test for the pair is successful'''
         return self.best_pair is not None and self.best_pair == (asset1, asset2)
 
-    def get_price_dataframe(self, df):
-        timezones = { x.Symbol.Value: x.Exchange.TimeZone for x in self.Securities }
+    def update_prices(self, algorithm, symbols):
+        '''Updates the cached log prices: drops the removed securities, requests the full lookback
+        only for the added ones and the bars since the last update for the ones we already have
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            symbols: Dictionary of the current symbols keyed by symbol id'''
+        prices = self.prices.drop(columns = [x for x in self.prices.columns if x not in symbols])
+        existing = [symbols[x] for x in prices.columns]
+        added = [x for key, x in symbols.items() if key not in prices.columns]
+
+        history = []
+        if existing and not prices.empty:
+            history.append(algorithm.History(existing, prices.index[-1], algorithm.Time, self.resolution))
+        if added:
+            history.append(algorithm.History(added, self.lookback, self.resolution))
+
+        for df in history:
+            if not df.empty:
+                # The new bars replace the cached ones at the same time
+                prices = np.log(df.close.unstack(level=0)).combine_first(prices)
+
+        self.prices = prices.sort_index().sort_index(axis = 1).tail(self.lookback)
+
+    def rank_pairs(self, df, count):
+        '''Ranks the pairs of columns by their pearson correlation in a single correlation matrix
+        Args:
+            df: Data frame of log returns where each column is a security
+            count: The number of pairs to return
+        Returns:
+            List of the top pairs as (i, j, correlation) tuples sorted by descending correlation, where i < j are column indices'''
+        size = len(df.columns)
+        if size < 2 or len(df) < 2:
+            return []
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            correlation = np.corrcoef(df.values, rowvar = False)
+
+        rows, columns = np.triu_indices(size, k = 1)
+        values = np.nan_to_num(correlation[rows, columns], nan = -np.inf)
 
-        # Use log prices
-        df = np.log(df)
+        count = min(count, values.size)
+        top = np.argpartition(values, -count)[-count:]
+        top = top[np.argsort(-values[top], kind = 'stable')]
+        return [(rows[k], columns[k], values[k]) for k in top if np.isfinite(values[k])]
+
+    def get_price_dataframe(self, df):
+        timezones = { str(x.Symbol.ID): x.Exchange.TimeZone for x in self.Securities }
 
         is_single_timeZone = len(set(timezones.values())) == 1
 
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Execution.UnorderedQuantityCache import UnorderedQuantityCache
 
 class SpreadExecutionModel(ExecutionModel):
     '''Execution model that submits orders while the current spread is tight.
@@ -21,6 +22,7 @@ class SpreadExecutionModel(ExecutionModel):
     def __init__(self, acceptingSpreadPercent=0.005):
         '''Initializes a new instance of the SpreadExecutionModel class'''
         self.targetsCollection = PortfolioTargetCollection()
+        self.unorderedQuantities = UnorderedQuantityCache()
         
         # Gets or sets the maximum spread compare to current price in percentage.
         self.acceptingSpreadPercent = Math.Abs(acceptingSpreadPercent)
@@ -36,18 +38,16 @@ class SpreadExecutionModel(ExecutionModel):
 
         # for performance we check count value, OrderByMarginImpact and ClearFulfilled are expensive to call
         if not self.targetsCollection.IsEmpty:
-            for target in self.targetsCollection.OrderByMarginImpact(algorithm):
+            # only the targets whose unordered quantity or price changed since they were last evaluated
+            for target, unorderedQuantity in self.unorderedQuantities.GetTargets(algorithm, self.targetsCollection, targets):
                 symbol = target.Symbol
                 
-                # calculate remaining quantity to be ordered
-                unorderedQuantity = OrderSizing.GetUnorderedQuantity(algorithm, target)
-                
                 # check order entry conditions
                 if unorderedQuantity != 0:
                     # get security information
                     security = algorithm.Securities[symbol]
                     if self.SpreadIsFavorable(security):
-                        algorithm.MarketOrder(symbol, unorderedQuantity)
+                        self.unorderedQuantities.MarketOrder(algorithm, symbol, unorderedQuantity)
 
             self.targetsCollection.ClearFulfilled(algorithm)
             
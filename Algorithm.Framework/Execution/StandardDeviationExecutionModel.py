@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Execution.UnorderedQuantityCache import UnorderedQuantityCache
 
 class StandardDeviationExecutionModel(ExecutionModel):
     '''Execution model that submits orders while the current market prices is at least the configured number of standard
@@ -30,6 +31,7 @@ class StandardDeviationExecutionModel(ExecutionModel):
         self.deviations = deviations
         self.resolution = resolution
         self.targetsCollection = PortfolioTargetCollection()
+        self.unorderedQuantities = UnorderedQuantityCache()
         self.symbolData = {}
 
         # Gets or sets the maximum order value in units of the account currency.
@@ -48,15 +50,13 @@ class StandardDeviationExecutionModel(ExecutionModel):
 
         # for performance we check count value, OrderByMarginImpact and ClearFulfilled are expensive to call
         if not self.targetsCollection.IsEmpty:
-            for target in self.targetsCollection.OrderByMarginImpact(algorithm):
+            # only the targets whose unordered quantity or price changed since they were last evaluated
+            for target, unorderedQuantity in self.unorderedQuantities.GetTargets(algorithm, self.targetsCollection, targets):
                 symbol = target.Symbol
 
-                # calculate remaining quantity to be ordered
-                unorderedQuantity = OrderSizing.GetUnorderedQuantity(algorithm, target)
-
                 # fetch our symbol data containing our STD/SMA indicators
                 data = self.symbolData.get(symbol, None)
-                if data is None: return
+                if data is None: continue
 
                 # check order entry conditions
                 if data.STD.IsReady and self.PriceIsFavorable(data, unorderedQuantity):
@@ -64,7 +64,7 @@ class StandardDeviationExecutionModel(ExecutionModel):
                     orderSize = OrderSizing.GetOrderSizeForMaximumValue(data.Security, self.MaximumOrderValue, unorderedQuantity)
 
                     if orderSize != 0:
-                        algorithm.MarketOrder(symbol, orderSize)
+                        self.unorderedQuantities.MarketOrder(algorithm, symbol, orderSize)
 
             self.targetsCollection.ClearFulfilled(algorithm)
 
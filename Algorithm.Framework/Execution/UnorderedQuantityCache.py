@@ -0,0 +1,88 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Risk.HoldingsChangeTracker import HoldingsChangeTracker
+
+### <summary>
+### Unordered quantities of the portfolio targets of an execution model, cached between slices.
+### A quantity is only cached while its symbol has no open orders, so it stays valid until the target or the holdings
+### of the symbol change, or a new order is submitted. The targets whose quantity is cached and whose symbol has no data
+### in the current slice were already evaluated with the same inputs, so they are skipped.
+### </summary>
+class UnorderedQuantityCache:
+    '''Unordered quantities of the portfolio targets of an execution model, cached between slices'''
+    def __init__(self):
+        self.quantities = {}
+        # the symbols whose order entry conditions were evaluated with their cached quantity
+        self.evaluatedSymbols = set()
+        self.lastOrderId = None
+        self.holdingsChanges = HoldingsChangeTracker(lambda security: self.Invalidate(security.Symbol))
+
+    def GetTargets(self, algorithm, targetsCollection, targets):
+        '''Gets the targets to evaluate, ordered by margin impact, with their unordered quantity
+        Args:
+            algorithm: The algorithm instance
+            targetsCollection: The portfolio targets of the execution model
+            targets: The new portfolio targets, added to the collection in this call
+        Returns:
+            Generator of the (target, unorderedQuantity) tuples'''
+        self.holdingsChanges.TrackAlgorithm(algorithm)
+
+        lastOrderId = algorithm.Transactions.LastOrderId
+        if self.lastOrderId != lastOrderId:
+            # the open orders of any symbol may have changed
+            self.quantities.clear()
+            self.evaluatedSymbols.clear()
+            self.lastOrderId = lastOrderId
+
+        for target in targets:
+            self.Invalidate(target.Symbol)
+
+        currentSlice = algorithm.CurrentSlice
+        targetsToEvaluate = PortfolioTargetCollection()
+        for target in targetsCollection:
+            symbol = target.Symbol
+            if symbol in self.evaluatedSymbols and currentSlice is not None and not currentSlice.ContainsKey(symbol):
+                continue
+            targetsToEvaluate.Add(target)
+
+        for target in targetsToEvaluate.OrderByMarginImpact(algorithm):
+            symbol = target.Symbol
+            unorderedQuantity = self.quantities.get(symbol)
+            if unorderedQuantity is None:
+                unorderedQuantity = self.GetUnorderedQuantity(algorithm, target)
+            if symbol in self.quantities:
+                self.evaluatedSymbols.add(symbol)
+            yield target, unorderedQuantity
+
+    def GetUnorderedQuantity(self, algorithm, target):
+        '''Calculates the remaining quantity to be ordered, and caches it if the symbol has no open orders'''
+        unorderedQuantity = OrderSizing.GetUnorderedQuantity(algorithm, target)
+        if not list(algorithm.Transactions.GetOpenOrderTickets(target.Symbol)):
+            self.quantities[target.Symbol] = unorderedQuantity
+        return unorderedQuantity
+
+    def MarketOrder(self, algorithm, symbol, quantity):
+        '''Submits a market order and invalidates the cached quantity of its symbol only'''
+        lastOrderId = algorithm.Transactions.LastOrderId
+        algorithm.MarketOrder(symbol, quantity)
+        self.Invalidate(symbol)
+        # if other orders were submitted meanwhile, e.g. from the order events, every quantity is invalidated on the next call
+        if self.lastOrderId == lastOrderId and algorithm.Transactions.LastOrderId == lastOrderId + 1:
+            self.lastOrderId = lastOrderId + 1
+
+    def Invalidate(self, symbol):
+        '''Removes the cached quantity of the symbol'''
+        self.quantities.pop(symbol, None)
+        self.evaluatedSymbols.discard(symbol)
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Execution.UnorderedQuantityCache import UnorderedQuantityCache
 
 class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
     '''Execution model that submits orders while the current market price is more favorable that the current volume weighted average price.'''
@@ -19,6 +20,7 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
     def __init__(self):
         '''Initializes a new instance of the VolumeWeightedAveragePriceExecutionModel class'''
         self.targetsCollection = PortfolioTargetCollection()
+        self.unorderedQuantities = UnorderedQuantityCache()
         self.symbolData = {}
 
         # Gets or sets the maximum order quantity as a percentage of the current bar's volume.
@@ -39,15 +41,13 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
 
         # for performance we check count value, OrderByMarginImpact and ClearFulfilled are expensive to call
         if not self.targetsCollection.IsEmpty:
-            for target in self.targetsCollection.OrderByMarginImpact(algorithm):
+            # only the targets whose unordered quantity or price changed since they were last evaluated
+            for target, unorderedQuantity in self.unorderedQuantities.GetTargets(algorithm, self.targetsCollection, targets):
                 symbol = target.Symbol
 
-                # calculate remaining quantity to be ordered
-                unorderedQuantity = OrderSizing.GetUnorderedQuantity(algorithm, target)
-
                 # fetch our symbol data containing our VWAP indicator
                 data = self.symbolData.get(symbol, None)
-                if data is None: return
+                if data is None: continue
 
                 # check order entry conditions
                 if self.PriceIsFavorable(data, unorderedQuantity):
@@ -55,7 +55,7 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
                     orderSize = OrderSizing.GetOrderSizeForPercentVolume(data.Security, self.MaximumOrderQuantityPercentVolume, unorderedQuantity)
 
                     if orderSize != 0:
-                        algorithm.MarketOrder(symbol, orderSize)
+                        self.unorderedQuantities.MarketOrder(algorithm, symbol, orderSize)
 
             self.targetsCollection.ClearFulfilled(algorithm)
 
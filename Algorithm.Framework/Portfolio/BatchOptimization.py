@@ -0,0 +1,104 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+### <summary>
+### Helper methods shared by the portfolio optimizers to solve a stack of dates in a single call.
+### A batch of historical returns is an array of size T x K x N: T dates, K returns per date and N securities.
+### </summary>
+
+def get_batch_statistics(historicalReturns, expectedReturns = None, covariance = None):
+    '''Computes the expected returns and the covariance of every date of the batch in a vectorized way
+    Args:
+        historicalReturns: Array of historical returns (size: T x K x N)
+        expectedReturns: Array of expected returns (size: T x N). If None, the mean of the historical returns is used
+        covariance: Array of covariance matrices (size: T x N x N). If None, the covariance of the historical returns is used
+    Returns:
+        Tuple of the expected returns (size: T x N) and the covariance (size: T x N x N)'''
+    historicalReturns = np.asarray(historicalReturns, dtype = float)
+    if historicalReturns.ndim != 3:
+        raise ValueError(f'get_batch_statistics: historical returns must be a T x K x N array. Shape: {historicalReturns.shape}')
+
+    mean = historicalReturns.mean(axis = 1)
+    if expectedReturns is None:
+        expectedReturns = mean
+    if covariance is None:
+        centered = historicalReturns - mean[:, np.newaxis, :]
+        covariance = np.einsum('tki,tkj->tij', centered, centered) / (historicalReturns.shape[1] - 1)
+
+    return np.asarray(expectedReturns, dtype = float), np.asarray(covariance, dtype = float)
+
+def solve_closed_form(covariance, constraints, targets, minimum_weight, maximum_weight):
+    '''Solves the KKT system of the minimization of the portfolio variance under linear equality constraints
+    for every date of the batch: w = Σ^-1 A^T (A Σ^-1 A^T)^-1 b
+    Args:
+        covariance: Covariance matrices (size: T x N x N)
+        constraints: Matrices A of the equality constraints A w = b (size: T x M x N)
+        targets: Vectors b of the equality constraints (size: T x M)
+        minimum_weight: The lower bound of the weights
+        maximum_weight: The upper bound of the weights
+    Returns:
+        The portfolio weights (size: T x N). The rows are NaN where the covariance is not positive definite or the bounds are binding'''
+    try:
+        # The Cholesky factorization fails unless every covariance matrix is positive definite
+        np.linalg.cholesky(covariance)
+        solution = np.linalg.solve(covariance, np.swapaxes(constraints, 1, 2))
+        multipliers = np.linalg.solve(constraints @ solution, targets[..., np.newaxis])
+        weights = (solution @ multipliers)[..., 0]
+    except np.linalg.LinAlgError:
+        if len(covariance) == 1:
+            return np.full(targets.shape[:1] + covariance.shape[-1:], np.nan)
+        # Find the dates that have a solution one by one
+        return np.vstack([solve_closed_form(*x, minimum_weight, maximum_weight) for x in
+            zip(covariance[:, np.newaxis], constraints[:, np.newaxis], targets[:, np.newaxis])])
+
+    invalid = ~np.isfinite(weights).all(axis = 1) \
+        | (weights < minimum_weight).any(axis = 1) | (weights > maximum_weight).any(axis = 1)
+    weights[invalid] = np.nan
+    return weights
+
+def map_batch(function, arguments, max_workers = None):
+    '''Applies a function to every item of the arguments, optionally in a process pool
+    Args:
+        function: The function to apply. It must be picklable to be used in a process pool
+        arguments: List of tuples of arguments, one per date
+        max_workers: Number of processes of the pool. If None, or if there is no python executable to start
+            the processes, the dates are solved in the current process
+    Returns:
+        List with the results of the function in the order of the arguments'''
+    executable = get_python_executable()
+    if max_workers is None or len(arguments) < 2 or executable is None:
+        return [function(*args) for args in arguments]
+
+    # The algorithm runs inside an embedded interpreter: forking it is unsafe and sys.executable is not
+    # python, so the workers are spawned from the python executable of the same installation
+    context = multiprocessing.get_context('spawn')
+    context.set_executable(executable)
+    with ProcessPoolExecutor(max_workers = max_workers, mp_context = context) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+def get_python_executable():
+    '''Gets the python executable that can start the workers of the process pool, None if there is none'''
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    name = 'python.exe' if os.name == 'nt' else f'python{sys.version_info.major}.{sys.version_info.minor}'
+    for folder in [sys.base_exec_prefix, os.path.join(sys.base_exec_prefix, 'bin')]:
+        executable = os.path.join(folder, name)
+        if os.path.isfile(executable):
+            return executable
+    return None
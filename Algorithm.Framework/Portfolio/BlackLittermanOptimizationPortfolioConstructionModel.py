@@ -13,9 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
-from itertools import groupby
 from numpy import dot, transpose
-from numpy.linalg import inv
+from scipy.linalg import cho_factor, cho_solve
 
 ### <summary>
 ### Provides an implementation of Black-Litterman portfolio optimization. The model adjusts equilibrium market
@@ -67,6 +66,10 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbolDataBySymbol = {}
 
+        # Equilibrium returns and covariance of the last rebalance, keyed by the returns they were computed with
+        self.equilibrium_key = None
+        self.equilibrium = None
+
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancingFunc
         rebalancingFunc = rebalance
@@ -87,6 +90,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         P, Q = self.get_views(lastActiveInsights)
         if P is not None:
             returns = dict()
+            symbolDataBySymbol = dict()
             # Updates the BlackLittermanSymbolData with insights
             # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
             for insight in lastActiveInsights:
@@ -97,11 +101,18 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
                     return targets
                 symbolData.Add(insight.GeneratedTimeUtc, insight.Magnitude)
                 returns[symbol] = symbolData.Return
+                symbolDataBySymbol[symbol] = symbolData
 
             returns = pd.DataFrame(returns)
 
-            # Calculate prior estimate of the mean and covariance
-            Pi, Sigma = self.get_equilibrium_return(returns)
+            # Calculate prior estimate of the mean and covariance.
+            # They are reused while the universe and the returns have not changed since the last rebalance
+            key = tuple((str(symbol), data.window.Samples, data.window[0].EndTime, data.window[0].Value)
+                for symbol, data in symbolDataBySymbol.items() if data.window.Count > 0)
+            if key != self.equilibrium_key:
+                self.equilibrium_key = key
+                self.equilibrium = self.get_equilibrium_return(returns)
+            Pi, Sigma = self.equilibrium
 
             # Calculate posterior estimate of the mean and covariance
             Pi, Sigma = self.apply_blacklitterman_master_formula(Pi, Sigma, P, Q)
@@ -110,14 +121,19 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             weights = self.optimizer.Optimize(returns, Pi, Sigma)
             weights = pd.Series(weights, index = Sigma.columns)
 
+            # The first insight of each symbol gets the target
+            insightBySymbol = {}
+            for insight in lastActiveInsights:
+                insightBySymbol.setdefault(str(insight.Symbol), insight)
+
             for symbol, weight in weights.items():
-                for insight in lastActiveInsights:
-                    if str(insight.Symbol) == str(symbol):
-                        # don't trust the optimizer
-                        if self.portfolioBias != PortfolioBias.LongShort and self.sign(weight) != self.portfolioBias:
-                            weight = 0
-                        targets[insight] = weight
-                        break
+                insight = insightBySymbol.get(str(symbol))
+                if insight is None:
+                    continue
+                # don't trust the optimizer
+                if self.portfolioBias != PortfolioBias.LongShort and self.sign(weight) != self.portfolioBias:
+                    weight = 0
+                targets[insight] = weight
 
         return targets
 
@@ -126,12 +142,14 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         activeInsights = filter(self.ShouldCreateTargetForInsight,
             self.Algorithm.Insights.GetActiveInsights(self.Algorithm.UtcTime))
 
-        # Get the last generated active insight for each symbol
-        lastActiveInsights = []
-        for sourceModel, f in groupby(sorted(activeInsights, key = lambda ff: ff.SourceModel), lambda fff: fff.SourceModel):
-            for symbol, g in groupby(sorted(list(f), key = lambda gg: gg.Symbol), lambda ggg: ggg.Symbol):
-                lastActiveInsights.append(sorted(g, key = lambda x: x.GeneratedTimeUtc)[-1])
-        return lastActiveInsights
+        # Get the last generated active insight for each source model and symbol
+        lastActiveInsights = {}
+        for insight in activeInsights:
+            key = (insight.SourceModel, insight.Symbol)
+            last = lastActiveInsights.get(key)
+            if last is None or insight.GeneratedTimeUtc >= last.GeneratedTimeUtc:
+                lastActiveInsights[key] = insight
+        return [lastActiveInsights[key] for key in sorted(lastActiveInsights)]
 
     def OnSecuritiesChanged(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
@@ -178,20 +196,26 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             P: A matrix that identifies the assets involved in the views (size: K x N)
             Q: A view vector (size: K x 1)'''
         ts = self.tau * Sigma
+        pts = np.dot(P, ts)
+        ptsp = np.dot(pts, P.T)
 
         # Create the diagonal Sigma matrix of error terms from the expressed views
-        omega = np.dot(np.dot(P, ts), P.T) * np.eye(Q.shape[0])
-        if np.linalg.det(omega) == 0:
+        omega = np.diag(np.diag(ptsp))
+        if np.any(np.diag(omega) == 0):
             return Pi, Sigma
 
-        A = np.dot(np.dot(ts, P.T), inv(np.dot(np.dot(P, ts), P.T) + omega))
+        # A = ts.P^T.(P.ts.P^T + omega)^-1, solved with the Cholesky factorization of the symmetric positive definite matrix
+        try:
+            A = cho_solve(cho_factor(ptsp + omega), pts).T
+        except np.linalg.LinAlgError:
+            return Pi, Sigma
 
         Pi = np.squeeze(np.asarray((
             np.expand_dims(Pi, axis=0).T +
             np.dot(A, (Q - np.expand_dims(np.dot(P, Pi.T), axis=1))))
             ))
 
-        M = ts - np.dot(np.dot(A, P), ts)
+        M = ts - np.dot(A, pts)
         Sigma = (Sigma + M) * self.delta
 
         return Pi, Sigma
@@ -227,46 +251,38 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         Returns
             P: A matrix that identifies the assets involved in the views (size: K x N)
             Q: A view vector (size: K x 1)'''
-        try:
-            P = {}
-            Q = {}
-            symbols = set(insight.Symbol for insight in insights)
-            
-            for model, group in groupby(insights, lambda x: x.SourceModel):
-                group = list(group)
-
-                up_insights_sum = 0.0
-                dn_insights_sum = 0.0
-                for insight in group:
-                    if insight.Direction == InsightDirection.Up:
-                        up_insights_sum = up_insights_sum + np.abs(insight.Magnitude)
-                    if insight.Direction == InsightDirection.Down:
-                        dn_insights_sum = dn_insights_sum + np.abs(insight.Magnitude)
-
-                q = up_insights_sum if up_insights_sum > dn_insights_sum else dn_insights_sum
-                if q == 0:
-                    continue
-
-                Q[model] = q
-
-                # generate the link matrix of views: P
-                P[model] = dict()
-                for insight in group:
-                    value = insight.Direction * np.abs(insight.Magnitude)
-                    P[model][insight.Symbol] = value / q
-                # Add zero for other symbols that are listed but active insight
-                for symbol in symbols:
-                    if symbol not in P[model]:
-                        P[model][symbol] = 0
-
-            Q = np.array([[x] for x in Q.values()])
-            if len(Q) > 0:
-                P = np.array([list(x.values()) for x in P.values()])
-                return P, Q
-        except:
-            pass
-
-        return None, None
+        insights = list(insights)
+        if len(insights) == 0 or any(insight.Magnitude is None for insight in insights):
+            return None, None
+
+        # Column of each symbol and row of each source model, in order of appearance
+        columnBySymbol = {}
+        rowByModel = {}
+        for insight in insights:
+            columnBySymbol.setdefault(insight.Symbol, len(columnBySymbol))
+            rowByModel.setdefault(insight.SourceModel, len(rowByModel))
+
+        rows = np.array([rowByModel[insight.SourceModel] for insight in insights])
+        columns = np.array([columnBySymbol[insight.Symbol] for insight in insights])
+        directions = np.array([insight.Direction for insight in insights], dtype = float)
+        magnitudes = np.abs(np.array([insight.Magnitude for insight in insights], dtype = float))
+
+        # The view of each source model is the largest of the sum of the up and the sum of the down magnitudes
+        up = np.bincount(rows, weights = magnitudes * (directions == InsightDirection.Up), minlength = len(rowByModel))
+        down = np.bincount(rows, weights = magnitudes * (directions == InsightDirection.Down), minlength = len(rowByModel))
+        Q = np.where(up > down, up, down)
+
+        # Generate the link matrix of views: P. Symbols without an insight of the source model are zero
+        P = np.zeros((len(rowByModel), len(columnBySymbol)))
+        P[rows, columns] = directions * magnitudes
+
+        views = Q != 0
+        if not np.any(views):
+            return None, None
+
+        Q = Q[views]
+        P = P[views] / Q[:, np.newaxis]
+        return P, Q[:, np.newaxis]
 
 
     class BlackLittermanSymbolData:
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Portfolio.BatchOptimization import get_batch_statistics, map_batch, solve_closed_form
 from scipy.optimize import minimize
 
 ### <summary>
@@ -26,15 +27,18 @@ class MaximumSharpeRatioPortfolioOptimizer:
     def __init__(self, 
                  minimum_weight = -1, 
                  maximum_weight = 1,
-                 risk_free_rate = 0):
+                 risk_free_rate = 0,
+                 analytic = False):
         '''Initialize the MaximumSharpeRatioPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            risk_free_rate(float): The risk free rate'''
+            risk_free_rate(float): The risk free rate
+            analytic(bool): True to solve in closed form when the bounds are not binding and to provide SLSQP with analytic gradients otherwise'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.risk_free_rate = risk_free_rate
+        self.analytic = analytic
         self.expected_returns = []
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
@@ -51,9 +55,50 @@ class MaximumSharpeRatioPortfolioOptimizer:
             covariance = historicalReturns.cov()
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
+
+        return self.optimize_batch(np.asarray(expectedReturns, dtype = float)[np.newaxis],
+                                   np.asarray(covariance, dtype = float)[np.newaxis])[0]
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None, max_workers = None):
+        '''
+        Perform portfolio optimization for a stack of matrices of historical returns, one per date
+        args:
+            historicalReturns: Array of historical returns where the first dimension is the date (size: T x K x N).
+            expectedReturns: Array of double with the expected returns of every date (size: T x N).
+            covariance: Array of double with the covariance of every date (size: T x N x N).
+            max_workers: Number of processes used to solve the dates that need SLSQP. If None, they are solved in the current process.
+        Returns:
+            Array of double with the portfolio weights of every date (size: T x N)
+        '''
+        expectedReturns, covariance = get_batch_statistics(historicalReturns, expectedReturns, covariance)
+        return self.optimize_batch(expectedReturns, covariance, max_workers)
+
+    def optimize_batch(self, expectedReturns, covariance, max_workers = None):
+        '''Solves every date of the batch: in closed form when analytic and the bounds are not binding, with SLSQP otherwise'''
         expectedReturns = expectedReturns - self.risk_free_rate
+        dates, size = expectedReturns.shape
+        weights = np.full((dates, size), np.nan)
+
+        if self.analytic:
+            # (µ − r_f)^T w = k and Σw = 1
+            constraints = np.stack([expectedReturns, np.ones((dates, size))], axis = 1)
+            targets = np.stack([expectedReturns.mean(axis = 1), np.ones(dates)], axis = 1)
+            weights = solve_closed_form(covariance, constraints, targets, self.minimum_weight, self.maximum_weight)
+
+        pending = np.flatnonzero(np.isnan(weights).any(axis = 1))
+        arguments = [(expectedReturns[t], covariance[t]) for t in pending]
+        for t, solution in zip(pending, map_batch(self.solve, arguments, max_workers)):
+            weights[t] = solution
+        return weights
 
-        size = covariance.columns.size   # K x 1
+    def solve(self, expectedReturns, covariance):
+        '''Maximizes the Sharpe ratio of a single date with SLSQP
+        Args:
+            expectedReturns: Array of expected excess returns (size: N)
+            covariance: Covariance matrix (size: N x N)
+        Returns:
+            The portfolio weights, or equal weights if the optimization fails'''
+        size = expectedReturns.size
         x0 = np.array(size * [1. / size])
         k = expectedReturns.dot(x0)
 
@@ -67,12 +112,18 @@ class MaximumSharpeRatioPortfolioOptimizer:
         constraints.append(
             {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)})
 
+        jacobian = None
+        if self.analytic:
+            constraints[0]['jac'] = lambda weights: expectedReturns
+            constraints[1]['jac'] = lambda weights: np.ones(size)
+            jacobian = lambda weights: 2 * covariance @ weights
+
         opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),   # Objective function
                        x0,                                                        # Initial guess
+                       jac = jacobian,                                            # Gradient of the objective function
                        bounds = self.get_boundary_conditions(size),               # Bounds for variables: lw ≤ w ≤ up
                        constraints = constraints,                                 # Constraints definition
                        method='SLSQP')        # Optimization method:  Sequential Least SQuares Programming
-        sharpe_ratio = expectedReturns.dot(opt['x']) / opt.fun
 
         return opt['x'] if opt['success'] else x0
 
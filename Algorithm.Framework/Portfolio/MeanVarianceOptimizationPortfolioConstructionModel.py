@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.ReturnsMatrix import ReturnsMatrix
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -48,8 +49,10 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         lower = 0 if portfolioBias == PortfolioBias.Long else -1
         upper = 0 if portfolioBias == PortfolioBias.Short else 1
-        self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, targetReturn) if optimizer is None else optimizer
+        self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, targetReturn, warm_start = True) if optimizer is None else optimizer
 
+        # Returns of all the symbols are kept in a single matrix that updates the covariance incrementally
+        self.returns = ReturnsMatrix(period)
         self.symbolDataBySymbol = {}
 
         # If the argument is an instance of Resolution or Timedelta
@@ -88,12 +91,12 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
         symbols = [insight.Symbol for insight in activeInsights]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-        returns = { str(symbol.ID) : data.Return for symbol, data in self.symbolDataBySymbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # Select the columns of the returns matrix of the symbols in the insights
+        keys = [ str(symbol.ID) for symbol in self.symbolDataBySymbol if symbol in symbols ]
+        returns = self.returns.GetReturns(keys)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.Optimize(returns)
+        weights = self.optimizer.Optimize(returns, covariance = self.returns.Covariance(keys))
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -118,11 +121,12 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         for removed in changes.RemovedSecurities:
             symbolData = self.symbolDataBySymbol.pop(removed.Symbol, None)
             symbolData.Reset()
+            self.returns.RemoveColumn(str(removed.Symbol.ID))
 
         # initialize data for added securities
         symbols = [x.Symbol for x in changes.AddedSecurities]
         for symbol in [x for x in symbols if x not in self.symbolDataBySymbol]:
-            self.symbolDataBySymbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
+            self.symbolDataBySymbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period, self.returns)
 
         history = algorithm.History[TradeBar](symbols, self.lookback * self.period, self.resolution)
         for bars in history:
@@ -131,40 +135,39 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, returns = None):
             self.symbol = symbol
+            self.key = str(symbol.ID)
+            self.period = period
             self.roc = RateOfChange(f'{symbol}.ROC({lookback})', lookback)
             self.roc.Updated += self.OnRateOfChangeUpdated
-            self.window = RollingWindow[IndicatorDataPoint](period)
+            self.returns = ReturnsMatrix(period) if returns is None else returns
+            self.returns.AddColumn(self.key)
 
         def Reset(self):
             self.roc.Updated -= self.OnRateOfChangeUpdated
             self.roc.Reset()
-            self.window.Reset()
 
         def Update(self, time, value):
             return self.roc.Update(time, value)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
-                self.window.Add(value)
+                self.returns.Add(self.key, value.EndTime, value.Value)
 
         def Add(self, time, value):
-            item = IndicatorDataPoint(self.symbol, time, value)
-            self.window.Add(item)
+            self.returns.Add(self.key, time, value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010). 
         # GARP Risk Professional, pp. 49-51, April 2010 , Available at SSRN: https://ssrn.com/abstract=1586656
         @property
         def Return(self):
-            return pd.Series(
-                data = [x.Value for x in self.window],
-                index = [x.EndTime for x in self.window])
+            return self.returns.GetReturns([self.key])[self.key].dropna()
 
         @property
         def IsReady(self):
-            return self.window.IsReady
+            return self.returns.Count(self.key) >= self.period
 
         def __str__(self, **kwargs):
-            return '{}: {:.2%}'.format(self.roc.Name, self.window[0])
+            return '{}: {:.2%}'.format(self.roc.Name, self.Return.iloc[-1])
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Portfolio.BatchOptimization import get_batch_statistics, map_batch, solve_closed_form
 from scipy.optimize import minimize
 
 ### <summary>
@@ -25,15 +26,22 @@ class MinimumVariancePortfolioOptimizer:
     def __init__(self, 
                  minimum_weight = -1, 
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 warm_start = False,
+                 analytic = False):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            warm_start(bool): True to start the optimization from the previous solution instead of equal weights
+            analytic(bool): True to solve in closed form when the bounds are not binding and to provide SLSQP with analytic gradients otherwise'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.warm_start = warm_start
+        self.previous_weights = None
+        self.analytic = analytic
 
     def Optimize(self, historicalReturns, expectedReturns = None, covariance = None):
         '''
@@ -50,25 +58,80 @@ class MinimumVariancePortfolioOptimizer:
         if expectedReturns is None:
             expectedReturns = historicalReturns.mean()
 
-        size = historicalReturns.columns.size   # K x 1
+        columns = historicalReturns.columns
+        weights = self.optimize_batch(np.asarray(expectedReturns, dtype = float)[np.newaxis],
+                                      np.asarray(covariance, dtype = float)[np.newaxis],
+                                      self.get_initial_guess(columns))[0]
+
+        if self.warm_start:
+            self.previous_weights = pd.Series(weights, index = columns)
+
+        # Scale the solution to ensure that the sum of the absolute weights is 1
+        return weights / np.sum(np.abs(weights))
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None, max_workers = None):
+        '''
+        Perform portfolio optimization for a stack of matrices of historical returns, one per date
+        args:
+            historicalReturns: Array of historical returns where the first dimension is the date (size: T x K x N).
+            expectedReturns: Array of double with the expected returns of every date (size: T x N).
+            covariance: Array of double with the covariance of every date (size: T x N x N).
+            max_workers: Number of processes used to solve the dates that need SLSQP. If None, they are solved in the current process.
+        Returns:
+            Array of double with the portfolio weights of every date (size: T x N)
+        '''
+        expectedReturns, covariance = get_batch_statistics(historicalReturns, expectedReturns, covariance)
+        weights = self.optimize_batch(expectedReturns, covariance, max_workers = max_workers)
+
+        # Scale the solutions to ensure that the sum of the absolute weights is 1
+        return weights / np.sum(np.abs(weights), axis = 1, keepdims = True)
+
+    def optimize_batch(self, expectedReturns, covariance, initial_guess = None, max_workers = None):
+        '''Solves every date of the batch: in closed form when analytic and the bounds are not binding, with SLSQP otherwise'''
+        dates, size = expectedReturns.shape
+        weights = np.full((dates, size), np.nan)
+
+        if self.analytic:
+            # Σw = 1 and µ^T w = target return
+            constraints = np.stack([np.ones((dates, size)), expectedReturns], axis = 1)
+            targets = np.tile([1, self.target_return], (dates, 1))
+            weights = solve_closed_form(covariance, constraints, targets, self.minimum_weight, self.maximum_weight)
+
+        pending = np.flatnonzero(np.isnan(weights).any(axis = 1))
+        arguments = [(expectedReturns[t], covariance[t], initial_guess) for t in pending]
+        for t, solution in zip(pending, map_batch(self.solve, arguments, max_workers)):
+            weights[t] = solution
+        return weights
+
+    def solve(self, expectedReturns, covariance, initial_guess = None):
+        '''Minimizes the portfolio variance of a single date with SLSQP
+        Args:
+            expectedReturns: Array of expected returns (size: N)
+            covariance: Covariance matrix (size: N x N)
+            initial_guess: Initial guess of the optimization. If None, equal weights are used
+        Returns:
+            The portfolio weights, or equal weights if the optimization fails'''
+        size = expectedReturns.size
         x0 = np.array(size * [1. / size])
 
         constraints = [
             {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
             {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expectedReturns)}]
+        jacobian = None
+        if self.analytic:
+            constraints[0]['jac'] = lambda weights: np.ones(size)
+            constraints[1]['jac'] = lambda weights: expectedReturns
+            jacobian = lambda weights: 2 * covariance @ weights
 
         # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
         opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
+                       x0 if initial_guess is None else initial_guess,            # Initial guess
+                       jac = jacobian,                                            # Gradient of the objective function
                        bounds = self.get_boundary_conditions(size),               # Bounds for variables
                        constraints = constraints,                                 # Constraints definition
                        method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
 
-        if not opt['success']: return x0
-
-        # Scale the solution to ensure that the sum of the absolute weights is 1
-        sum_of_absolute_weights = np.sum(np.abs(opt['x']))
-        return opt['x'] / sum_of_absolute_weights
+        return opt['x'] if opt['success'] else x0
 
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
@@ -81,6 +144,14 @@ class MinimumVariancePortfolioOptimizer:
             raise ValueError(f'MinimumVariancePortfolioOptimizer.portfolio_variance: Volatility cannot be zero. Weights: {weights}')
         return variance
 
+    def get_initial_guess(self, columns):
+        '''Gets the initial guess of the optimization: the previous solution of the securities
+        that were already in the portfolio and equal weights for the new ones'''
+        if not self.warm_start or self.previous_weights is None:
+            return None
+        guess = self.previous_weights.reindex(columns).fillna(1. / columns.size).values
+        return np.clip(guess, self.minimum_weight, self.maximum_weight)
+
     def get_boundary_conditions(self, size):
         '''Creates the boundary condition for the portfolio weights'''
         return tuple((self.minimum_weight, self.maximum_weight) for x in range(size))
@@ -91,4 +162,4 @@ class MinimumVariancePortfolioOptimizer:
 
     def get_target_constraint(self, weights, expectedReturns):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expectedReturns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expectedReturns, weights) - self.target_return
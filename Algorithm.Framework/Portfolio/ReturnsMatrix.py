@@ -0,0 +1,195 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from collections import deque
+
+### <summary>
+### Rolling matrix of returns shared by all the symbols of a portfolio construction model.
+### Each column keeps the last `period` returns of its symbol, like a RollingWindow per symbol, and the rows are the
+### time stamps of those returns. The pairwise sums needed for the mean and the covariance are updated incrementally
+### on every new value, so the statistics are available in O(N^2) without rebuilding a pandas.DataFrame from every window.
+### </summary>
+class ReturnsMatrix:
+    '''Rolling matrix of returns shared by all the symbols of a portfolio construction model'''
+    def __init__(self, period):
+        '''Initialize the ReturnsMatrix
+        Args:
+            period(int): The number of returns kept for each column'''
+        self.period = period
+        self.columns = {}
+        # The times of the returns of each column, oldest first
+        self.timesByKey = {}
+        # The returns at each time, by column key
+        self.rows = {}
+        # Values evicted since the pairwise sums were last rebuilt
+        self.evictions = 0
+        # Pairwise sums over the times where both columns have a value:
+        # counts[i, j] = sum(m_i * m_j), sums[i, j] = sum(x_i * m_j), products[i, j] = sum(x_i * x_j)
+        self.counts = np.zeros((0, 0))
+        self.sums = np.zeros((0, 0))
+        self.products = np.zeros((0, 0))
+
+    @property
+    def Keys(self):
+        '''Gets the keys of the columns in the matrix'''
+        return list(self.columns.keys())
+
+    def AddColumn(self, key):
+        '''Adds a new empty column to the matrix
+        Args:
+            key: The key of the column, usually the symbol ID as string'''
+        if key in self.columns:
+            return
+        self.columns[key] = len(self.columns)
+        self.timesByKey[key] = deque()
+        self.counts = np.pad(self.counts, ((0, 1), (0, 1)))
+        self.sums = np.pad(self.sums, ((0, 1), (0, 1)))
+        self.products = np.pad(self.products, ((0, 1), (0, 1)))
+
+    def RemoveColumn(self, key):
+        '''Removes a column from the matrix. The pairwise sums of the remaining columns are not affected
+        Args:
+            key: The key of the column'''
+        column = self.columns.pop(key, None)
+        if column is None:
+            return
+        for time in self.timesByKey.pop(key):
+            self._remove_value(time, key)
+        self.columns = { k: (i if i < column else i - 1) for k, i in self.columns.items() }
+        self.counts = np.delete(np.delete(self.counts, column, axis = 0), column, axis = 1)
+        self.sums = np.delete(np.delete(self.sums, column, axis = 0), column, axis = 1)
+        self.products = np.delete(np.delete(self.products, column, axis = 0), column, axis = 1)
+
+    def Add(self, key, time, value):
+        '''Sets the value of a column at a given time. The oldest value of the column is evicted when it already
+        has `period` values, so the other columns are not affected by the missing or offset times of this one.
+        Args:
+            key: The key of the column
+            time: The time of the value
+            value: The return value'''
+        self.AddColumn(key)
+        column = self.columns[key]
+        row = self.rows.setdefault(time, {})
+
+        # Only the cross terms of the changed column are updated: O(N)
+        if key in row:
+            self._update_column(row, column, -1)
+            row[key] = value
+            self._update_column(row, column, 1)
+            return
+
+        times = self.timesByKey[key]
+        if len(times) == self.period:
+            self._remove_value(times.popleft(), key)
+            self.evictions += 1
+
+        times.append(time)
+        row[key] = value
+        self._update_column(row, column, 1)
+
+        # The pairwise sums are rebuilt once every `period` values per column to avoid accumulating rounding errors
+        if self.evictions >= self.period * len(self.columns):
+            self.evictions = 0
+            self._rebuild()
+
+    def Count(self, key):
+        '''Gets the number of values of a column in the window'''
+        times = self.timesByKey.get(key)
+        return 0 if times is None else len(times)
+
+    def Mean(self, keys):
+        '''Gets the mean of the selected columns
+        Args:
+            keys: The keys of the columns
+        Returns:
+            pandas.Series indexed by key'''
+        index = [self.columns[key] for key in keys]
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            mean = self.sums[index, index] / self.counts[index, index]
+        return pd.Series(mean, index = keys)
+
+    def Covariance(self, keys):
+        '''Gets the covariance of the selected columns using the pairwise complete observations, like pandas.DataFrame.cov
+        Args:
+            keys: The keys of the columns
+        Returns:
+            pandas.DataFrame indexed by key'''
+        index = np.ix_(*[[self.columns[key] for key in keys]] * 2)
+        counts = self.counts[index]
+        sums = self.sums[index]
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            covariance = (self.products[index] - sums * sums.T / counts) / (counts - 1)
+        covariance[counts < 2] = np.nan
+        return pd.DataFrame(covariance, index = keys, columns = keys)
+
+    def GetReturns(self, keys):
+        '''Gets the returns of the selected columns in time order
+        Args:
+            keys: The keys of the columns
+        Returns:
+            pandas.DataFrame where each column represents a security and each row the returns for the given time'''
+        times = sorted(set().union(*[self.timesByKey[key] for key in keys]))
+        values = [[self.rows[time].get(key, np.nan) for key in keys] for time in times]
+        return pd.DataFrame(values, index = times, columns = keys, dtype = float)
+
+    def Reset(self):
+        '''Resets the matrix to its initial state'''
+        self.__init__(self.period)
+
+    def _remove_value(self, time, key):
+        '''Removes the value of a column at a time from the pairwise sums and from its row'''
+        row = self.rows[time]
+        self._update_column(row, self.columns.get(key), -1)
+        del row[key]
+        if not row:
+            del self.rows[time]
+
+    def _vectors(self, row):
+        '''Gets the values and the mask of a row as vectors indexed by column'''
+        x = np.zeros(len(self.columns))
+        m = np.zeros(len(self.columns))
+        for key, value in row.items():
+            column = self.columns.get(key)
+            if column is not None:
+                x[column] = value
+                m[column] = 1
+        return x, m
+
+    def _update_column(self, row, column, sign):
+        '''Adds (sign = 1) or removes (sign = -1) the terms of a single value of a row from the pairwise sums: O(N)'''
+        if column is None:
+            return
+        x, m = self._vectors(row)
+        xc, mc = x[column], m[column]
+        if mc == 0:
+            return
+        self.counts[column, :] += sign * mc * m
+        self.counts[:, column] += sign * mc * m
+        self.counts[column, column] -= sign * mc * mc
+        self.sums[column, :] += sign * xc * m
+        self.sums[:, column] += sign * x * mc
+        self.sums[column, column] -= sign * xc * mc
+        self.products[column, :] += sign * xc * x
+        self.products[:, column] += sign * xc * x
+        self.products[column, column] -= sign * xc * xc
+
+    def _rebuild(self):
+        '''Recomputes the pairwise sums from the rows'''
+        x = np.zeros((len(self.rows), len(self.columns)))
+        m = np.zeros(x.shape)
+        for i, row in enumerate(self.rows.values()):
+            x[i], m[i] = self._vectors(row)
+        self.counts = m.T @ m
+        self.sums = x.T @ m
+        self.products = x.T @ x
@@ -48,7 +48,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
         self.resolution = resolution
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
 
-        self.optimizer = RiskParityPortfolioOptimizer() if optimizer is None else optimizer
+        self.optimizer = RiskParityPortfolioOptimizer(warm_start = True) if optimizer is None else optimizer
 
         self.symbolDataBySymbol = {}
 
@@ -131,8 +131,7 @@ class RiskParityPortfolioConstructionModel(PortfolioConstructionModel):
             self.window.Reset()
 
         def WarmUpIndicators(self, history):
-            for tuple in history.itertuples():
-                self.roc.Update(tuple.Index, tuple.close)
+            IndicatorExtensions.UpdateBatch(self.roc, history.index, history.close)
 
         def OnRateOfChangeUpdated(self, roc, value):
             if roc.IsReady:
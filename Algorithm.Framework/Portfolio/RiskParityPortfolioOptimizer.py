@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Portfolio.BatchOptimization import get_batch_statistics, map_batch
 from scipy.optimize import *
 
 ### <summary>
@@ -22,13 +23,26 @@ class RiskParityPortfolioOptimizer:
     
     def __init__(self, 
                  minimum_weight = 1e-05, 
-                 maximum_weight = sys.float_info.max):
+                 maximum_weight = sys.float_info.max,
+                 method = 'Newton-CG',
+                 shrinkage = False,
+                 warm_start = False):
         '''Initialize the RiskParityPortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
-            maximum_weight(float): The upper bounds on portfolio weights'''
+            maximum_weight(float): The upper bounds on portfolio weights
+            method(str): The solver: 'Newton-CG' (Newton conjugate gradient with Hessian-vector products)
+                         or 'CCD' (cyclical coordinate descent)
+            shrinkage(bool): True to estimate the covariance with the Ledoit-Wolf shrinkage when it is not provided
+            warm_start(bool): True to start the optimization from the previous solution instead of equal weights'''
         self.minimum_weight = minimum_weight if minimum_weight >= 1e-05 else 1e-05
         self.maximum_weight = maximum_weight if maximum_weight >= minimum_weight else minimum_weight
+        if method not in ['Newton-CG', 'CCD']:
+            raise ValueError(f'RiskParityPortfolioOptimizer: method must be Newton-CG or CCD. Method: {method}')
+        self.method = method
+        self.shrinkage = shrinkage
+        self.warm_start = warm_start
+        self.previous_solution = None
 
     def Optimize(self, historicalReturns, budget = None, covariance = None):
         '''
@@ -36,15 +50,55 @@ class RiskParityPortfolioOptimizer:
         args:
             historicalReturns: Matrix of annualized historical returns where each column represents a security and each row returns for the given date/time (size: K x N).
             budget: Risk budget vector (size: K x 1).
-            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K).
+            covariance: Multi-dimensional array of double with the portfolio covariance of annualized returns (size: K x K),
+                        or a factor model given as a tuple of the loadings (size: K x F), the factor covariance (size: F x F)
+                        and the specific variances (size: K x 1).
         Returns:
             Array of double with the portfolio weights (size: K x 1)
         '''
+        size = historicalReturns.columns.size   # K x 1
         if covariance is None:
-            covariance = np.cov(historicalReturns.T)
+            covariance = self.get_ledoit_wolf_covariance(historicalReturns.values) if self.shrinkage else np.cov(historicalReturns.T)
+        if not isinstance(covariance, tuple):
+            covariance = np.asarray(covariance, dtype = float).reshape(size, size)
+
+        budget = budget if budget is None else np.asarray(budget, dtype = float)
+        weights, solution = self.solve(covariance, budget, self.get_initial_guess(historicalReturns.columns))
+
+        # a failed optimization keeps the previous solution as the next initial guess
+        if self.warm_start and solution is not None:
+            self.previous_solution = pd.Series(solution, index = historicalReturns.columns)
+        return weights
+
+    def OptimizeBatch(self, historicalReturns, budget = None, covariance = None, max_workers = None):
+        '''
+        Perform portfolio optimization for a stack of matrices of historical returns, one per date
+        args:
+            historicalReturns: Array of historical returns where the first dimension is the date (size: T x K x N).
+            budget: Risk budget vector, the same for every date (size: N) or one per date (size: T x N).
+            covariance: Array of double with the covariance of every date (size: T x N x N).
+            max_workers: Number of processes used to solve the dates. If None, they are solved in the current process.
+        Returns:
+            Array of double with the portfolio weights of every date (size: T x N)
+        '''
+        if covariance is None and self.shrinkage:
+            covariance = [self.get_ledoit_wolf_covariance(x) for x in np.asarray(historicalReturns, dtype = float)]
+        _, covariance = get_batch_statistics(historicalReturns, covariance = covariance)
+        budget = [None] * len(covariance) if budget is None else np.broadcast_to(np.asarray(budget, dtype = float), covariance.shape[:2])
+        return np.array([weights for weights, _ in map_batch(self.solve, list(zip(covariance, budget)), max_workers)])
+
+    def solve(self, covariance, budget = None, initial_guess = None):
+        '''Finds the risk parity weights of a single date
+        Args:
+            covariance: Covariance matrix (size: N x N) or factor model tuple
+            budget: Risk budget vector (size: N). If None, equal budget of risk
+            initial_guess: Initial guess of the optimization. If None, equal weights are used
+        Returns:
+            Tuple of the portfolio weights (or equal weights if the optimization fails) and the solution of the optimization problem
+            (or None if the optimization fails)'''
+        product, diagonal = self.get_covariance_operators(covariance)
+        size = diagonal.size
 
-        size = historicalReturns.columns.size   # K x 1
-        
         # Optimization Problem
         # minimize_{x >= 0} f(x) = 1/2 * x^T.S.x - b^T.log(x)
         # b = 1 / num_of_assets (equal budget of risk)
@@ -53,11 +107,91 @@ class RiskParityPortfolioOptimizer:
         # lw <= x <= up
         x0 = np.array(size * [1. / size])
         budget = budget if budget is not None else x0
-        objective = lambda weights: 0.5 * weights.T @ covariance @ weights - budget.T @ np.log(weights)
-        gradient = lambda weights: covariance @ weights - budget / weights
-        hessian = lambda weights: covariance + np.diag((budget / weights**2).flatten())
-        solver = minimize(objective, jac=gradient, hess=hessian, x0=x0, method="Newton-CG")
+        start = x0 if initial_guess is None else initial_guess
+
+        if self.method == 'CCD':
+            solution, success = self.cyclical_coordinate_descent(covariance, diagonal, budget, start)
+        else:
+            objective = lambda weights: 0.5 * weights.T @ product(weights) - budget.T @ np.log(weights)
+            gradient = lambda weights: product(weights) - budget / weights
+            # Hessian-vector product H(x).p without building the diagonal matrix
+            hessp = lambda weights, p: product(p) + budget / weights**2 * p
+            solver = minimize(objective, jac=gradient, hessp=hessp, x0=start, method="Newton-CG")
+            solution, success = solver["x"], solver["success"]
 
-        if not solver["success"]: return x0
+        if not success: return x0, None
         # Normalize weights: w = x / x^T.1
-        return np.clip(solver["x"]/np.sum(solver["x"]), self.minimum_weight, self.maximum_weight)
\ No newline at end of file
+        return np.clip(solution/np.sum(solution), self.minimum_weight, self.maximum_weight), solution
+
+    def cyclical_coordinate_descent(self, covariance, diagonal, budget, start, tolerance = 1e-10, max_iterations = 1000):
+        '''Solves the optimization problem one coordinate at a time. Each coordinate has the closed-form solution
+        x_i = (-c_i + sqrt(c_i^2 + 4 S_ii b_i)) / (2 S_ii), where c_i = (S.x)_i - S_ii x_i.
+        Griveau-Billion, T., Richard, J-C. and Roncalli, T. (2013). A Fast Algorithm for Computing High-dimensional Risk Parity Portfolios.
+        Available at SSRN 2325255.
+        Returns:
+            Tuple of the solution and whether it converged'''
+        column = self.get_covariance_column(covariance, diagonal)
+        weights = np.array(start, dtype = float)
+        product = self.get_covariance_operators(covariance)[0](weights)
+
+        for _ in range(max_iterations):
+            change = 0
+            for i in range(weights.size):
+                c = product[i] - diagonal[i] * weights[i]
+                weight = (-c + np.sqrt(c * c + 4 * diagonal[i] * budget[i])) / (2 * diagonal[i])
+                delta = weight - weights[i]
+                if delta != 0:
+                    product += delta * column(i)
+                    weights[i] = weight
+                    change = max(change, abs(delta) / weight)
+            if change < tolerance:
+                return weights, True
+
+        return weights, False
+
+    def get_covariance_operators(self, covariance):
+        '''Gets the function that multiplies the covariance by a vector and the diagonal of the covariance.
+        A factor model (B, F, D) is never expanded: S.p = B.(F.(B^T.p)) + D * p'''
+        if isinstance(covariance, tuple):
+            loadings, factor_covariance, specific_variance = (np.asarray(x, dtype = float) for x in covariance)
+            product = lambda p: loadings @ (factor_covariance @ (loadings.T @ p)) + specific_variance * p
+            diagonal = np.einsum('ij,jk,ik->i', loadings, factor_covariance, loadings) + specific_variance
+            return product, diagonal
+        return (lambda p: covariance @ p), np.diag(covariance).copy()
+
+    def get_covariance_column(self, covariance, diagonal):
+        '''Gets the function that returns the i-th column of the covariance'''
+        if isinstance(covariance, tuple):
+            loadings, factor_covariance, specific_variance = (np.asarray(x, dtype = float) for x in covariance)
+            def column(i):
+                values = loadings @ (factor_covariance @ loadings[i])
+                values[i] = diagonal[i]
+                return values
+            return column
+        return lambda i: covariance[:, i]
+
+    def get_ledoit_wolf_covariance(self, historicalReturns):
+        '''Estimates the covariance shrunk towards a scaled identity matrix
+        Ledoit, O. and Wolf, M. (2004). A well-conditioned estimator for large-dimensional covariance matrices.
+        Journal of Multivariate Analysis, 88(2), 365-411.
+        Args:
+            historicalReturns: Array of historical returns (size: K x N)
+        Returns:
+            The shrunk covariance matrix (size: N x N)'''
+        returns = historicalReturns - historicalReturns.mean(axis = 0)
+        samples, size = returns.shape
+
+        sample_covariance = returns.T @ returns / samples
+        mu = np.trace(sample_covariance) / size
+        delta = np.sum((sample_covariance - mu * np.eye(size))**2) / size
+        beta = (np.sum(np.sum(returns**2, axis = 1)**2) - samples * np.sum(sample_covariance**2)) / (size * samples**2)
+
+        shrinkage = 0 if delta == 0 else min(beta, delta) / delta
+        return (1 - shrinkage) * sample_covariance + shrinkage * mu * np.eye(size)
+
+    def get_initial_guess(self, columns):
+        '''Gets the initial guess of the optimization: the previous solution of the securities
+        that were already in the portfolio and equal weights for the new ones'''
+        if not self.warm_start or self.previous_solution is None:
+            return None
+        return self.previous_solution.reindex(columns).fillna(1. / columns.size).values
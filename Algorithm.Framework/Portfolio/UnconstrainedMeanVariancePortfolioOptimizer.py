@@ -11,8 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from numpy import dot
-from numpy.linalg import inv
+from AlgorithmImports import *
+from Portfolio.BatchOptimization import get_batch_statistics
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer with unconstrained mean variance.'''
@@ -34,4 +34,23 @@ class UnconstrainedMeanVariancePortfolioOptimizer:
         if covariance is None:
             covariance = historicalReturns.cov()
 
-        return expectedReturns.dot(inv(covariance))
\ No newline at end of file
+        return self.optimize_batch(np.asarray(expectedReturns, dtype = float)[np.newaxis],
+                                   np.asarray(covariance, dtype = float)[np.newaxis])[0]
+
+    def OptimizeBatch(self, historicalReturns, expectedReturns = None, covariance = None, max_workers = None):
+        '''
+        Perform portfolio optimization for a stack of matrices of historical returns, one per date
+        args:
+            historicalReturns: Array of historical returns where the first dimension is the date (size: T x K x N).
+            expectedReturns: Array of double with the expected returns of every date (size: T x N).
+            covariance: Array of double with the covariance of every date (size: T x N x N).
+            max_workers: Not used, every date is solved in a single vectorized call.
+        Returns:
+            Array of double with the portfolio weights of every date (size: T x N)
+        '''
+        expectedReturns, covariance = get_batch_statistics(historicalReturns, expectedReturns, covariance)
+        return self.optimize_batch(expectedReturns, covariance)
+
+    def optimize_batch(self, expectedReturns, covariance):
+        '''Solves every date of the batch: w = Σ^-1 µ, since the covariance is symmetric'''
+        return np.linalg.solve(covariance, expectedReturns[..., np.newaxis])[..., 0]
\ No newline at end of file
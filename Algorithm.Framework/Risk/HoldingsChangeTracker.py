@@ -0,0 +1,55 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Reports the securities whose holdings quantity changed, so the framework models only process those securities
+### instead of scanning the whole portfolio on every call.
+### </summary>
+class HoldingsChangeTracker:
+    '''Reports the securities whose holdings quantity changed'''
+    def __init__(self, onHoldingsChanged):
+        '''Initializes a new instance of the HoldingsChangeTracker class
+        Args:
+            onHoldingsChanged: Function called with the security whose holdings changed'''
+        self.onHoldingsChanged = onHoldingsChanged
+        self.trackedSymbols = set()
+        self.tracksAlgorithm = False
+
+    def TrackAlgorithm(self, algorithm):
+        '''Starts tracking the holdings of the current and future securities of the algorithm'''
+        if self.tracksAlgorithm:
+            return
+        self.tracksAlgorithm = True
+        algorithm.Securities.CollectionChanged += self.OnSecuritiesCollectionChanged
+        for kvp in algorithm.Securities:
+            self.Track(kvp.Value)
+
+    def Track(self, security):
+        '''Starts tracking the holdings of a security. A security that is already invested is reported as changed'''
+        symbol = security.Symbol
+        if symbol in self.trackedSymbols:
+            return
+        self.trackedSymbols.add(symbol)
+        security.Holdings.QuantityChanged += self.OnHoldingsQuantityChanged
+        if security.Invested:
+            self.onHoldingsChanged(security)
+
+    def OnSecuritiesCollectionChanged(self, sender, args):
+        if args.NewItems is not None:
+            for security in args.NewItems:
+                self.Track(security)
+
+    def OnHoldingsQuantityChanged(self, sender, args):
+        self.onHoldingsChanged(args.Security)
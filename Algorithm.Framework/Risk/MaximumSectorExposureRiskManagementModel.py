@@ -12,7 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from itertools import groupby
+from Risk.HoldingsChangeTracker import HoldingsChangeTracker
 
 class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that that limits the sector exposure to the specified percentage'''
@@ -25,7 +25,7 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
             raise ValueError('MaximumSectorExposureRiskManagementModel: the maximum sector exposure cannot be a non-positive value.')
 
         self.maximumSectorExposure = maximumSectorExposure
-        self.targetsCollection = PortfolioTargetCollection()
+        self.sectorIndex = self.SectorIndex()
 
     def ManageRisk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
@@ -33,45 +33,41 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
             algorithm: The algorithm instance'''
         maximumSectorExposureValue = float(algorithm.Portfolio.TotalPortfolioValue) * self.maximumSectorExposure
 
-        self.targetsCollection.AddRange(targets)
+        index = self.sectorIndex
+        index.Update(targets)
+
+        # Only the securities with holdings or a target are exposed, the others do not change the sector exposure
+        exposed = index.GetExposedSecurities()
+        if len(exposed) == 0:
+            return []
+
+        # Compute the sector absolute holdings values
+        # If the construction model has created a target, we consider that
+        # value to calculate the security absolute holding value
+        quantities = np.zeros(len(exposed))
+        absoluteHoldingsValues = np.zeros(len(exposed))
+        for i, security in enumerate(exposed):
+            quantity = index.targetQuantities.get(security.Symbol)
+            if quantity is None:
+                quantities[i] = float(security.Holdings.Quantity)
+                absoluteHoldingsValues[i] = float(security.Holdings.AbsoluteHoldingsValue)
+            else:
+                quantities[i] = quantity
+                absoluteHoldingsValues[i] = (float(security.Price) * abs(quantity) *
+                    float(security.SymbolProperties.ContractMultiplier) *
+                    float(security.QuoteCurrency.ConversionRate))
+
+        sectors = np.array([index.sectorCodeBySymbol[x.Symbol] for x in exposed])
+        sectorAbsoluteHoldingsValues = np.bincount(sectors, weights=absoluteHoldingsValues, minlength=len(index.sectors))
+
+        # If the ratio between the sector absolute holdings value and the maximum sector exposure value
+        # exceeds the unity, it means we need to reduce each security of that sector by that ratio
+        # Otherwise, it means that the sector exposure is below the maximum and there is nothing to do.
+        ratios = sectorAbsoluteHoldingsValues[sectors] / maximumSectorExposureValue
 
         risk_targets = list()
-
-        # Group the securities by their sector
-        filtered = list(filter(lambda x: x.Value.Fundamentals is not None and x.Value.Fundamentals.HasFundamentalData, algorithm.UniverseManager.ActiveSecurities))
-        filtered.sort(key = lambda x: x.Value.Fundamentals.CompanyReference.IndustryTemplateCode)
-        groupBySector = groupby(filtered, lambda x: x.Value.Fundamentals.CompanyReference.IndustryTemplateCode)
-
-        for code, securities in groupBySector:
-            # Compute the sector absolute holdings value
-            # If the construction model has created a target, we consider that
-            # value to calculate the security absolute holding value
-            quantities = {}
-            sectorAbsoluteHoldingsValue = 0
-
-            for security in securities:
-                symbol = security.Value.Symbol
-                quantities[symbol] = security.Value.Holdings.Quantity
-                absoluteHoldingsValue = security.Value.Holdings.AbsoluteHoldingsValue
-
-                if self.targetsCollection.ContainsKey(symbol):
-                    quantities[symbol] = self.targetsCollection[symbol].Quantity
-
-                    absoluteHoldingsValue = (security.Value.Price * abs(quantities[symbol]) *
-                        security.Value.SymbolProperties.ContractMultiplier *
-                        security.Value.QuoteCurrency.ConversionRate)
-
-                sectorAbsoluteHoldingsValue += absoluteHoldingsValue
-
-            # If the ratio between the sector absolute holdings value and the maximum sector exposure value
-            # exceeds the unity, it means we need to reduce each security of that sector by that ratio
-            # Otherwise, it means that the sector exposure is below the maximum and there is nothing to do.
-            ratio = float(sectorAbsoluteHoldingsValue) / maximumSectorExposureValue
-
-            if ratio > 1:
-                for symbol, quantity in quantities.items():
-                    if quantity != 0:
-                        risk_targets.append(PortfolioTarget(symbol, float(quantity) / ratio))
+        for i in np.flatnonzero((ratios > 1) & (quantities != 0)).tolist():
+            risk_targets.append(PortfolioTarget(exposed[i].Symbol, quantities[i] / ratios[i]))
 
         return risk_targets
 
@@ -80,10 +76,94 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
-        anyFundamentalData = any([
-            kvp.Value.Fundamentals is not None and 
-            kvp.Value.Fundamentals.HasFundamentalData for kvp in algorithm.ActiveSecurities
-            ])
+        for security in changes.RemovedSecurities:
+            self.sectorIndex.Remove(security)
+        for security in changes.AddedSecurities:
+            self.sectorIndex.Add(security)
 
-        if not anyFundamentalData:
+        if len(self.sectorIndex.sectorCodeBySymbol) == 0:
             raise Exception("MaximumSectorExposureRiskManagementModel.OnSecuritiesChanged: Please select a portfolio selection model that selects securities with fundamental data.")
+
+    class SectorIndex:
+        '''The sectors of the active equities with fundamental data, read once when they are added.
+        Tracks the securities with holdings or a target from the holdings changes and the targets,
+        so the exposure is only computed for them. The other security types don't have fundamental data and are ignored'''
+        def __init__(self):
+            self.sectors = []
+            self.sectorCodes = {}
+            self.sectorCodeBySymbol = {}
+            self.securityBySymbol = {}
+            self.targetQuantities = {}
+            # the equities added without fundamental data, which can get it later
+            self.pendingSecurities = {}
+            # the pending equities with holdings or a target, the only ones whose sector changes the exposure
+            self.pendingExposedSymbols = set()
+            self.changedSymbols = set()
+            self.exposedSymbols = set()
+            self.holdingsChanges = HoldingsChangeTracker(lambda security: self.changedSymbols.add(security.Symbol))
+
+        def Add(self, security):
+            if security.Type != SecurityType.Equity:
+                return
+
+            symbol = security.Symbol
+            self.holdingsChanges.Track(security)
+
+            fundamentals = security.Fundamentals
+            if fundamentals is None or not fundamentals.HasFundamentalData:
+                self.pendingSecurities[symbol] = security
+                self.changedSymbols.add(symbol)
+                return
+
+            self.pendingSecurities.pop(symbol, None)
+            self.pendingExposedSymbols.discard(symbol)
+            code = fundamentals.CompanyReference.IndustryTemplateCode
+            if code not in self.sectorCodes:
+                self.sectorCodes[code] = len(self.sectors)
+                self.sectors.append(code)
+            self.sectorCodeBySymbol[symbol] = self.sectorCodes[code]
+            self.securityBySymbol[symbol] = security
+            self.changedSymbols.add(symbol)
+
+        def Remove(self, security):
+            symbol = security.Symbol
+            self.pendingSecurities.pop(symbol, None)
+            self.pendingExposedSymbols.discard(symbol)
+            self.sectorCodeBySymbol.pop(symbol, None)
+            self.securityBySymbol.pop(symbol, None)
+            self.exposedSymbols.discard(symbol)
+
+        def Update(self, targets):
+            '''Updates the exposed securities with the new targets and the holdings changes since the last update'''
+            for target in targets:
+                self.targetQuantities[target.Symbol] = float(target.Quantity)
+                self.changedSymbols.add(target.Symbol)
+
+            # The fundamental data is only checked again for the pending equities that are exposed
+            for symbol in self.changedSymbols & self.pendingSecurities.keys():
+                if self.IsExposed(self.pendingSecurities[symbol]):
+                    self.pendingExposedSymbols.add(symbol)
+                else:
+                    self.pendingExposedSymbols.discard(symbol)
+            for symbol in list(self.pendingExposedSymbols):
+                self.Add(self.pendingSecurities[symbol])
+
+            for symbol in self.changedSymbols:
+                security = self.securityBySymbol.get(symbol)
+                if security is None:
+                    continue
+                if self.IsExposed(security):
+                    self.exposedSymbols.add(symbol)
+                else:
+                    self.exposedSymbols.discard(symbol)
+            self.changedSymbols.clear()
+
+        def IsExposed(self, security):
+            '''True if the security has a non zero target, or holdings if it doesn't have a target'''
+            quantity = self.targetQuantities.get(security.Symbol)
+            return quantity != 0 if quantity is not None else security.Invested
+
+        def GetExposedSecurities(self):
+            '''Gets the exposed securities sorted by sector'''
+            securities = [self.securityBySymbol[x] for x in self.exposedSymbols]
+            return sorted(securities, key = lambda x: self.sectors[self.sectorCodeBySymbol[x.Symbol]])
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Risk.HoldingsChangeTracker import HoldingsChangeTracker
 
 class TrailingStopRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that limits the maximum possible loss
@@ -21,53 +22,87 @@ class TrailingStopRiskManagementModel(RiskManagementModel):
         Args:
             maximumDrawdownPercent: The maximum percentage drawdown allowed for algorithm portfolio compared with the highest unrealized profit, defaults to 5% drawdown'''
         self.maximumDrawdownPercent = abs(maximumDrawdownPercent)
-        self.trailingAbsoluteHoldingsState = dict()
+        self.trailingAbsoluteHoldingsState = self.HoldingsState()
+        # the securities whose holdings changed since the last call, only invested securities are tracked
+        self.changedSecurities = {}
+        self.holdingsChanges = HoldingsChangeTracker(self.OnHoldingsChanged)
 
     def ManageRisk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
         Args:
             algorithm: The algorithm instance
             targets: The current portfolio targets to be assessed for risk'''
-        riskAdjustedTargets = list()
+        self.holdingsChanges.TrackAlgorithm(algorithm)
 
-        for kvp in algorithm.Securities:
-            symbol = kvp.Key
-            security = kvp.Value
+        state = self.trailingAbsoluteHoldingsState
+        changedSecurities, self.changedSecurities = self.changedSecurities, {}
 
+        for symbol, security in changedSecurities.items():
             # Remove if not invested
             if not security.Invested:
-                self.trailingAbsoluteHoldingsState.pop(symbol, None)
+                state.Remove(symbol)
                 continue
 
-            position = PositionSide.Long if security.Holdings.IsLong else PositionSide.Short
-            absoluteHoldingsValue = security.Holdings.AbsoluteHoldingsValue
-            trailingAbsoluteHoldingsState = self.trailingAbsoluteHoldingsState.get(symbol)
-
             # Add newly invested security (if doesn't exist) or reset holdings state (if position changed)
-            if trailingAbsoluteHoldingsState == None or position != trailingAbsoluteHoldingsState.position:
-                self.trailingAbsoluteHoldingsState[symbol] = trailingAbsoluteHoldingsState = self.HoldingsState(position, security.Holdings.AbsoluteHoldingsCost)
+            isLong = security.Holdings.IsLong
+            if state.IsLong(symbol) != isLong:
+                state.Remove(symbol)
+                state.Add(symbol, security, isLong, security.Holdings.AbsoluteHoldingsCost)
 
-            trailingAbsoluteHoldingsValue = trailingAbsoluteHoldingsState.absoluteHoldingsValue
+        if len(state.symbols) == 0:
+            return []
 
-            # Check for new max (for long position) or min (for short position) absolute holdings value
-            if ((position == PositionSide.Long and trailingAbsoluteHoldingsValue < absoluteHoldingsValue) or
-                (position == PositionSide.Short and trailingAbsoluteHoldingsValue > absoluteHoldingsValue)):
-                self.trailingAbsoluteHoldingsState[symbol].absoluteHoldingsValue = absoluteHoldingsValue
-                continue
+        absoluteHoldingsValues = np.array([float(x.Holdings.AbsoluteHoldingsValue) for x in state.securities])
+        trailingAbsoluteHoldingsValues = state.absoluteHoldingsValues
+
+        # Check for new max (for long position) or min (for short position) absolute holdings value
+        newTrailing = np.where(state.isLong, trailingAbsoluteHoldingsValues < absoluteHoldingsValues, trailingAbsoluteHoldingsValues > absoluteHoldingsValues)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.abs((trailingAbsoluteHoldingsValues - absoluteHoldingsValues) / trailingAbsoluteHoldingsValues)
+        breached = np.flatnonzero(~newTrailing & (self.maximumDrawdownPercent < drawdowns))
 
-            drawdown = abs((trailingAbsoluteHoldingsValue - absoluteHoldingsValue) / trailingAbsoluteHoldingsValue)
+        trailingAbsoluteHoldingsValues[newTrailing] = absoluteHoldingsValues[newTrailing]
 
-            if self.maximumDrawdownPercent < drawdown:
-                # Cancel insights
-                algorithm.Insights.Cancel([ symbol ]);
+        riskAdjustedTargets = list()
+        for i in breached.tolist():
+            symbol = state.symbols[i]
+            # Cancel insights
+            algorithm.Insights.Cancel([ symbol ])
+            # liquidate, the state is reset on the next call if the position is still open
+            riskAdjustedTargets.append(PortfolioTarget(symbol, 0))
+            self.changedSecurities[symbol] = state.securities[i]
 
-                self.trailingAbsoluteHoldingsState.pop(symbol, None)
-                # liquidate
-                riskAdjustedTargets.append(PortfolioTarget(symbol, 0))
+        for target in riskAdjustedTargets:
+            state.Remove(target.Symbol)
 
         return riskAdjustedTargets
 
+    def OnHoldingsChanged(self, security):
+        self.changedSecurities[security.Symbol] = security
+
     class HoldingsState:
-        def __init__(self, position, absoluteHoldingsValue):
-            self.position = position
-            self.absoluteHoldingsValue = absoluteHoldingsValue
+        '''The trailing absolute holdings values of the invested securities, in arrays'''
+        def __init__(self):
+            self.symbols = []
+            self.securities = []
+            self.isLong = np.zeros(0, dtype=bool)
+            self.absoluteHoldingsValues = np.zeros(0)
+
+        def IsLong(self, symbol):
+            '''Gets whether the position is long, None if the symbol is not tracked'''
+            return bool(self.isLong[self.symbols.index(symbol)]) if symbol in self.symbols else None
+
+        def Add(self, symbol, security, isLong, absoluteHoldingsValue):
+            self.symbols.append(symbol)
+            self.securities.append(security)
+            self.isLong = np.append(self.isLong, isLong)
+            self.absoluteHoldingsValues = np.append(self.absoluteHoldingsValues, float(absoluteHoldingsValue))
+
+        def Remove(self, symbol):
+            if symbol in self.symbols:
+                i = self.symbols.index(symbol)
+                del self.symbols[i]
+                del self.securities[i]
+                self.isLong = np.delete(self.isLong, i)
+                self.absoluteHoldingsValues = np.delete(self.absoluteHoldingsValues, i)
@@ -22,68 +22,130 @@ class EmaCrossUniverseSelectionModel(FundamentalUniverseSelectionModel):
                  fastPeriod = 100,
                  slowPeriod = 300,
                  universeCount = 500,
-                 universeSettings = None):
+                 universeSettings = None,
+                 evictionPeriod = 30):
         '''Initializes a new instance of the EmaCrossUniverseSelectionModel class
         Args:
             fastPeriod: Fast EMA period
             slowPeriod: Slow EMA period
             universeCount: Maximum number of members of this universe selection
-            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings'''
+            universeSettings: The settings used when adding symbols to the algorithm, specify null to use algorithm.UniverseSettings
+            evictionPeriod: Number of coarse selections a symbol can be missing from before its averages are discarded'''
         super().__init__(False, universeSettings)
         self.fastPeriod = fastPeriod
         self.slowPeriod = slowPeriod
         self.universeCount = universeCount
         self.tolerance = 0.01
-        # holds our coarse fundamental indicators by symbol
-        self.averages = {}
+        # holds our coarse fundamental indicators of all the symbols
+        self.averages = self.SelectionData(fastPeriod, slowPeriod, evictionPeriod)
 
     def SelectCoarse(self, algorithm, coarse):
         '''Defines the coarse fundamental selection function.
         Args:
             algorithm: The algorithm instance
-            coarse: The coarse fundamental data used to perform filtering</param>
+            coarse: The coarse fundamental data used to perform filtering
         Returns:
             An enumerable of symbols passing the filter'''
-        filtered = []
+        return self.SelectCoarseSnapshot(algorithm, CoarseFundamentalSnapshot(coarse))
 
-        for cf in coarse:
-            if cf.Symbol not in self.averages:
-                self.averages[cf.Symbol] = self.SelectionData(cf.Symbol, self.fastPeriod, self.slowPeriod)
-
-            # grab th SelectionData instance for this symbol
-            avg = self.averages.get(cf.Symbol)
+    def SelectCoarseSnapshot(self, algorithm, snapshot):
+        '''Defines the coarse fundamental selection function on the columnar snapshot of the coarse data.
+        Args:
+            algorithm: The algorithm instance
+            snapshot: The CoarseFundamentalSnapshot of the coarse fundamental data used to perform filtering
+        Returns:
+            An enumerable of symbols passing the filter'''
+        slots = self.averages.Update(snapshot.SymbolIds, snapshot.AdjustedPrice)
+        fast = self.averages.Fast[slots]
+        slow = self.averages.Slow[slots]
 
-            # Update returns true when the indicators are ready, so don't accept until they are
-            # and only pick symbols who have their fastPeriod-day ema over their slowPeriod-day ema
-            if avg.Update(cf.EndTime, cf.AdjustedPrice) and avg.Fast > avg.Slow * (1 + self.tolerance):
-                filtered.append(avg)
+        # don't accept symbols until their indicators are ready
+        # and only pick symbols who have their fastPeriod-day ema over their slowPeriod-day ema
+        filtered = np.flatnonzero(self.averages.IsReady[slots] & (fast > slow * (1 + self.tolerance)))
 
         # prefer symbols with a larger delta by percentage between the two averages
-        filtered = sorted(filtered, key=lambda avg: avg.ScaledDelta, reverse = True)
+        scaledDelta = (fast[filtered] - slow[filtered]) / ((fast[filtered] + slow[filtered]) / 2)
+        filtered = filtered[self.GetLargestIndices(scaledDelta, self.universeCount)]
 
         # we only need to return the symbol and return 'universeCount' symbols
-        return [x.Symbol for x in filtered[:self.universeCount]]
+        return list(snapshot.GetSymbols(filtered))
 
     # class used to improve readability of the coarse selection function
     class SelectionData:
-        def __init__(self, symbol, fastPeriod, slowPeriod):
-            self.Symbol = symbol
-            self.FastEma = ExponentialMovingAverage(fastPeriod)
-            self.SlowEma = ExponentialMovingAverage(slowPeriod)
+        '''The fast and slow exponential moving averages of all the symbols, updated together in arrays.
+        Each symbol has a slot of the arrays, freed when the symbol is missing from evictionPeriod updates'''
+        def __init__(self, fastPeriod, slowPeriod, evictionPeriod):
+            self.periods = np.array([[fastPeriod], [slowPeriod]])
+            self.smoothingFactors = 2 / (self.periods + 1)
+            self.evictionPeriod = evictionPeriod
+            self.updates = 0
+            self.slotBySymbolId = {}
+            self.symbolIdBySlot = []
+            self.freeSlots = []
+            # the averages and the sums of the first samples used for their initial values, fast on the first row
+            self.values = np.zeros((2, 0))
+            self.sums = np.zeros((2, 0))
+            self.samples = np.zeros(0, dtype=np.int64)
+            self.lastUpdates = np.zeros(0, dtype=np.int64)
 
         @property
         def Fast(self):
-            return float(self.FastEma.Current.Value)
+            return self.values[0]
 
         @property
         def Slow(self):
-            return float(self.SlowEma.Current.Value)
+            return self.values[1]
 
-        # computes an object score of how much large the fast is than the slow
         @property
-        def ScaledDelta(self):
-            return (self.Fast - self.Slow) / ((self.Fast + self.Slow) / 2)
+        def IsReady(self):
+            return self.samples >= self.periods.max()
+
+        # updates the EMAFast and EMASlow indicators of the symbols, returning their slots
+        def Update(self, symbolIds, values):
+            self.updates += 1
+            slots = np.array([self.slotBySymbolId.get(x, -1) for x in symbolIds], dtype=np.int64)
+            for i in np.flatnonzero(slots < 0):
+                slots[i] = self.Allocate(symbolIds[i])
+
+            samples = self.samples[slots] + 1
+            self.samples[slots] = samples
+            self.lastUpdates[slots] = self.updates
+
+            # the initial value is the simple moving average of the first samples
+            sums = self.sums[:, slots] + np.where(samples <= self.periods, values, 0)
+            self.sums[:, slots] = sums
+            nextValues = values * self.smoothingFactors + self.values[:, slots] * (1 - self.smoothingFactors)
+            self.values[:, slots] = np.where(samples < self.periods, 0, np.where(samples == self.periods, sums / self.periods, nextValues))
+
+            self.Evict()
+            return slots
+
+        def Allocate(self, symbolId):
+            if not self.freeSlots:
+                capacity = len(self.symbolIdBySlot)
+                extension = max(capacity, 1024)
+                self.values = np.hstack((self.values, np.zeros((2, extension))))
+                self.sums = np.hstack((self.sums, np.zeros((2, extension))))
+                self.samples = np.concatenate((self.samples, np.zeros(extension, dtype=np.int64)))
+                self.lastUpdates = np.concatenate((self.lastUpdates, np.zeros(extension, dtype=np.int64)))
+                self.symbolIdBySlot.extend([None] * extension)
+                self.freeSlots.extend(reversed(range(capacity, capacity + extension)))
+
+            slot = self.freeSlots.pop()
+            self.slotBySymbolId[symbolId] = slot
+            self.symbolIdBySlot[slot] = symbolId
+            return slot
+
+        # frees the slots of the symbols missing from the last evictionPeriod updates, like delisted symbols
+        def Evict(self):
+            evicted = np.flatnonzero((self.samples > 0) & (self.lastUpdates <= self.updates - self.evictionPeriod))
+            if len(evicted) == 0:
+                return
 
-        # updates the EMAFast and EMASlow indicators, returning true when they're both ready
-        def Update(self, time, value):
-            return self.SlowEma.Update(time, value) & self.FastEma.Update(time, value)
+            for slot in evicted.tolist():
+                del self.slotBySymbolId[self.symbolIdBySlot[slot]]
+                self.symbolIdBySlot[slot] = None
+            self.values[:, evicted] = 0
+            self.sums[:, evicted] = 0
+            self.samples[evicted] = 0
+            self.freeSlots.extend(evicted.tolist())
@@ -58,11 +58,20 @@ class FundamentalUniverseSelectionModel:
             coarse: The coarse fundamental data used to perform filtering
         Returns:
             An enumerable of symbols passing the filter'''
+        if self.SelectsCoarseSnapshot():
+            return self.SelectCoarseSnapshot(algorithm, CoarseFundamentalSnapshot(coarse, self.filterFineData))
         if self.filterFineData:
             coarse = filter(lambda c: c.HasFundamentalData, coarse)
         return self.SelectCoarse(algorithm, coarse)
 
 
+    def SelectsCoarseSnapshot(self):
+        '''Determines whether this model performs the coarse selection on the columnar snapshot of the coarse data
+        Returns:
+            True if SelectCoarseSnapshot is implemented, in which case it is used instead of SelectCoarse'''
+        return type(self).SelectCoarseSnapshot is not FundamentalUniverseSelectionModel.SelectCoarseSnapshot
+
+
     def SelectCoarse(self, algorithm, coarse):
         '''Defines the coarse fundamental selection function.
         Args:
@@ -73,6 +82,38 @@ class FundamentalUniverseSelectionModel:
         raise NotImplementedError("SelectCoarse must be implemented")
 
 
+    def SelectCoarseSnapshot(self, algorithm, snapshot):
+        '''Defines the coarse fundamental selection function on the columnar snapshot of the coarse data.
+        The snapshot exposes the Price, AdjustedPrice, Volume, DollarVolume and HasFundamentalData NumPy arrays
+        and the SymbolIds list, and GetSymbols maps the positions of the selected rows back to their symbols in a single call
+        Args:
+            algorithm: The algorithm instance
+            snapshot: The CoarseFundamentalSnapshot of the coarse fundamental data used to perform filtering
+        Returns:
+            An enumerable of symbols passing the filter'''
+        raise NotImplementedError("SelectCoarseSnapshot must be implemented")
+
+
+    @staticmethod
+    def GetLargestIndices(values, count):
+        '''Gets the positions of the largest values in descending order of the values, like sorting them would.
+        Uses a partition instead of sorting all the values, ties keep the order of their positions
+        Args:
+            values: The NumPy array of the values
+            count: The maximum number of positions to get
+        Returns:
+            The NumPy array of the positions of the largest values'''
+        if count <= 0:
+            indices = np.arange(0)
+        elif count < len(values):
+            kth = np.partition(values, len(values) - count)[len(values) - count]
+            larger = np.flatnonzero(values > kth)
+            indices = np.concatenate((larger, np.flatnonzero(values == kth)[:count - len(larger)]))
+        else:
+            indices = np.arange(len(values))
+        return indices[np.argsort(-values[indices], kind='stable')]
+
+
     def SelectFine(self, algorithm, fine):
         '''Defines the fine fundamental selection function.
         Args:
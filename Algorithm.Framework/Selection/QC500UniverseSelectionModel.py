@@ -13,8 +13,6 @@
 
 from AlgorithmImports import *
 from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
-from itertools import groupby
-from math import ceil
 
 class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
     '''Defines the QC500 universe as a universe selection model for framework algorithm
@@ -26,9 +24,17 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.numberOfSymbolsCoarse = 1000
         self.numberOfSymbolsFine = 500
         self.dollarVolumeBySymbol = {}
+        self.dollarVolumeBySymbolId = pd.Series(dtype=float)
+        # the only fine fundamental fields read by the fine selection
+        self.fineFields = [ "CompanyReference.CountryId", "CompanyReference.PrimaryExchangeID",
+            "CompanyReference.IndustryTemplateCode", "SecurityReference.IPODate", "MarketCap" ]
         self.lastMonth = -1
 
     def SelectCoarse(self, algorithm, coarse):
+        '''Performs coarse selection for the QC500 constituents on the coarse fundamental data'''
+        return self.SelectCoarseSnapshot(algorithm, CoarseFundamentalSnapshot(coarse))
+
+    def SelectCoarseSnapshot(self, algorithm, snapshot):
         '''Performs coarse selection for the QC500 constituents.
         The stocks must have fundamental data
         The stock must have positive previous-day close price
@@ -36,10 +42,12 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         if algorithm.Time.month == self.lastMonth:
             return Universe.Unchanged
 
-        sortedByDollarVolume = sorted([x for x in coarse if x.HasFundamentalData and x.Volume > 0 and x.Price > 0],
-                                     key = lambda x: x.DollarVolume, reverse=True)[:self.numberOfSymbolsCoarse]
+        dollarVolume = snapshot.DollarVolume
+        selected = np.flatnonzero(snapshot.HasFundamentalData & (snapshot.Volume > 0) & (snapshot.Price > 0))
+        sortedByDollarVolume = selected[self.GetLargestIndices(dollarVolume[selected], self.numberOfSymbolsCoarse)]
 
-        self.dollarVolumeBySymbol = {x.Symbol:x.DollarVolume for x in sortedByDollarVolume}
+        self.dollarVolumeBySymbol = dict(zip(snapshot.GetSymbols(sortedByDollarVolume), dollarVolume[sortedByDollarVolume].tolist()))
+        self.dollarVolumeBySymbolId = pd.Series(dollarVolume[sortedByDollarVolume], index=np.array(snapshot.SymbolIds, dtype=object)[sortedByDollarVolume])
 
         # If no security has met the QC500 criteria, the universe is unchanged.
         # A new selection will be attempted on the next trading day as self.lastMonth is not updated
@@ -55,14 +63,15 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         The stock must be traded on either the NYSE or NASDAQ
         At least half a year since its initial public offering
         The stock's market cap must be greater than 500 million'''
+        snapshot = FineFundamentalSnapshot(fine, self.fineFields)
+        data = snapshot.GetDataFrame()
 
-        sortedBySector = sorted([x for x in fine if x.CompanyReference.CountryId == "USA"
-                                        and x.CompanyReference.PrimaryExchangeID in ["NYS","NAS"]
-                                        and (algorithm.Time - x.SecurityReference.IPODate).days > 180
-                                        and x.MarketCap > 5e8],
-                               key = lambda x: x.CompanyReference.IndustryTemplateCode)
+        filtered = np.flatnonzero((data["CompanyReference.CountryId"] == "USA")
+                                  & data["CompanyReference.PrimaryExchangeID"].isin(["NYS","NAS"])
+                                  & (data["SecurityReference.IPODate"] <= pd.Timestamp(algorithm.Time - timedelta(181)))
+                                  & (data["MarketCap"] > 5e8))
 
-        count = len(sortedBySector)
+        count = len(filtered)
 
         # If no security has met the QC500 criteria, the universe is unchanged.
         # A new selection will be attempted on the next trading day as self.lastMonth is not updated
@@ -73,13 +82,15 @@ class QC500UniverseSelectionModel(FundamentalUniverseSelectionModel):
         self.lastMonth = algorithm.Time.month
 
         percent = self.numberOfSymbolsFine / count
-        sortedByDollarVolume = []
 
         # select stocks with top dollar volume in every single sector
-        for code, g in groupby(sortedBySector, lambda x: x.CompanyReference.IndustryTemplateCode):
-            y = sorted(g, key = lambda x: self.dollarVolumeBySymbol[x.Symbol], reverse = True)
-            c = ceil(len(y) * percent)
-            sortedByDollarVolume.extend(y[:c])
-
-        sortedByDollarVolume = sorted(sortedByDollarVolume, key = lambda x: self.dollarVolumeBySymbol[x.Symbol], reverse=True)
-        return [x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbolsFine]]
+        sectors = pd.DataFrame({
+            "position": filtered,
+            "code": data["CompanyReference.IndustryTemplateCode"].values[filtered],
+            "dollarVolume": self.dollarVolumeBySymbolId.reindex(np.array(snapshot.SymbolIds, dtype=object)[filtered]).values })
+        sectors = sectors.sort_values(["code", "dollarVolume"], ascending=[True, False], kind="stable")
+        bySector = sectors.groupby("code", sort=False, observed=True, dropna=False)
+        sectors = sectors[bySector.cumcount().values < np.ceil(bySector["position"].transform("size").values * percent)]
+
+        sortedByDollarVolume = sectors.sort_values("dollarVolume", ascending=False, kind="stable")["position"].values
+        return list(snapshot.GetSymbols(sortedByDollarVolume[:self.numberOfSymbolsFine]))
@@ -0,0 +1,49 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from AlgorithmImports import *
+from time import perf_counter
+
+class HistoryRequestColumnarBenchmark(QCAlgorithm):
+    '''Benchmark of the conversion of history requests to data frames, the HistoryRequestBenchmark
+    for a universe of securities. Every day the same minute history request is converted by
+    PandasData, a data frame per symbol concatenated, and by the columnar conversion.'''
+
+    def Initialize(self):
+        self.SetStartDate(2013, 10, 7)
+        self.SetEndDate(2013, 10, 11)
+        self.SetCash(10000)
+
+        tickers = ["SPY", "AAPL", "AIG", "BAC", "GOOG", "IBM", "MSFT", "NFLX", "WM", "WMT"]
+        self.symbols = [self.AddEquity(ticker).Symbol for ticker in tickers]
+        self.elapsed = { True: [], False: [] }
+
+    def OnEndOfDay(self, symbol):
+        if symbol != self.symbols[0]:
+            return
+
+        for columnar in [False, True]:
+            self.PandasConverter.Columnar = columnar
+            start = perf_counter()
+            minuteHistory = self.History(self.symbols, 390, Resolution.Minute)
+            self.elapsed[columnar].append(perf_counter() - start)
+
+            lastHourHigh = minuteHistory.loc["SPY"]["high"].tail(60).max()
+
+        self.PandasConverter.Columnar = True
+
+    def OnEndOfAlgorithm(self):
+        pandasData = np.mean(self.elapsed[False])
+        columnar = np.mean(self.elapsed[True])
+        self.Log(f'HistoryRequestColumnarBenchmark: {len(self.symbols)} symbols. PandasData {pandasData * 1000:.1f} ms. Columnar {columnar * 1000:.1f} ms. Speedup {pandasData / columnar:.1f}x')
@@ -0,0 +1,56 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
+from time import perf_counter
+
+class PortfolioOptimizerBenchmark(QCAlgorithm):
+    '''Benchmark of the analytic mode of the minimum variance and maximum sharpe ratio optimizers.
+    A 250 assets universe is optimized at the end of every day with the analytic mode, and every
+    20 days with the default SLSQP mode, to report the speedup between them.'''
+
+    def Initialize(self):
+        self.SetStartDate(2010, 1, 1)
+        self.SetEndDate(2018, 1, 1)
+        self.SetCash(10000)
+        self.symbol = self.AddEquity("SPY").Symbol
+
+        self.size = 250
+        self.random = np.random.default_rng(0)
+        self.optimizers = {
+            'SLSQP': [MinimumVariancePortfolioOptimizer(target_return = 0.001),
+                      MaximumSharpeRatioPortfolioOptimizer()],
+            'Analytic': [MinimumVariancePortfolioOptimizer(target_return = 0.001, analytic = True),
+                         MaximumSharpeRatioPortfolioOptimizer(analytic = True)]
+        }
+        self.elapsed = { mode: [] for mode in self.optimizers }
+        self.days = 0
+
+    def OnEndOfDay(self, symbol):
+        returns = pd.DataFrame(self.random.normal(0.001, 0.01, (2 * self.size, self.size)))
+        covariance = returns.cov()
+
+        modes = ['Analytic', 'SLSQP'] if self.days % 20 == 0 else ['Analytic']
+        for mode in modes:
+            start = perf_counter()
+            for optimizer in self.optimizers[mode]:
+                optimizer.Optimize(returns, covariance = covariance)
+            self.elapsed[mode].append(perf_counter() - start)
+        self.days += 1
+
+    def OnEndOfAlgorithm(self):
+        analytic = np.mean(self.elapsed['Analytic'])
+        slsqp = np.mean(self.elapsed['SLSQP'])
+        self.Log(f'PortfolioOptimizerBenchmark: {self.size} assets. SLSQP {slsqp * 1000:.1f} ms. Analytic {analytic * 1000:.1f} ms. Speedup {slsqp / analytic:.1f}x')
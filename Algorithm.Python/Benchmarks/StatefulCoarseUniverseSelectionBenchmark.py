@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
 
 class StatefulCoarseUniverseSelectionBenchmark(QCAlgorithm):
 
@@ -29,12 +30,12 @@ class StatefulCoarseUniverseSelectionBenchmark(QCAlgorithm):
     # sort the data by daily dollar volume and take the top 'NumberOfSymbols'
     def CoarseSelectionFunction(self, coarse):
 
-        selected = [x for x in coarse if (x.HasFundamentalData)]
+        snapshot = CoarseFundamentalSnapshot(coarse, True)
         # sort descending by daily dollar volume
-        sortedByDollarVolume = sorted(selected, key=lambda x: x.DollarVolume, reverse=True)
+        sortedByDollarVolume = FundamentalUniverseSelectionModel.GetLargestIndices(snapshot.DollarVolume, self.numberOfSymbols)
 
         # return the symbol objects of the top entries from our sorted collection
-        return [ x.Symbol for x in sortedByDollarVolume[:self.numberOfSymbols] if not (x.Symbol in self._blackList) ]
+        return [ symbol for symbol in snapshot.GetSymbols(sortedByDollarVolume) if not (symbol in self._blackList) ]
 
     def OnData(self, slice):
         if slice.HasData:
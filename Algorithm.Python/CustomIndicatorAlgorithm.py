@@ -12,7 +12,6 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from collections import deque
 
 ### <summary>
 ### Demonstrates how to create a custom indicator and register it for automatic updated
@@ -64,11 +63,16 @@ class CustomSimpleMovingAverage(PythonIndicator):
         super().__init__()
         self.Name = name
         self.Value = 0
-        self.queue = deque(maxlen=period)
+        self.window = RollingStatistics(period)
 
     # Update method is mandatory
     def Update(self, input):
-        self.queue.appendleft(input.Value)
-        count = len(self.queue)
-        self.Value = np.sum(self.queue) / count
-        return count == self.queue.maxlen
+        self.window.Update(input.Value)
+        self.Value = self.window.Mean
+        return self.window.IsReady
+
+    # UpdateBatch method is optional, it's called with NumPy arrays of the times and values to warm up the indicator in a single call
+    def UpdateBatch(self, times, values):
+        self.window.UpdateBatch(values)
+        self.Value = self.window.Mean
+        return self.window.IsReady
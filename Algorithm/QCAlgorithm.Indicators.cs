@@ -2438,6 +2438,15 @@ namespace QuantConnect.Algorithm
             // assign default using cast
             selector ??= (x => (T)x);
 
+            if (indicator is PythonIndicator { ImplementsUpdateBatch: true } pythonIndicator)
+            {
+                // the consolidated bars are sent to python in a single call
+                var inputs = new List<IBaseData>();
+                WarmUpIndicatorImpl(symbol, period, (T bar) => inputs.Add(selector(bar)), history, identityConsolidator);
+                pythonIndicator.UpdateBatch(inputs);
+                return;
+            }
+
             // we expect T type as input
             Action<T> onDataConsolidated = bar =>
             {
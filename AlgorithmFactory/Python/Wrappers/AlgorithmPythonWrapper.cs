@@ -638,7 +638,7 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         {
             if (_onData != null)
             {
-                using (Py.GIL())
+                using (PythonGilSession.Callback(nameof(OnData)))
                 {
                     _onData(new PythonSlice(slice));
                 }
@@ -778,7 +778,7 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         /// <param name="newEvent">Event information</param>
         public void OnOrderEvent(OrderEvent newEvent)
         {
-            using (Py.GIL())
+            using (PythonGilSession.Callback(nameof(OnOrderEvent)))
             {
                 _onOrderEvent(newEvent);
             }
@@ -814,7 +814,7 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         /// <param name="changes">Security additions/removals for this time step</param>
         public void OnSecuritiesChanged(SecurityChanges changes)
         {
-            using (Py.GIL())
+            using (PythonGilSession.Callback(nameof(OnSecuritiesChanged)))
             {
                 _algorithm.OnSecuritiesChanged(changes);
             }
@@ -826,7 +826,7 @@ namespace QuantConnect.AlgorithmFactory.Python.Wrappers
         /// <param name="changes">Security additions/removals for this time step</param>
         public void OnFrameworkSecuritiesChanged(SecurityChanges changes)
         {
-            using (Py.GIL())
+            using (PythonGilSession.Callback(nameof(OnFrameworkSecuritiesChanged)))
             {
                 _algorithm.OnFrameworkSecuritiesChanged(changes);
             }
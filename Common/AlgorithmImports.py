@@ -13,6 +13,7 @@
 
 import os
 import sys
+import json
 
 # The runtimeconfig.json is stored alongside start.py, but start.py may be a
 # symlink and the directory start.py is stored in is not necessarily the
@@ -28,71 +29,196 @@ for file in os.listdir(path):
     if file.endswith(".dll") and file.startswith("QuantConnect."):
         AddReference(file.replace(".dll", ""))
 
-from System import *
-from System.Drawing import *
-
-from QuantConnect import *
-from QuantConnect.Api import *
-from QuantConnect.Util import *
-from QuantConnect.Data import *
-from QuantConnect.Orders import *
-from QuantConnect.Python import *
-from QuantConnect.Storage import *
-from QuantConnect.Research import *
-from QuantConnect.Algorithm import *
-from QuantConnect.Statistics import *
-from QuantConnect.Parameters import *
-from QuantConnect.Benchmarks import *
-from QuantConnect.Brokerages import *
-from QuantConnect.Securities import *
-from QuantConnect.Indicators import *
-from QuantConnect.Interfaces import *
-from QuantConnect.Scheduling import *
-from QuantConnect.DataSource import *
-from QuantConnect.Orders.Fees import *
-from QuantConnect.Data.Custom import *
-from QuantConnect.Data.Market import *
-from QuantConnect.Lean.Engine import *
-from QuantConnect.Orders.Fills import *
-from QuantConnect.Configuration import *
-from QuantConnect.Notifications import *
-from QuantConnect.Data.Auxiliary import *
-from QuantConnect.Data.Shortable import *
-from QuantConnect.Orders.Slippage import *
-from QuantConnect.Securities.Forex import *
-from QuantConnect.Data.Fundamental import *
-from QuantConnect.Securities.Crypto import *
-from QuantConnect.Securities.Option import *
-from QuantConnect.Securities.Equity import *
-from QuantConnect.Securities.Future import *
-from QuantConnect.Data.Consolidators import *
-from QuantConnect.Orders.TimeInForces import *
-from QuantConnect.Algorithm.Framework import *
-from QuantConnect.Orders.OptionExercise import *
-from QuantConnect.Securities.Volatility import *
-from QuantConnect.Securities.Interfaces import *
-from QuantConnect.Data.UniverseSelection import *
-from QuantConnect.Data.Custom.IconicTypes import *
-from QuantConnect.Securities.CryptoFuture import *
-from QuantConnect.Data.Custom.AlphaStreams import *
-from QuantConnect.Algorithm.Framework.Risk import *
-from QuantConnect.Algorithm.Framework.Alphas import *
-from QuantConnect.Algorithm.Framework.Execution import *
-from QuantConnect.Algorithm.Framework.Portfolio import *
-from QuantConnect.Algorithm.Framework.Portfolio.SignalExports import *
-from QuantConnect.Algorithm.Framework.Selection import *
+# The lazy mode, enabled by the 'python-lazy-algorithm-imports' configuration, skips the star imports of the namespaces below.
+# The names are resolved on first use from an index of the namespace of each name, which is built by an eager import and
+# persisted alongside this file until the assemblies or this file change. A star import of this module only binds the names
+# referenced by the code of the importing module, so names only used dynamically, e.g. by eval, have to be imported explicitly.
+# For the same reason the lazy mode is not suited to Research notebooks: a star import in a cell only binds the names used by
+# that cell, and using another name in a later cell raises NameError.
+# The importing module gets a __getattr__ resolving the same names, so a star import of it re-exports them
+_indexPath = os.path.join(path, "AlgorithmImports.index.json")
+_lazyModules = { "plt": "matplotlib.pyplot" }
+_aliases = { "QCAlgorithmFramework": "QCAlgorithm", "QCAlgorithmFrameworkBridge": "QCAlgorithm" }
+
+def _get_build():
+    '''Gets the name, size and modification time of the QuantConnect assemblies and the hash of this file, which identify the build of the index'''
+    import hashlib
+    with open(__file__, "rb") as sourceFile:
+        source = hashlib.md5(sourceFile.read()).hexdigest()
+    assemblies = sorted([[x, os.path.getsize(os.path.join(path, x)), int(os.path.getmtime(os.path.join(path, x)))]
+                         for x in os.listdir(path) if x.endswith(".dll") and x.startswith("QuantConnect.")])
+    return { "source": source, "assemblies": assemblies }
+
+def _load_index():
+    '''Loads the persisted index of the namespace of each name, None if it's missing or was built for another build'''
+    try:
+        with open(_indexPath) as indexFile:
+            index = json.load(indexFile)
+        if index.get("build") == _get_build():
+            return index["names"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+def _save_index():
+    '''Builds the index of the namespace of each name bound by the star imports of this file and persists it'''
+    import re
+    with open(__file__) as sourceFile:
+        namespaces = re.findall(r"^\s*from ((?:System|QuantConnect)\S*) import \*$", sourceFile.read(), re.MULTILINE)
+    names = {}
+    for namespace in namespaces:
+        # the last star import binding a name wins, as in the eager import
+        bound = {}
+        exec(f"from {namespace} import *", bound)
+        names.update({ name: namespace for name in bound if name != "__builtins__" })
+    try:
+        temporaryPath = f"{_indexPath}.{os.getpid()}"
+        with open(temporaryPath, "w") as indexFile:
+            json.dump({ "build": _get_build(), "names": names }, indexFile)
+        os.replace(temporaryPath, _indexPath)
+    except OSError:
+        # the folder can be read only, the index will be built again by the next lazy import
+        pass
+
+def _get_referenced_names(code):
+    '''Gets the global and attribute names referenced by the code object and its nested functions and classes'''
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if hasattr(constant, "co_names"):
+            names.update(_get_referenced_names(constant))
+    return names
+
+from QuantConnect.Configuration import Config
+_lazy = Config.GetBool("python-lazy-algorithm-imports")
+_index = _load_index() if _lazy else None
+
+def _is_lazy_name(name):
+    return name in _index or name in _lazyModules or name in _aliases
+
+def _resolve(name):
+    '''Resolves a name of the lazy mode, raising AttributeError if it isn't one'''
+    if name in _lazyModules:
+        import importlib
+        value = importlib.import_module(_lazyModules[name])
+    elif name in _aliases:
+        value = _resolve(_aliases[name])
+    elif name in _index:
+        value = getattr(__import__(_index[name], fromlist=[name]), name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
+
+def _get_star_import_names(moduleGlobals):
+    '''Gets the names bound by a star import of this module, or of a module that star imported it, called by their __getattr__.
+    These are the public names of the module and the names of the lazy mode referenced by the code of the importing module,
+    which gets a __getattr__ resolving the names of the lazy mode too, unless it has its own'''
+    frame = sys._getframe(2)
+    importerGlobals = frame.f_globals
+    if "__getattr__" not in importerGlobals and "__all__" not in importerGlobals:
+        importerGlobals["__getattr__"] = _get_reexport_getattr(importerGlobals)
+
+    referencedNames = _get_referenced_names(frame.f_code)
+    return [x for x in moduleGlobals if not x.startswith("_")] + \
+        [x for x in referencedNames if x not in moduleGlobals and _is_lazy_name(x)]
+
+def _get_reexport_getattr(moduleGlobals):
+    '''Gets the __getattr__ of a module that star imported this module, so its star imports re-export the names of the lazy mode'''
+    def __getattr__(name):
+        if name == "__all__":
+            return _get_star_import_names(moduleGlobals)
+        try:
+            return _resolve(name)
+        except AttributeError:
+            raise AttributeError(f"module '{moduleGlobals.get('__name__')}' has no attribute '{name}'") from None
+    return __getattr__
+
+def __getattr__(name):
+    '''Resolves the names of the lazy mode on first use'''
+    if _index is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    if name == "__all__":
+        # called by a star import from the frame of the importing module
+        return _get_star_import_names(globals())
+    return _resolve(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(_index or []) | set(_lazyModules) | set(_aliases))
+
+if _index is None:
+    from System import *
+    from System.Drawing import *
+    from QuantConnect import *
+    from QuantConnect.Api import *
+    from QuantConnect.Util import *
+    from QuantConnect.Data import *
+    from QuantConnect.Orders import *
+    from QuantConnect.Python import *
+    from QuantConnect.Storage import *
+    from QuantConnect.Research import *
+    from QuantConnect.Algorithm import *
+    from QuantConnect.Statistics import *
+    from QuantConnect.Parameters import *
+    from QuantConnect.Benchmarks import *
+    from QuantConnect.Brokerages import *
+    from QuantConnect.Securities import *
+    from QuantConnect.Indicators import *
+    from QuantConnect.Interfaces import *
+    from QuantConnect.Scheduling import *
+    from QuantConnect.DataSource import *
+    from QuantConnect.Orders.Fees import *
+    from QuantConnect.Data.Custom import *
+    from QuantConnect.Data.Market import *
+    from QuantConnect.Lean.Engine import *
+    from QuantConnect.Orders.Fills import *
+    from QuantConnect.Configuration import *
+    from QuantConnect.Notifications import *
+    from QuantConnect.Data.Auxiliary import *
+    from QuantConnect.Data.Shortable import *
+    from QuantConnect.Orders.Slippage import *
+    from QuantConnect.Securities.Forex import *
+    from QuantConnect.Data.Fundamental import *
+    from QuantConnect.Securities.Crypto import *
+    from QuantConnect.Securities.Option import *
+    from QuantConnect.Securities.Equity import *
+    from QuantConnect.Securities.Future import *
+    from QuantConnect.Data.Consolidators import *
+    from QuantConnect.Orders.TimeInForces import *
+    from QuantConnect.Algorithm.Framework import *
+    from QuantConnect.Orders.OptionExercise import *
+    from QuantConnect.Securities.Volatility import *
+    from QuantConnect.Securities.Interfaces import *
+    from QuantConnect.Data.UniverseSelection import *
+    from QuantConnect.Data.Custom.IconicTypes import *
+    from QuantConnect.Securities.CryptoFuture import *
+    from QuantConnect.Data.Custom.AlphaStreams import *
+    from QuantConnect.Algorithm.Framework.Risk import *
+    from QuantConnect.Algorithm.Framework.Alphas import *
+    from QuantConnect.Algorithm.Framework.Execution import *
+    from QuantConnect.Algorithm.Framework.Portfolio import *
+    from QuantConnect.Algorithm.Framework.Portfolio.SignalExports import *
+    from QuantConnect.Algorithm.Framework.Selection import *
 
 try:
     import numpy as np
     import pandas as pd
-    import matplotlib.pyplot as plt
+    if _index is None:
+        import matplotlib.pyplot as plt
 except:
     pass
 
 from datetime import date, time, datetime, timedelta
 from typing import *
 import math
-import json
 
-QCAlgorithmFramework = QCAlgorithm
-QCAlgorithmFrameworkBridge = QCAlgorithm
+from RollingStatistics import RollingStatistics
+
+if _index is None:
+    QCAlgorithmFramework = QCAlgorithm
+    QCAlgorithmFrameworkBridge = QCAlgorithm
+
+    if _lazy:
+        # cold start of the lazy mode, the next imports will use the index
+        _save_index()
@@ -56,6 +56,12 @@ namespace QuantConnect.Data
         /// <summary>
         /// Our own custom data  (6)
         /// </summary>
-        CustomData
+        CustomData,
+
+        /// <summary>
+        /// Python custom data parsed at once, the ReaderColumnar method receives the whole content of the source
+        /// and returns the data in columns. The parsed columns are cached on disk in backtesting (7)
+        /// </summary>
+        Columnar
     }
 }
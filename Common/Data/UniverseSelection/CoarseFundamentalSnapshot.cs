@@ -0,0 +1,160 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System.Collections.Generic;
+using System.Linq;
+using Python.Runtime;
+using QuantConnect.Python;
+
+namespace QuantConnect.Data.UniverseSelection
+{
+    /// <summary>
+    /// Columnar snapshot of the coarse fundamental universe of a day for vectorized selection in Python.
+    /// The values of the <see cref="CoarseFundamental"/> objects are read in a single pass and exposed as NumPy arrays,
+    /// so the selectors filter and rank them without accessing each object through pythonnet.
+    /// The rows are identified by their position, which <see cref="GetSymbols"/> maps back to the symbols
+    /// </summary>
+    public class CoarseFundamentalSnapshot
+    {
+        private static PyObject _dataFrameFactory;
+
+        private readonly Symbol[] _symbols;
+        private PyObject _symbolIds;
+
+        /// <summary>
+        /// Gets the number of rows of the snapshot
+        /// </summary>
+        public int Count => _symbols.Length;
+
+        /// <summary>
+        /// Gets the symbols of the rows
+        /// </summary>
+        public IReadOnlyList<Symbol> Symbols => _symbols;
+
+        /// <summary>
+        /// Gets the Python list of the <see cref="SecurityIdentifier"/> strings of the symbols, which can be used as keys of
+        /// the state of a selector across days without accessing the symbols
+        /// </summary>
+        public PyObject SymbolIds
+        {
+            get
+            {
+                if (_symbolIds == null)
+                {
+                    using (Py.GIL())
+                    {
+                        _symbolIds = _symbols.Select(x => x.ID.ToString()).ToPyList();
+                    }
+                }
+                return _symbolIds;
+            }
+        }
+
+        /// <summary>
+        /// Gets the NumPy float64 array of the raw prices
+        /// </summary>
+        public PyObject Price { get; }
+
+        /// <summary>
+        /// Gets the NumPy float64 array of the split and dividend adjusted prices
+        /// </summary>
+        public PyObject AdjustedPrice { get; }
+
+        /// <summary>
+        /// Gets the NumPy float64 array of the day's total volumes
+        /// </summary>
+        public PyObject Volume { get; }
+
+        /// <summary>
+        /// Gets the NumPy float64 array of the day's dollar volumes
+        /// </summary>
+        public PyObject DollarVolume { get; }
+
+        /// <summary>
+        /// Gets the NumPy bool array of whether the symbols have fundamental data
+        /// </summary>
+        public PyObject HasFundamentalData { get; }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="CoarseFundamentalSnapshot"/> class
+        /// </summary>
+        /// <param name="coarse">The coarse fundamental data of the universe</param>
+        /// <param name="hasFundamentalDataOnly">True to exclude the symbols without fundamental data</param>
+        public CoarseFundamentalSnapshot(IEnumerable<CoarseFundamental> coarse, bool hasFundamentalDataOnly = false)
+        {
+            var data = hasFundamentalDataOnly ? coarse.Where(x => x.HasFundamentalData).ToList() : coarse.ToList();
+
+            _symbols = new Symbol[data.Count];
+            var price = new double[data.Count];
+            var adjustedPrice = new double[data.Count];
+            var volume = new double[data.Count];
+            var dollarVolume = new double[data.Count];
+            var hasFundamentalData = new byte[data.Count];
+
+            for (var i = 0; i < data.Count; i++)
+            {
+                var x = data[i];
+                _symbols[i] = x.Symbol;
+                price[i] = (double)x.Price;
+                adjustedPrice[i] = (double)x.AdjustedPrice;
+                volume[i] = x.Volume;
+                dollarVolume[i] = (double)x.DollarVolume;
+                hasFundamentalData[i] = x.HasFundamentalData ? (byte)1 : (byte)0;
+            }
+
+            using (Py.GIL())
+            {
+                Price = PandasColumnarData.ToNumpy(price);
+                AdjustedPrice = PandasColumnarData.ToNumpy(adjustedPrice);
+                Volume = PandasColumnarData.ToNumpy(volume);
+                DollarVolume = PandasColumnarData.ToNumpy(dollarVolume);
+                HasFundamentalData = PandasColumnarData.ToNumpy(hasFundamentalData, "bool");
+            }
+        }
+
+        /// <summary>
+        /// Gets the symbols of the rows at the given positions
+        /// </summary>
+        /// <param name="indices">NumPy array or sequence of the row positions, like the result of numpy.argpartition</param>
+        /// <returns>The symbols in the order of the positions</returns>
+        public Symbol[] GetSymbols(PyObject indices)
+        {
+            return PandasColumnarData.ToLongArray(indices).Select(x => _symbols[x]).ToArray();
+        }
+
+        /// <summary>
+        /// Gets the snapshot as a pandas.DataFrame indexed by the symbol ids
+        /// </summary>
+        /// <returns>pandas.DataFrame object with the price, adjustedprice, volume, dollarvolume and hasfundamentaldata columns</returns>
+        public PyObject GetDataFrame()
+        {
+            using (Py.GIL())
+            {
+                // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
+                _dataFrameFactory ??= Py.Import("PandasMapper").GetAttr("DataFrame");
+
+                using var pyDict = new PyDict();
+                pyDict.SetItem("price", Price);
+                pyDict.SetItem("adjustedprice", AdjustedPrice);
+                pyDict.SetItem("volume", Volume);
+                pyDict.SetItem("dollarvolume", DollarVolume);
+                pyDict.SetItem("hasfundamentaldata", HasFundamentalData);
+
+                using var dataFrameKwargs = Py.kw("index", SymbolIds);
+                return _dataFrameFactory.Invoke(new PyObject[] { pyDict }, dataFrameKwargs);
+            }
+        }
+    }
+}
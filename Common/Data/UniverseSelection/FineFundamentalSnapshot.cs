@@ -0,0 +1,225 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Reflection;
+using Python.Runtime;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Python;
+
+namespace QuantConnect.Data.UniverseSelection
+{
+    /// <summary>
+    /// Columnar snapshot of the requested fields of the fine fundamental universe of a day for vectorized selection in Python.
+    /// Only the requested property paths, like CompanyReference.CountryId, are read from the <see cref="FineFundamental"/> objects.
+    /// Numeric fields become float64 columns, dates datetime64[ns] columns, strings categorical columns and flags bool columns
+    /// </summary>
+    public class FineFundamentalSnapshot
+    {
+        private static readonly ConcurrentDictionary<string, PropertyInfo[]> _propertiesByField = new();
+        private static readonly long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
+
+        // The range of datetime64[ns], dates outside of it are clamped
+        private static readonly long _minTicks = _unixEpochTicks + long.MinValue / 100 + 1;
+        private static readonly long _maxTicks = _unixEpochTicks + long.MaxValue / 100;
+
+        private static PyObject _dataFrameFactory;
+        private static PyObject _categoricalFactory;
+
+        private readonly Symbol[] _symbols;
+        private readonly string[] _fields;
+        private readonly Array[] _columns;
+        private PyObject _symbolIds;
+
+        /// <summary>
+        /// Gets the number of rows of the snapshot
+        /// </summary>
+        public int Count => _symbols.Length;
+
+        /// <summary>
+        /// Gets the symbols of the rows
+        /// </summary>
+        public IReadOnlyList<Symbol> Symbols => _symbols;
+
+        /// <summary>
+        /// Gets the Python list of the <see cref="SecurityIdentifier"/> strings of the symbols
+        /// </summary>
+        public PyObject SymbolIds
+        {
+            get
+            {
+                if (_symbolIds == null)
+                {
+                    using (Py.GIL())
+                    {
+                        _symbolIds = _symbols.Select(x => x.ID.ToString()).ToPyList();
+                    }
+                }
+                return _symbolIds;
+            }
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="FineFundamentalSnapshot"/> class
+        /// </summary>
+        /// <param name="fine">The fine fundamental data of the universe</param>
+        /// <param name="fields">The property paths of the fields to read, like CompanyReference.IndustryTemplateCode or MarketCap</param>
+        public FineFundamentalSnapshot(IEnumerable<FineFundamental> fine, string[] fields)
+        {
+            var data = fine.ToList();
+            _symbols = data.Select(x => x.Symbol).ToArray();
+            _fields = fields;
+            _columns = fields.Select(field => ReadColumn(data, _propertiesByField.GetOrAdd(field, GetProperties))).ToArray();
+        }
+
+        /// <summary>
+        /// Gets the symbols of the rows at the given positions
+        /// </summary>
+        /// <param name="indices">NumPy array or sequence of the row positions</param>
+        /// <returns>The symbols in the order of the positions</returns>
+        public Symbol[] GetSymbols(PyObject indices)
+        {
+            return PandasColumnarData.ToLongArray(indices).Select(x => _symbols[x]).ToArray();
+        }
+
+        /// <summary>
+        /// Gets the snapshot as a pandas.DataFrame indexed by the symbol ids, with a column per field named by its property path
+        /// </summary>
+        /// <returns>pandas.DataFrame object</returns>
+        public PyObject GetDataFrame()
+        {
+            using (Py.GIL())
+            {
+                if (_dataFrameFactory == null)
+                {
+                    // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
+                    _dataFrameFactory = Py.Import("PandasMapper").GetAttr("DataFrame");
+                    _categoricalFactory = Py.Import("pandas").GetAttr("Categorical");
+                }
+
+                using var pyDict = new PyDict();
+                for (var i = 0; i < _fields.Length; i++)
+                {
+                    using var column = ToPython(_columns[i]);
+                    pyDict.SetItem(_fields[i], column);
+                }
+
+                using var dataFrameKwargs = Py.kw("index", SymbolIds);
+                return _dataFrameFactory.Invoke(new PyObject[] { pyDict }, dataFrameKwargs);
+            }
+        }
+
+        /// <summary>
+        /// Reads the values of a field of all the rows in a typed array
+        /// </summary>
+        private static Array ReadColumn(List<FineFundamental> data, PropertyInfo[] properties)
+        {
+            var type = properties[^1].PropertyType;
+            type = Nullable.GetUnderlyingType(type) ?? type;
+
+            if (type == typeof(string))
+            {
+                return data.Select(x => (string)GetValue(x, properties)).ToArray();
+            }
+            if (type == typeof(DateTime))
+            {
+                return data.Select(x => GetValue(x, properties) is DateTime time
+                    ? Math.Clamp(time.Ticks, _minTicks, _maxTicks) - _unixEpochTicks
+                    : long.MinValue).ToArray();
+            }
+            if (type == typeof(bool))
+            {
+                return data.Select(x => GetValue(x, properties) is true ? (byte)1 : (byte)0).ToArray();
+            }
+            return data.Select(x => GetValue(x, properties) switch
+            {
+                null => double.NaN,
+                MultiPeriodField field => (double)field.Value,
+                var value => Convert.ToDouble(value)
+            }).ToArray();
+        }
+
+        /// <summary>
+        /// Converts a column to a NumPy array, or a pandas.Categorical for the strings
+        /// </summary>
+        private static PyObject ToPython(Array column)
+        {
+            switch (column)
+            {
+                case string[] strings:
+                    // The categories are sorted so sorting by the codes sorts by the strings
+                    var categories = strings.Where(x => x != null).Distinct().OrderBy(x => x, StringComparer.Ordinal).ToArray();
+                    var codes = strings.Select(x => x == null ? -1 : Array.BinarySearch(categories, x, StringComparer.Ordinal)).ToArray();
+                    using (var pyCodes = PandasColumnarData.ToNumpy(codes))
+                    using (var pyCategories = categories.ToPyList())
+                    {
+                        return _categoricalFactory.InvokeMethod("from_codes", pyCodes, pyCategories);
+                    }
+                case long[] times:
+                    return PandasColumnarData.ToNumpy(times, "datetime64[ns]");
+                case byte[] flags:
+                    return PandasColumnarData.ToNumpy(flags, "bool");
+                default:
+                    return PandasColumnarData.ToNumpy((double[])column);
+            }
+        }
+
+        /// <summary>
+        /// Gets the value of the property path, null if an object of the path is null
+        /// </summary>
+        private static object GetValue(object value, PropertyInfo[] properties)
+        {
+            foreach (var property in properties)
+            {
+                if (value == null)
+                {
+                    return null;
+                }
+                value = property.GetValue(value);
+            }
+            return value;
+        }
+
+        /// <summary>
+        /// Resolves the properties of a path of the <see cref="FineFundamental"/> class
+        /// </summary>
+        private static PropertyInfo[] GetProperties(string field)
+        {
+            var type = typeof(FineFundamental);
+            var properties = new List<PropertyInfo>();
+            foreach (var name in field.Split('.'))
+            {
+                var property = type.GetProperty(name, BindingFlags.Public | BindingFlags.Instance);
+                if (property == null)
+                {
+                    throw new ArgumentException($"FineFundamentalSnapshot.ctor(): {type.Name} has no {name} property in {field}");
+                }
+                properties.Add(property);
+                type = property.PropertyType;
+            }
+
+            type = Nullable.GetUnderlyingType(type) ?? type;
+            if (type != typeof(string) && type != typeof(DateTime) && type != typeof(bool)
+                && !typeof(MultiPeriodField).IsAssignableFrom(type) && !(type.IsPrimitive || type == typeof(decimal)))
+            {
+                throw new ArgumentException($"FineFundamentalSnapshot.ctor(): {field} of type {type.Name} is not a number, date, string or flag");
+            }
+            return properties.ToArray();
+        }
+    }
+}
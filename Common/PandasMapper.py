@@ -19,33 +19,84 @@ Allowing support for indexing of Lean created Indexes with tickers like "SPY", S
 '''
 
 import pandas as pd
+from functools import lru_cache
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
 AddReference("QuantConnect.Common")
 from QuantConnect import *
 
-def mapper(key):
+# Column names of Lean dataframes that are never mapped
+reserved = frozenset(['high', 'low', 'open', 'close'])
+
+# Types of the arguments that can contain a key to map
+mappable = frozenset([Symbol, str, list, tuple, dict])
+
+@lru_cache(maxsize = 4096)
+def map_ticker(ticker, version):
+    '''Maps a ticker to the string representation of the Symbol SecurityIdentifier, or returns the ticker if it cannot map it.
+    The result is memoized by SymbolCache version, so it is only requested from the SymbolCache again after any of its mappings change
+    '''
+    kvp = SymbolCache.TryGetSymbol(ticker, None)
+    return str(kvp[1].ID) if kvp[0] else ticker
+
+def mapper(key, version = None):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
     Symbol SecurityIdentifier.If cannot map, returns the object
     '''
+    return map_key(key, [] if version is None else [version])[0]
+
+def map_key(key, version):
+    '''Maps a key like mapper does
+    Args:
+        key: The key to map
+        version: List with the SymbolCache version. It is read on the first ticker that needs it, once per call
+    Returns:
+        Tuple of the mapped key and whether it is different from the original key'''
     keyType = type(key)
     if keyType is Symbol:
-        return str(key.ID)
+        return str(key.ID), True
     if keyType is str:
-        reserved = ['high', 'low', 'open', 'close']
         if key in reserved:
-            return key
-        kvp = SymbolCache.TryGetSymbol(key, None)
-        if kvp[0]:
-            return str(kvp[1].ID)
-    if keyType is list:
-        return [mapper(x) for x in key]
-    if keyType is tuple:
-        return tuple([mapper(x) for x in key])
+            return key, False
+        if not version:
+            version.append(SymbolCache.Version)
+        mapped = map_ticker(key, version[0])
+        return mapped, mapped != key
+    if keyType is list or keyType is tuple:
+        items = [map_key(x, version) for x in key]
+        if not any(changed for _, changed in items):
+            return key, False
+        mapped = [x for x, _ in items]
+        return (mapped if keyType is list else tuple(mapped)), True
     if keyType is dict:
-        return { k: mapper(v) for k, v in key.items()}
-    return key
+        items = { k: map_key(v, version) for k, v in key.items() }
+        if not any(changed for _, changed in items.values()):
+            return key, False
+        return { k: v for k, (v, _) in items.items() }, True
+    return key, False
+
+def map_arguments(args, kwargs):
+    '''Maps the keys of the arguments of a wrapped function. The first argument is the instance
+    (DataFrame, Index, indexer) so it is never mapped, neither are the arguments that cannot hold a key
+    Returns:
+        Tuple of the mapped args, the mapped kwargs and whether any of them changed'''
+    version = []
+    changed = False
+    newargs = args
+    newkwargs = kwargs
+
+    if len(args) > 1 and any(type(x) in mappable for x in args[1:]):
+        mapped, changed = map_key(args[1:], version)
+        if changed:
+            newargs = (args[0],) + mapped
+    if len(kwargs) > 0 and any(type(x) in mappable for x in kwargs.values()):
+        mapped, kwchanged = map_key(kwargs, version)
+        if kwchanged:
+            newkwargs = mapped
+            changed = True
+
+    return newargs, newkwargs, changed
 
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
@@ -54,28 +105,24 @@ def wrap_keyerror_function(f):
     '''
     def wrapped_function(*args, **kwargs):
         # Map args & kwargs and execute function
+        newargs, newkwargs, changed = map_arguments(args, kwargs)
         try:
-            newargs = args
-            newkwargs = kwargs
-
-            if len(args) > 1:
-                newargs = mapper(args)
-            if len(kwargs) > 0:
-                newkwargs = mapper(kwargs)
-
             return f(*newargs, **newkwargs)
         except KeyError as e:
             mKey = [arg for arg in newargs if isinstance(arg, str)]
 
-        # Execute original
+        # Execute original, unless it is the call that just failed
         # Allows for df, Series, etc indexing for keys like 'SPY' if they exist
         try:
-            return f(*args, **kwargs)
+            if changed:
+                return f(*args, **kwargs)
         except KeyError as e:
-            oKey = [arg for arg in args if isinstance(arg, str)]
-            raise KeyError(f"No key found for either mapped or original key. Mapped Key: {mKey}; Original Key: {oKey}")
+            pass
+        oKey = [arg for arg in args if isinstance(arg, str)]
+        raise KeyError(f"No key found for either mapped or original key. Mapped Key: {mKey}; Original Key: {oKey}")
 
     wrapped_function.__name__ = f.__name__
+    wrapped_function.__wrapped__ = f
     return wrapped_function
 
 def wrap_bool_function(f):
@@ -90,18 +137,15 @@ def wrap_bool_function(f):
         if originalResult:
             return originalResult
 
-        # Try our mapped args; return this result regardless
-        newargs = args
-        newkwargs = kwargs
-
-        if len(args) > 1:
-            newargs = mapper(args)
-        if len(kwargs) > 0:
-            newkwargs = mapper(kwargs)
+        # Try our mapped args, if any of them maps; return this result regardless
+        newargs, newkwargs, changed = map_arguments(args, kwargs)
+        if not changed:
+            return originalResult
 
         return f(*newargs, **newkwargs)
 
     wrapped_function.__name__ = f.__name__
+    wrapped_function.__wrapped__ = f
     return wrapped_function
 
 
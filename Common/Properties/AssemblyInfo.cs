@@ -19,5 +19,6 @@ using System.Runtime.InteropServices;
 
 [assembly: InternalsVisibleTo("QuantConnect.Algorithm.Framework")]
 [assembly: InternalsVisibleTo("QuantConnect.Brokerages")]
+[assembly: InternalsVisibleTo("QuantConnect.Indicators")]
 [assembly: InternalsVisibleTo("QuantConnect.Lean.Engine")]
 [assembly: InternalsVisibleTo("QuantConnect.Tests")]
\ No newline at end of file
@@ -25,6 +25,7 @@ namespace QuantConnect.Python
     /// </summary>
     public class DataConsolidatorPythonWrapper : IDataConsolidator
     {
+        private const string ConsolidatorCallback = "Consolidator";
         private readonly dynamic _consolidator;
 
         /// <summary>
@@ -95,7 +96,7 @@ namespace QuantConnect.Python
         /// <param name="currentLocalTime">The current time in the local time zone (same as <see cref="BaseData.Time"/>)</param>
         public void Scan(DateTime currentLocalTime)
         {
-            using (Py.GIL())
+            using (PythonGilSession.Callback(ConsolidatorCallback))
             {
                 _consolidator.Scan(currentLocalTime);
             }
@@ -107,7 +108,7 @@ namespace QuantConnect.Python
         /// <param name="data">The new data for the consolidator</param>
         public void Update(IBaseData data)
         {
-            using (Py.GIL())
+            using (PythonGilSession.Callback(ConsolidatorCallback))
             {
                 _consolidator.Update(data);
             }
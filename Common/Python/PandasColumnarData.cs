@@ -0,0 +1,443 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Util;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.InteropServices;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Organizes the trade and quote bars of many symbols in contiguous typed columns to create a single pandas.DataFrame.
+    /// The columns are copied to NumPy arrays in a single call each, instead of creating a pandas.Series per column and
+    /// symbol and concatenating a data frame per symbol like <see cref="PandasData"/> does
+    /// </summary>
+    /// <remarks>Ticks, custom data and securities with more than two index levels (futures and options) are not supported</remarks>
+    public class PandasColumnarData
+    {
+        private static PyObject _numpy;
+        private static PyObject _toDatetime;
+        private static PyObject _indexFactory;
+        private static PyObject _dataFrameFactory;
+        private static PyObject _multiIndexFactory;
+        private static PyList _names;
+
+        // The data frame columns, sorted by name like the concatenation of the PandasData data frames
+        private static readonly string[] _columns =
+        {
+            "askclose", "askhigh", "asklow", "askopen", "asksize",
+            "bidclose", "bidhigh", "bidlow", "bidopen", "bidsize",
+            "close", "high", "low", "open", "volume"
+        };
+
+        private const int AskClose = 0, AskHigh = 1, AskLow = 2, AskOpen = 3, AskSize = 4;
+        private const int BidClose = 5, BidHigh = 6, BidLow = 7, BidOpen = 8, BidSize = 9;
+        private const int Close = 10, High = 11, Low = 12, Open = 13, Volume = 14;
+
+        private static readonly long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
+
+        private readonly Type _dataType;
+        private readonly Dictionary<Symbol, SymbolColumns> _data = new();
+
+        /// <summary>
+        /// Gets the number of rows of the data frame
+        /// </summary>
+        public int Count { get; private set; }
+
+        /// <summary>
+        /// Initializes an instance of <see cref="PandasColumnarData"/>
+        /// </summary>
+        /// <param name="dataType">Optional type of bars to add to the data frame: <see cref="TradeBar"/> or <see cref="QuoteBar"/></param>
+        public PandasColumnarData(Type dataType = null)
+        {
+            if (!IsSupported(dataType))
+            {
+                throw new ArgumentException($"PandasColumnarData.ctor(): {dataType} is not supported");
+            }
+
+            if (_dataFrameFactory == null)
+            {
+                using (Py.GIL())
+                {
+                    _numpy ??= Py.Import("numpy");
+                    // Use our PandasMapper class that modifies pandas indexing to support tickers, symbols and SIDs
+                    var pandas = Py.Import("PandasMapper");
+                    _indexFactory = pandas.GetAttr("Index");
+                    _dataFrameFactory = pandas.GetAttr("DataFrame");
+                    _multiIndexFactory = pandas.GetAttr("MultiIndex");
+                    _names = new PyList(new PyObject[] { new PyString("symbol"), new PyString("time") });
+                }
+            }
+
+            _dataType = dataType;
+        }
+
+        /// <summary>
+        /// Determines whether the data type can be organized in columns
+        /// </summary>
+        /// <param name="dataType">Optional type of bars to add to the data frame</param>
+        /// <returns>True for all the data of the slices and for trade and quote bars</returns>
+        public static bool IsSupported(Type dataType)
+        {
+            return dataType == null || dataType == typeof(TradeBar) || dataType == typeof(QuoteBar);
+        }
+
+        /// <summary>
+        /// Adds the bars of the slice to the columns
+        /// </summary>
+        /// <param name="slice">The slice to add</param>
+        /// <returns>False if the slice has data that cannot be organized in columns, in which case the
+        /// <see cref="PandasData"/> conversion should be used</returns>
+        public bool TryAdd(Slice slice)
+        {
+            if (_dataType == typeof(TradeBar))
+            {
+                foreach (var kvp in slice.Bars)
+                {
+                    if (!TryAdd(kvp.Key, kvp.Value, kvp.Value, null)) return false;
+                }
+                return true;
+            }
+
+            if (_dataType == typeof(QuoteBar))
+            {
+                foreach (var kvp in slice.QuoteBars)
+                {
+                    if (!TryAdd(kvp.Key, kvp.Value, null, kvp.Value)) return false;
+                }
+                return true;
+            }
+
+            foreach (var symbol in slice.Keys)
+            {
+                if (slice.Ticks.ContainsKey(symbol)) return false;
+
+                slice.Bars.TryGetValue(symbol, out var tradeBar);
+                slice.QuoteBars.TryGetValue(symbol, out var quoteBar);
+                if (!TryAdd(symbol, slice[symbol], tradeBar, quoteBar)) return false;
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Get the pandas.DataFrame of the current <see cref="PandasColumnarData"/> state
+        /// </summary>
+        /// <returns>pandas.DataFrame object</returns>
+        public PyObject ToPandasDataFrame()
+        {
+            var symbols = _data.Keys.ToList();
+            var columns = _data.Values.ToList();
+
+            // Like PandasData, a column is dropped for a symbol if all its values are NaN or zero,
+            // and from the data frame if that happens for all the symbols
+            var included = Enumerable.Range(0, _columns.Length).Where(i => columns.Any(x => x.HasValues[i])).ToList();
+
+            // The index levels are sorted and the rows refer to them by their codes
+            var sids = symbols.Select(x => x.ID.ToString()).ToArray();
+            var sortedSids = sids.OrderBy(x => x, StringComparer.Ordinal).ToArray();
+            var symbolCodes = new int[Count];
+            var times = new long[Count];
+
+            var row = 0;
+            for (var i = 0; i < symbols.Count; i++)
+            {
+                var count = columns[i].Times.Count;
+                Array.Fill(symbolCodes, Array.BinarySearch(sortedSids, sids[i], StringComparer.Ordinal), row, count);
+                columns[i].Times.CopyTo(times, row);
+                row += count;
+            }
+
+            var uniqueTimes = times.Distinct().ToArray();
+            Array.Sort(uniqueTimes);
+            var timeCodes = times.Select(x => Array.BinarySearch(uniqueTimes, x)).ToArray();
+
+            using (Py.GIL())
+            {
+                using var symbolLevel = _indexFactory.Invoke(sortedSids.ToPyList());
+                using var timeArray = ToNumpy(uniqueTimes, "datetime64[ns]");
+                using var timeLevel = _indexFactory.Invoke(timeArray);
+                using var symbolCodesArray = ToNumpy(symbolCodes);
+                using var timeCodesArray = ToNumpy(timeCodes);
+                using var levels = new PyList(new PyObject[] { symbolLevel, timeLevel });
+                using var codes = new PyList(new PyObject[] { symbolCodesArray, timeCodesArray });
+                using var indexKwargs = Py.kw("levels", levels, "codes", codes, "names", _names, "verify_integrity", false);
+                using var index = _multiIndexFactory.Invoke(Array.Empty<PyObject>(), indexKwargs);
+
+                using var pyDict = new PyDict();
+                foreach (var i in included)
+                {
+                    var values = new double[Count];
+                    row = 0;
+                    foreach (var symbolColumns in columns)
+                    {
+                        var count = symbolColumns.Times.Count;
+                        if (symbolColumns.HasValues[i])
+                        {
+                            symbolColumns.Values[i].CopyTo(values, row);
+                        }
+                        else
+                        {
+                            Array.Fill(values, double.NaN, row, count);
+                        }
+                        row += count;
+                    }
+
+                    using var array = ToNumpy(values);
+                    pyDict.SetItem(_columns[i], array);
+                }
+
+                _data.Clear();
+                Count = 0;
+
+                using var dataFrameKwargs = Py.kw("index", index);
+                return _dataFrameFactory.Invoke(new PyObject[] { pyDict }, dataFrameKwargs);
+            }
+        }
+
+        /// <summary>
+        /// Adds the bars of a symbol in a new row
+        /// </summary>
+        private bool TryAdd(Symbol symbol, object data, TradeBar tradeBar, QuoteBar quoteBar)
+        {
+            // Custom data and lists of data are not supported
+            if (data.GetType().Namespace != typeof(Bar).Namespace) return false;
+            if (symbol.SecurityType == SecurityType.Future || symbol.SecurityType.IsOption()) return false;
+
+            if (tradeBar == null && quoteBar == null) return true;
+            if (tradeBar != null && quoteBar != null && tradeBar.EndTime != quoteBar.EndTime) return false;
+
+            if (!_data.TryGetValue(symbol, out var columns))
+            {
+                _data[symbol] = columns = new SymbolColumns();
+            }
+
+            // Same precision as the datetime of the PandasData index
+            columns.Times.Add((tradeBar ?? quoteBar).EndTime.Ticks / 10 * 10 - _unixEpochTicks);
+            columns.AddRow();
+            Count++;
+
+            if (tradeBar != null)
+            {
+                columns.Set(Open, tradeBar.Open);
+                columns.Set(High, tradeBar.High);
+                columns.Set(Low, tradeBar.Low);
+                columns.Set(Close, tradeBar.Close);
+                columns.Set(Volume, tradeBar.Volume);
+            }
+            if (quoteBar != null)
+            {
+                if (tradeBar == null)
+                {
+                    columns.Set(Open, quoteBar.Open);
+                    columns.Set(High, quoteBar.High);
+                    columns.Set(Low, quoteBar.Low);
+                    columns.Set(Close, quoteBar.Close);
+                }
+                if (quoteBar.Ask != null)
+                {
+                    columns.Set(AskOpen, quoteBar.Ask.Open);
+                    columns.Set(AskHigh, quoteBar.Ask.High);
+                    columns.Set(AskLow, quoteBar.Ask.Low);
+                    columns.Set(AskClose, quoteBar.Ask.Close);
+                    columns.Set(AskSize, quoteBar.LastAskSize);
+                }
+                if (quoteBar.Bid != null)
+                {
+                    columns.Set(BidOpen, quoteBar.Bid.Open);
+                    columns.Set(BidHigh, quoteBar.Bid.High);
+                    columns.Set(BidLow, quoteBar.Bid.Low);
+                    columns.Set(BidClose, quoteBar.Bid.Close);
+                    columns.Set(BidSize, quoteBar.LastBidSize);
+                }
+            }
+            return true;
+        }
+
+        /// <summary>
+        /// Creates a NumPy array and copies the values to its buffer
+        /// </summary>
+        internal static PyObject ToNumpy(double[] values)
+        {
+            var array = CreateNumpyArray(values.Length, "float64", out var pointer);
+            Marshal.Copy(values, 0, pointer, values.Length);
+            return array;
+        }
+
+        /// <summary>
+        /// Creates a NumPy array and copies the values to its buffer
+        /// </summary>
+        internal static PyObject ToNumpy(int[] values)
+        {
+            var array = CreateNumpyArray(values.Length, "int32", out var pointer);
+            Marshal.Copy(values, 0, pointer, values.Length);
+            return array;
+        }
+
+        /// <summary>
+        /// Creates a NumPy array and copies the values to its buffer
+        /// </summary>
+        /// <param name="values">The values to copy, in 100 nanoseconds ticks for datetime64[ns], <see cref="long.MinValue"/> for NaT</param>
+        /// <param name="dtype">The 64 bits NumPy data type of the array</param>
+        internal static PyObject ToNumpy(long[] values, string dtype)
+        {
+            var nanoseconds = values.Select(x => x == long.MinValue ? x : x * 100).ToArray();
+            var array = CreateNumpyArray(nanoseconds.Length, dtype, out var pointer);
+            Marshal.Copy(nanoseconds, 0, pointer, nanoseconds.Length);
+            return array;
+        }
+
+        /// <summary>
+        /// Creates a NumPy array and copies the values to its buffer
+        /// </summary>
+        /// <param name="values">The values to copy</param>
+        /// <param name="dtype">The 8 bits NumPy data type of the array, bool for flags</param>
+        internal static PyObject ToNumpy(byte[] values, string dtype)
+        {
+            var array = CreateNumpyArray(values.Length, dtype, out var pointer);
+            Marshal.Copy(values, 0, pointer, values.Length);
+            return array;
+        }
+
+        /// <summary>
+        /// Copies the values of a NumPy array of integers to a new array
+        /// </summary>
+        /// <param name="array">The NumPy array or any sequence of integers</param>
+        internal static long[] ToLongArray(PyObject array)
+        {
+            using (Py.GIL())
+            {
+                using var flat = ToContiguousArray(array, "int64");
+                var values = new long[flat.Length()];
+                if (values.Length > 0)
+                {
+                    Marshal.Copy(GetAddress(flat), values, 0, values.Length);
+                }
+                return values;
+            }
+        }
+
+        /// <summary>
+        /// Copies the values of a NumPy array of numbers to a new array
+        /// </summary>
+        /// <param name="array">The NumPy array or any sequence of numbers</param>
+        internal static double[] ToDoubleArray(PyObject array)
+        {
+            using (Py.GIL())
+            {
+                using var flat = ToContiguousArray(array, "float64");
+                var values = new double[flat.Length()];
+                if (values.Length > 0)
+                {
+                    Marshal.Copy(GetAddress(flat), values, 0, values.Length);
+                }
+                return values;
+            }
+        }
+
+        /// <summary>
+        /// Converts dates to ticks, <see cref="long.MinValue"/> for the missing ones
+        /// </summary>
+        /// <param name="times">The dates, like a pandas.Series, a pandas.DatetimeIndex or a sequence of datetime</param>
+        internal static long[] ToTicksArray(PyObject times)
+        {
+            using (Py.GIL())
+            {
+                if (_toDatetime == null)
+                {
+                    using var pandas = Py.Import("pandas");
+                    _toDatetime = pandas.GetAttr("to_datetime");
+                }
+
+                using var dateTimes = _toDatetime.Invoke(times);
+                using var values = dateTimes.GetAttr("values");
+                using var dtype = new PyString("datetime64[ns]");
+                using var nanoseconds = values.InvokeMethod("astype", dtype);
+                return ToLongArray(nanoseconds)
+                    .Select(x => x == long.MinValue ? x : x / 100 + _unixEpochTicks)
+                    .ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Converts the array to a one dimensional contiguous NumPy array of the given data type
+        /// </summary>
+        private static PyObject ToContiguousArray(PyObject array, string dtype)
+        {
+            using var pyDtype = new PyString(dtype);
+            using var contiguous = GetNumpy().InvokeMethod("ascontiguousarray", array, pyDtype);
+            return contiguous.InvokeMethod("ravel");
+        }
+
+        /// <summary>
+        /// Gets the address of the buffer of a NumPy array
+        /// </summary>
+        private static IntPtr GetAddress(PyObject array)
+        {
+            using var arrayInterface = array.GetAttr("__array_interface__");
+            using var data = arrayInterface.GetItem("data");
+            using var address = data.GetItem(0);
+            return new IntPtr(address.As<long>());
+        }
+
+        /// <summary>
+        /// Creates an uninitialized NumPy array and gets the address of its buffer
+        /// </summary>
+        private static PyObject CreateNumpyArray(int length, string dtype, out IntPtr pointer)
+        {
+            var numpy = GetNumpy();
+            using var pyLength = length.ToPython();
+            using var pyDtype = new PyString(dtype);
+            var array = numpy.InvokeMethod("empty", pyLength, pyDtype);
+            pointer = GetAddress(array);
+            return array;
+        }
+
+        private static PyObject GetNumpy()
+        {
+            return _numpy ??= Py.Import("numpy");
+        }
+
+        /// <summary>
+        /// The columns of a symbol
+        /// </summary>
+        private class SymbolColumns
+        {
+            public List<long> Times { get; } = new();
+            public List<double>[] Values { get; } = _columns.Select(x => new List<double>()).ToArray();
+            public bool[] HasValues { get; } = new bool[_columns.Length];
+
+            public void AddRow()
+            {
+                foreach (var values in Values)
+                {
+                    values.Add(double.NaN);
+                }
+            }
+
+            public void Set(int column, decimal value)
+            {
+                var values = Values[column];
+                var x = (double)value;
+                values[values.Count - 1] = x;
+                HasValues[column] |= !x.IsNaNOrZero();
+            }
+        }
+    }
+}
@@ -49,6 +49,12 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Gets or sets whether trade and quote bars are converted in columns by <see cref="PandasColumnarData"/>.
+        /// The conversion falls back to <see cref="PandasData"/> for the data it does not support
+        /// </summary>
+        public bool Columnar { get; set; } = true;
+
         /// <summary>
         /// Converts an enumerable of <see cref="Slice"/> in a pandas.DataFrame
         /// </summary>
@@ -56,6 +62,40 @@ namespace QuantConnect.Python
         /// <param name="dataType">Optional type of bars to add to the data frame</param>
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
         public PyObject GetDataFrame(IEnumerable<Slice> data, Type dataType = null)
+        {
+            if (!Columnar || !PandasColumnarData.IsSupported(dataType))
+            {
+                return GetPandasDataFrame(data, dataType);
+            }
+
+            var columnarData = new PandasColumnarData(dataType);
+            var slices = new List<Slice>();
+
+            using var enumerator = data.GetEnumerator();
+            while (enumerator.MoveNext())
+            {
+                // Keep the slices in case we find data that cannot be organized in columns
+                slices.Add(enumerator.Current);
+                if (!columnarData.TryAdd(enumerator.Current))
+                {
+                    return GetPandasDataFrame(slices.Concat(GetRemaining(enumerator)), dataType);
+                }
+            }
+
+            if (columnarData.Count == 0)
+            {
+                using (Py.GIL())
+                {
+                    return _pandas.DataFrame();
+                }
+            }
+            return columnarData.ToPandasDataFrame();
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a pandas.DataFrame by concatenating a <see cref="PandasData"/> per symbol
+        /// </summary>
+        private PyObject GetPandasDataFrame(IEnumerable<Slice> data, Type dataType)
         {
             var maxLevels = 0;
             var sliceDataDict = new Dictionary<Symbol, PandasData>();
@@ -97,6 +137,19 @@ namespace QuantConnect.Python
         /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
         public PyObject GetDataFrame<T>(IEnumerable<T> data)
             where T : IBaseData
+        {
+            return GetDataFrame(data, null);
+        }
+
+        /// <summary>
+        /// Converts an enumerable of <see cref="IBaseData"/> in a pandas.DataFrame keeping only the given columns,
+        /// the other columns are never converted to python
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="IBaseData"/></param>
+        /// <param name="columns">Names of the columns to keep, null to keep all the columns</param>
+        /// <returns><see cref="PyObject"/> containing a pandas.DataFrame</returns>
+        public PyObject GetDataFrame<T>(IEnumerable<T> data, ICollection<string> columns)
+            where T : IBaseData
         {
             PandasData sliceData = null;
             foreach (var datum in data)
@@ -117,7 +170,7 @@ namespace QuantConnect.Python
                 {
                     return _pandas.DataFrame();
                 }
-                return sliceData.ToPandasDataFrame();
+                return sliceData.ToPandasDataFrame(columns: columns);
             }
         }
 
@@ -223,6 +276,17 @@ namespace QuantConnect.Python
             return _pandas.DataFrame(pyDict, columns: pyDict.Keys().Select(x => x.As<string>().ToLowerInvariant()).OrderBy(x => x));
         }
 
+        /// <summary>
+        /// Enumerates the items the enumerator has not moved to yet
+        /// </summary>
+        private static IEnumerable<Slice> GetRemaining(IEnumerator<Slice> enumerator)
+        {
+            while (enumerator.MoveNext())
+            {
+                yield return enumerator.Current;
+            }
+        }
+
         /// <summary>
         /// Gets the <see cref="PandasData"/> for the given symbol if it exists in the dictionary, otherwise it creates a new instance with the
         /// given base data and adds it to the dictionary
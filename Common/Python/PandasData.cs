@@ -293,8 +293,9 @@ namespace QuantConnect.Python
         /// Get the pandas.DataFrame of the current <see cref="PandasData"/> state
         /// </summary>
         /// <param name="levels">Number of levels of the multi index</param>
+        /// <param name="columns">Names of the columns to convert, null to convert all the columns</param>
         /// <returns>pandas.DataFrame object</returns>
-        public PyObject ToPandasDataFrame(int levels = 2)
+        public PyObject ToPandasDataFrame(int levels = 2, ICollection<string> columns = null)
         {
             var list = Enumerable.Repeat<PyObject>(_empty, 5).ToList();
             list[3] = _symbol.ID.ToString().ToPython();
@@ -341,6 +342,8 @@ namespace QuantConnect.Python
                 using var pyDict = new PyDict();
                 foreach (var kvp in _series)
                 {
+                    if (columns != null && !columns.Contains(kvp.Key)) continue;
+
                     var values = kvp.Value.Item2;
                     if (values.All(Filter)) continue;
 
@@ -16,7 +16,11 @@
 using Python.Runtime;
 using QuantConnect.Data;
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using QuantConnect.Logging;
 
 namespace QuantConnect.Python
 {
@@ -26,14 +30,67 @@ namespace QuantConnect.Python
     /// </summary>
     public class PythonData : DynamicData
     {
+        private static readonly HashSet<string> _baseDataColumns = new(StringComparer.OrdinalIgnoreCase) { "time", "endtime", "value", "symbol" };
+        private static PyObject _dataFrameFactory;
+        private static PyObject _readPickle;
+        private static readonly ConcurrentDictionary<string, string> _readerVersions = new();
+
         private readonly string _pythonTypeName;
         private readonly dynamic _pythonData;
+        private readonly dynamic _readerBatch;
+        private readonly dynamic _readerColumnar;
         private readonly dynamic _defaultResolution;
         private readonly dynamic _supportedResolutions;
         private readonly dynamic _isSparseData;
         private readonly dynamic _requiresMapping;
         private DateTime _endTime;
 
+        /// <summary>
+        /// True if the Python class implements ReaderBatch, which parses all the lines of a source at once
+        /// </summary>
+        public bool ImplementsReaderBatch => _readerBatch != null;
+
+        /// <summary>
+        /// True if the Python class implements ReaderColumnar, which parses the whole content of a <see cref="FileFormat.Columnar"/> source
+        /// </summary>
+        public bool ImplementsReaderColumnar => _readerColumnar != null;
+
+        /// <summary>
+        /// Gets a hash of the source file of the module defining the Python class, which changes when the parser, the helpers
+        /// or the constants it uses are edited. Classes without a source file use a hash of the code of the ReaderColumnar method,
+        /// or of the Reader method if they don't implement it
+        /// </summary>
+        public string ReaderVersion => _readerVersions.GetOrAdd(_pythonTypeName, _ =>
+        {
+            using (Py.GIL())
+            {
+                PyObject pythonData = _pythonData;
+                using var pythonType = pythonData.GetAttr("__class__");
+                using var moduleName = pythonType.GetAttr("__module__");
+                using var sys = Py.Import("sys");
+                using var modules = sys.GetAttr("modules");
+                using var module = modules.InvokeMethod("get", moduleName);
+                if (module.HasAttr("__file__"))
+                {
+                    using var file = module.GetAttr("__file__");
+                    if (!file.IsNone() && File.Exists(file.ToString()))
+                    {
+                        return File.ReadAllText(file.ToString()).ToMD5();
+                    }
+                }
+
+                using PyObject reader = ImplementsReaderColumnar ? _pythonData.ReaderColumnar : _pythonData.Reader;
+                using var function = reader.GetAttr("__func__");
+                using var code = function.GetAttr("__code__");
+                using var marshal = Py.Import("marshal");
+                using var bytes = marshal.InvokeMethod("dumps", code);
+                using var hashlib = Py.Import("hashlib");
+                using var hash = hashlib.InvokeMethod("md5", bytes);
+                using var digest = hash.InvokeMethod("hexdigest");
+                return digest.ToString();
+            }
+        });
+
         /// <summary>
         /// The end time of this data. Some data covers spans (trade bars)
         /// and as such we want to know the entire time span covered
@@ -81,6 +138,8 @@ namespace QuantConnect.Python
                 _isSparseData = pythonData.GetPythonMethod("IsSparseData");
                 _defaultResolution = pythonData.GetPythonMethod("DefaultResolution");
                 _supportedResolutions = pythonData.GetPythonMethod("SupportedResolutions");
+                _readerBatch = pythonData.HasAttr("ReaderBatch") ? pythonData.GetPythonMethod("ReaderBatch") : null;
+                _readerColumnar = pythonData.HasAttr("ReaderColumnar") ? pythonData.GetPythonMethod("ReaderColumnar") : null;
                 _pythonTypeName = pythonData.GetPythonType().GetAssemblyName().Name;
             }
         }
@@ -122,6 +181,230 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// Batched reader implementation for Python custom data, see <see cref="ImplementsReaderBatch"/>.
+        /// The Python ReaderBatch(config, lines, date) method returns the data of all the lines in columns, as a pandas.DataFrame
+        /// or anything it can be created from, like a dictionary of NumPy arrays. The time column is required and the endtime
+        /// and value columns are optional. The other columns are set as properties, like the indexer of the data does
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="lines">All the lines of data from the source</param>
+        /// <param name="date">Date of the requested lines</param>
+        /// <returns>The data of the rows with a time</returns>
+        public List<BaseData> ReaderBatch(SubscriptionDataConfig config, IReadOnlyList<string> lines, DateTime date)
+        {
+            using (Py.GIL())
+            {
+                using var pyLines = lines.ToPyList();
+                using PyObject columns = _readerBatch(config, pyLines, date);
+                using var dataFrame = ToDataFrame(columns);
+                return dataFrame == null ? new List<BaseData>() : ReadRows(config, dataFrame);
+            }
+        }
+
+        /// <summary>
+        /// Reader implementation for the sources of the <see cref="FileFormat.Columnar"/> format, see <see cref="ImplementsReaderColumnar"/>.
+        /// The Python ReaderColumnar(config, content, date, isLiveMode) method is called once with the whole content of the source,
+        /// and returns the data in columns like ReaderBatch
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="content">The whole content of the source</param>
+        /// <param name="date">Date of the requested data</param>
+        /// <param name="isLiveMode">true if we're in live mode, false for backtesting mode</param>
+        /// <param name="cacheFile">File the parsed columns are saved to, see <see cref="ReadColumnarCache"/>. Null to not save them</param>
+        /// <returns>The data of the rows with a time</returns>
+        public List<BaseData> ReaderColumnar(SubscriptionDataConfig config, string content, DateTime date, bool isLiveMode, string cacheFile = null)
+        {
+            using (Py.GIL())
+            {
+                using PyObject columns = _readerColumnar(config, content, date, isLiveMode);
+                using var dataFrame = ToDataFrame(columns);
+                if (dataFrame == null)
+                {
+                    return new List<BaseData>();
+                }
+
+                if (cacheFile != null)
+                {
+                    SaveColumnarCache(dataFrame, cacheFile);
+                }
+                return ReadRows(config, dataFrame);
+            }
+        }
+
+        /// <summary>
+        /// Reads the data from the columns saved by <see cref="ReaderColumnar"/>, skipping the parsing of the source
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="cacheFile">The file the columns were saved to</param>
+        /// <returns>The data of the rows with a time</returns>
+        public List<BaseData> ReadColumnarCache(SubscriptionDataConfig config, string cacheFile)
+        {
+            using (Py.GIL())
+            {
+                InitializePandas();
+                using var path = new PyString(cacheFile);
+                using var dataFrame = _readPickle.Invoke(path);
+                return ReadRows(config, dataFrame);
+            }
+        }
+
+        /// <summary>
+        /// Saves the columns to the cache file. The file is written next to it and then moved, so it's never read partially written
+        /// </summary>
+        private static void SaveColumnarCache(PyObject dataFrame, string cacheFile)
+        {
+            var temporaryFile = $"{cacheFile}.{Guid.NewGuid():N}.tmp";
+            try
+            {
+                using (var path = new PyString(temporaryFile))
+                {
+                    dataFrame.InvokeMethod("to_pickle", path).Dispose();
+                }
+                File.Move(temporaryFile, cacheFile, true);
+            }
+            catch (Exception err)
+            {
+                // the data was parsed, only the following reads of the source are affected
+                Log.Error(err, $"PythonData.SaveColumnarCache(): Failed to save {cacheFile}");
+                if (File.Exists(temporaryFile))
+                {
+                    File.Delete(temporaryFile);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Creates a pandas.DataFrame from the columns returned by Python, null if it returned None
+        /// </summary>
+        private static PyObject ToDataFrame(PyObject columns)
+        {
+            if (columns.IsNone())
+            {
+                return null;
+            }
+
+            InitializePandas();
+            return _dataFrameFactory.Invoke(columns);
+        }
+
+        private static void InitializePandas()
+        {
+            if (_dataFrameFactory == null)
+            {
+                using var pandas = Py.Import("pandas");
+                _readPickle = pandas.GetAttr("read_pickle");
+                _dataFrameFactory = pandas.GetAttr("DataFrame");
+            }
+        }
+
+        /// <summary>
+        /// Creates the data of the rows of the data frame, reading each column in a single call
+        /// </summary>
+        private List<BaseData> ReadRows(SubscriptionDataConfig config, PyObject dataFrame)
+        {
+            long[] times = null;
+            long[] endTimes = null;
+            double[] values = null;
+            var properties = new List<KeyValuePair<string, object[]>>();
+
+            using var pyColumns = dataFrame.GetAttr("columns");
+            using var iterator = pyColumns.GetIterator();
+            foreach (PyObject pyColumn in iterator)
+            {
+                var name = pyColumn.ToString();
+                using var series = dataFrame.GetItem(pyColumn);
+                pyColumn.Dispose();
+
+                switch (name.ToLowerInvariant())
+                {
+                    case "time":
+                        times = PandasColumnarData.ToTicksArray(series);
+                        break;
+                    case "endtime":
+                        endTimes = PandasColumnarData.ToTicksArray(series);
+                        break;
+                    case "value":
+                        values = PandasColumnarData.ToDoubleArray(series);
+                        break;
+                    default:
+                        if (!_baseDataColumns.Contains(name))
+                        {
+                            properties.Add(new KeyValuePair<string, object[]>(name, ReadProperty(series)));
+                        }
+                        break;
+                }
+            }
+
+            if (times == null)
+            {
+                throw new ArgumentException($"PythonData.ReaderBatch(): {_pythonTypeName}.ReaderBatch has to return a time column");
+            }
+
+            var result = new List<BaseData>(times.Length);
+            for (var i = 0; i < times.Length; i++)
+            {
+                if (times[i] == long.MinValue)
+                {
+                    continue;
+                }
+
+                var data = new PythonData { Symbol = config.Symbol, Time = new DateTime(times[i]) };
+                if (endTimes != null && endTimes[i] != long.MinValue)
+                {
+                    data.EndTime = new DateTime(endTimes[i]);
+                }
+                if (values != null && !double.IsNaN(values[i]))
+                {
+                    data.Value = values[i].SafeDecimalCast();
+                }
+                foreach (var property in properties)
+                {
+                    var value = property.Value[i];
+                    if (value != null)
+                    {
+                        data.SetProperty(property.Key, value);
+                    }
+                }
+                data.SetProperty("__typename", _pythonTypeName);
+                result.Add(data);
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Reads a column of properties. Numbers are read as decimals and dates as <see cref="DateTime"/>, null for the missing ones
+        /// </summary>
+        private static object[] ReadProperty(PyObject series)
+        {
+            using var dtype = series.GetAttr("dtype");
+            using var kind = dtype.GetAttr("kind");
+            switch (kind.ToString())
+            {
+                case "b":
+                    return PandasColumnarData.ToLongArray(series).Select(x => (object)(x != 0)).ToArray();
+                case "i":
+                case "u":
+                case "f":
+                    return PandasColumnarData.ToDoubleArray(series)
+                        .Select(x => double.IsNaN(x) ? null : (object)x.SafeDecimalCast())
+                        .ToArray();
+                case "M":
+                    return PandasColumnarData.ToTicksArray(series).Select(x => x == long.MinValue ? null : (object)new DateTime(x)).ToArray();
+                default:
+                    using (var list = series.InvokeMethod("tolist"))
+                    {
+                        var objects = new object[list.Length()];
+                        for (var i = 0; i < objects.Length; i++)
+                        {
+                            using var item = list.GetItem(i);
+                            objects[i] = item.IsNone() ? null : item.ToString();
+                        }
+                        return objects;
+                    }
+            }
+        }
+
         /// <summary>
         /// Indicates if there is support for mapping
         /// </summary>
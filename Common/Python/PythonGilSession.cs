@@ -0,0 +1,167 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
+using Python.Runtime;
+using QuantConnect.Configuration;
+using QuantConnect.Logging;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Holds the GIL for the Python callbacks of the algorithm, like OnData, OnOrderEvent and the consolidators.
+    /// The engine can open a session for a whole time slice, so the GIL is acquired once per slice and the callbacks
+    /// of the slice take it again cheaply from the same thread. While a session is open the other threads can't run Python.
+    /// Optionally counts the GIL transitions, the acquisitions by a thread not holding it already, and the time per callback type
+    /// </summary>
+    public sealed class PythonGilSession : IDisposable
+    {
+        private static readonly ConcurrentDictionary<string, CallbackStatistics> _statistics = new();
+        private static long _transitions;
+
+        // the sessions and callbacks currently open in the thread
+        [ThreadStatic]
+        private static int _depth;
+
+        private readonly Py.GILState _state;
+        private readonly CallbackStatistics _callbackStatistics;
+        private readonly long _start;
+
+        /// <summary>
+        /// True if the engine opens a session for each time slice of Python algorithms in backtesting
+        /// </summary>
+        public static bool Enabled { get; set; } = Config.GetBool("python-gil-session");
+
+        /// <summary>
+        /// True to count the GIL transitions and the calls and time of each callback type
+        /// </summary>
+        public static bool StatisticsEnabled { get; set; } = Config.GetBool("python-gil-statistics");
+
+        /// <summary>
+        /// Gets the number of GIL transitions counted
+        /// </summary>
+        public static long Transitions => Interlocked.Read(ref _transitions);
+
+        private PythonGilSession(string callbackType)
+        {
+            if (StatisticsEnabled)
+            {
+                if (_depth == 0)
+                {
+                    Interlocked.Increment(ref _transitions);
+                }
+                if (callbackType != null)
+                {
+                    _callbackStatistics = _statistics.GetOrAdd(callbackType, _ => new CallbackStatistics());
+                    _start = Stopwatch.GetTimestamp();
+                }
+            }
+
+            _state = Py.GIL();
+            _depth++;
+        }
+
+        /// <summary>
+        /// Opens a session holding the GIL until it's disposed, like for a time slice
+        /// </summary>
+        public static PythonGilSession Begin()
+        {
+            return new PythonGilSession(null);
+        }
+
+        /// <summary>
+        /// Acquires the GIL to invoke a Python callback, which is cheap inside of a session
+        /// </summary>
+        /// <param name="callbackType">The type of the callback the statistics are grouped by, like OnData</param>
+        public static PythonGilSession Callback(string callbackType)
+        {
+            return new PythonGilSession(callbackType);
+        }
+
+        /// <summary>
+        /// Gets the number of calls counted of the callback type
+        /// </summary>
+        /// <param name="callbackType">The type of the callback, like OnData</param>
+        public static long GetCalls(string callbackType)
+        {
+            return _statistics.TryGetValue(callbackType, out var statistics) ? Interlocked.Read(ref statistics.Calls) : 0;
+        }
+
+        /// <summary>
+        /// Gets the time spent in the callbacks of the type, including the callbacks they trigger
+        /// </summary>
+        /// <param name="callbackType">The type of the callback, like OnData</param>
+        public static TimeSpan GetTime(string callbackType)
+        {
+            return _statistics.TryGetValue(callbackType, out var statistics)
+                ? TimeSpan.FromSeconds(Interlocked.Read(ref statistics.Ticks) / (double)Stopwatch.Frequency)
+                : TimeSpan.Zero;
+        }
+
+        /// <summary>
+        /// Clears the statistics
+        /// </summary>
+        public static void ResetStatistics()
+        {
+            _statistics.Clear();
+            Interlocked.Exchange(ref _transitions, 0);
+        }
+
+        /// <summary>
+        /// Logs the statistics, if enabled
+        /// </summary>
+        public static void LogStatistics()
+        {
+            if (!StatisticsEnabled)
+            {
+                return;
+            }
+
+            Log.Trace($"PythonGilSession.LogStatistics(): Sessions enabled: {Enabled}. GIL transitions: {Transitions}");
+            foreach (var callbackType in _statistics.Keys.OrderBy(x => x, StringComparer.Ordinal))
+            {
+                var calls = GetCalls(callbackType);
+                var time = GetTime(callbackType);
+                Log.Trace($"PythonGilSession.LogStatistics(): {callbackType}: {calls} calls in {time.TotalMilliseconds:F0} ms, " +
+                    $"{(calls == 0 ? 0 : time.TotalMilliseconds * 1000 / calls):F1} us per call");
+            }
+        }
+
+        /// <summary>
+        /// Releases the GIL if the thread didn't hold it before
+        /// </summary>
+        public void Dispose()
+        {
+            _depth--;
+            _state.Dispose();
+
+            if (_callbackStatistics != null)
+            {
+                Interlocked.Add(ref _callbackStatistics.Ticks, Stopwatch.GetTimestamp() - _start);
+                Interlocked.Increment(ref _callbackStatistics.Calls);
+            }
+        }
+
+        private class CallbackStatistics
+        {
+            public long Calls;
+            public long Ticks;
+        }
+    }
+}
@@ -0,0 +1,120 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+class RollingStatistics:
+    '''Sum, mean and standard deviation of the last values, kept in a NumPy ring buffer for custom indicators.
+    Update adds a value in O(1) time, and UpdateBatch adds many values, like the history of a warm up, in a single NumPy call.
+    The sums are computed again from the buffer each time it's filled, so rounding errors don't accumulate'''
+    def __init__(self, period):
+        if period < 1:
+            raise ValueError(f"RollingStatistics(): the period must be positive, it was {period}")
+        self.Period = period
+        self.buffer = np.zeros(period)
+        self.Reset()
+
+    @property
+    def Count(self):
+        '''The number of values in the window'''
+        return min(self.Samples, self.Period)
+
+    @property
+    def IsReady(self):
+        '''True if the window is full'''
+        return self.Samples >= self.Period
+
+    @property
+    def Sum(self):
+        return self.sum
+
+    @property
+    def Mean(self):
+        return self.mean
+
+    @property
+    def Variance(self):
+        '''The population variance, like the Variance indicator'''
+        count = self.Count
+        return max(self.m2 / count, 0.0) if count > 0 else 0.0
+
+    @property
+    def StandardDeviation(self):
+        '''The population standard deviation, like the StandardDeviation indicator'''
+        return np.sqrt(self.Variance)
+
+    def Update(self, value):
+        '''Adds a value to the window, removing the oldest one if it's full
+        Args:
+            value: The new value
+        Returns:
+            True if the window is full'''
+        value = float(value)
+        count = self.Count
+        if count < self.Period:
+            # Welford's update
+            delta = value - self.mean
+            self.mean += delta / (count + 1)
+            self.m2 += delta * (value - self.mean)
+            self.sum += value
+        else:
+            removed = self.buffer[self.index]
+            previousMean = self.mean
+            self.mean += (value - removed) / count
+            self.m2 += (value - removed) * (value - self.mean + removed - previousMean)
+            self.sum += value - removed
+
+        self.buffer[self.index] = value
+        self.Samples += 1
+        self.index += 1
+        if self.index == self.Period:
+            self.index = 0
+            self.Recompute()
+        return self.IsReady
+
+    def UpdateBatch(self, values):
+        '''Adds the values to the window in order, like calling Update with each of them
+        Args:
+            values: NumPy array or sequence of the new values
+        Returns:
+            True if the window is full'''
+        values = np.asarray(values, dtype=float).ravel()
+        count = len(values)
+        if count >= self.Period:
+            self.buffer[:] = values[-self.Period:]
+            self.index = 0
+        elif count > 0:
+            self.buffer[(self.index + np.arange(count)) % self.Period] = values
+            self.index = (self.index + count) % self.Period
+        self.Samples += count
+        self.Recompute()
+        return self.IsReady
+
+    def Reset(self):
+        '''Empties the window'''
+        self.buffer[:] = 0
+        self.index = 0
+        self.Samples = 0
+        self.sum = 0.0
+        self.mean = 0.0
+        # sum of the squared deviations from the mean
+        self.m2 = 0.0
+
+    def Recompute(self):
+        '''Computes the sums from the values of the window'''
+        window = self.buffer[:self.Count]
+        if len(window) == 0:
+            return
+        self.sum = float(np.sum(window))
+        self.mean = self.sum / len(window)
+        self.m2 = float(np.sum((window - self.mean) ** 2))
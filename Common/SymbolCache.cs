@@ -17,6 +17,7 @@
 using System;
 using System.Collections.Concurrent;
 using System.Linq;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -29,6 +30,13 @@ namespace QuantConnect
     {
         // we aggregate the two maps into a class so we can assign a new one as an atomic operation
         private static Cache _cache = new Cache();
+        private static int _version;
+
+        /// <summary>
+        /// Gets a number that changes every time a mapping is added, changed or removed,
+        /// allowing consumers that memoize the mappings to know when to invalidate them
+        /// </summary>
+        public static int Version => Volatile.Read(ref _version);
 
         /// <summary>
         /// Adds a mapping for the specified ticker
@@ -37,8 +45,15 @@ namespace QuantConnect
         /// <param name="symbol">The symbol object that maps to the string ticker symbol</param>
         public static void Set(string ticker, Symbol symbol)
         {
+            var changed = !_cache.Symbols.TryGetValue(ticker, out var existing) || existing != symbol;
+
             _cache.Symbols[ticker] = symbol;
             _cache.Tickers[symbol] = ticker;
+
+            if (changed)
+            {
+                Interlocked.Increment(ref _version);
+            }
         }
 
         /// <summary>
@@ -107,7 +122,7 @@ namespace QuantConnect
         public static bool TryRemove(Symbol symbol)
         {
             string ticker;
-            return _cache.Tickers.TryRemove(symbol, out ticker) && _cache.Symbols.TryRemove(ticker, out symbol);
+            return OnRemoved(_cache.Tickers.TryRemove(symbol, out ticker) && _cache.Symbols.TryRemove(ticker, out symbol));
         }
 
         /// <summary>
@@ -118,7 +133,7 @@ namespace QuantConnect
         public static bool TryRemove(string ticker)
         {
             Symbol symbol;
-            return _cache.Symbols.TryRemove(ticker, out symbol) && _cache.Tickers.TryRemove(symbol, out ticker);
+            return OnRemoved(_cache.Symbols.TryRemove(ticker, out symbol) && _cache.Tickers.TryRemove(symbol, out ticker));
         }
 
         /// <summary>
@@ -127,6 +142,16 @@ namespace QuantConnect
         public static void Clear()
         {
             _cache = new Cache();
+            Interlocked.Increment(ref _version);
+        }
+
+        private static bool OnRemoved(bool removed)
+        {
+            if (removed)
+            {
+                Interlocked.Increment(ref _version);
+            }
+            return removed;
         }
 
         private static Tuple<bool, Symbol, InvalidOperationException> TryGetSymbol(string ticker)
@@ -33,6 +33,7 @@ using QuantConnect.Lean.Engine.TransactionHandlers;
 using QuantConnect.Logging;
 using QuantConnect.Orders;
 using QuantConnect.Packets;
+using QuantConnect.Python;
 using QuantConnect.Securities;
 using QuantConnect.Securities.Option;
 using QuantConnect.Securities.Volatility;
@@ -120,6 +121,8 @@ namespace QuantConnect.Lean.Engine
             _algorithm = algorithm;
 
             var backtestMode = (job.Type == PacketType.BacktestNode);
+            // in backtesting the python callbacks of a time slice run in this thread, so the GIL can be held for the whole slice
+            var pythonGilSessions = backtestMode && job.Language == Language.Python && PythonGilSession.Enabled;
             var methodInvokers = new Dictionary<Type, MethodInvoker>();
             var marginCallFrequency = TimeSpan.FromMinutes(5);
             var nextMarginCallTime = DateTime.MinValue;
@@ -181,6 +184,9 @@ namespace QuantConnect.Lean.Engine
                 // reset our timer on each loop
                 TimeLimit.StartNewTimeStep();
 
+                // released at the end of the iteration, before the data feed is asked for the next slice
+                using var gilSession = pythonGilSessions ? PythonGilSession.Begin() : null;
+
                 //Check this backtest is still running:
                 if (_algorithm.Status != AlgorithmStatus.Running && _algorithm.RunTimeError == null)
                 {
@@ -567,6 +573,8 @@ namespace QuantConnect.Lean.Engine
                 return;
             }
 
+            PythonGilSession.LogStatistics();
+
             // Process any required events of the results handler such as sampling assets, equity, or stock prices.
             results.ProcessSynchronousEvents(forceProcess: true);
 
@@ -47,6 +47,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             switch (source.Format)
             {
                 case FileFormat.Csv:
+                case FileFormat.Columnar:
                     reader = new TextSubscriptionDataSourceReader(dataCacheProvider, config, date, isLiveMode);
                     break;
 
@@ -14,10 +14,14 @@
 */
 
 using System;
+using System.IO;
 using System.Linq;
+using System.Threading;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using QuantConnect.Logging;
 using QuantConnect.Interfaces;
+using QuantConnect.Configuration;
 using System.Collections.Generic;
 using QuantConnect.Data.Fundamental;
 using QuantConnect.Data.UniverseSelection;
@@ -37,6 +41,10 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         private BaseData _factory;
         private bool _shouldCacheDataPoints;
 
+        private static readonly string ColumnarCacheDirectory = Path.Combine(Globals.Cache, "columnar");
+        private static readonly TimeSpan ColumnarCacheMaximumAge = TimeSpan.FromDays(Config.GetInt("columnar-cache-maximum-age-days", 30));
+        private static int _columnarCachePruned;
+
         private static int CacheSize = 100;
         private static volatile Dictionary<string, List<BaseData>> BaseDataSourceCache = new Dictionary<string, List<BaseData>>(100);
         private static Queue<string> CacheKeys = new Queue<string>(100);
@@ -100,6 +108,24 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                         // only create a factory if the stream isn't null
                         _factory = _config.GetBaseDataInstance();
                     }
+
+                    if (source.Format == FileFormat.Columnar || _factory is PythonData { ImplementsReaderBatch: true })
+                    {
+                        // the whole source is parsed by a single call to python
+                        var batch = source.Format == FileFormat.Columnar ? ReadColumnar(source, reader) : ReadBatch((PythonData)_factory, reader);
+                        foreach (var instance in batch)
+                        {
+                            if (_shouldCacheDataPoints)
+                            {
+                                cache.Add(instance);
+                            }
+                            else
+                            {
+                                yield return instance;
+                            }
+                        }
+                    }
+
                     // while the reader has data
                     while (!reader.EndOfStream)
                     {
@@ -188,6 +214,126 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             }
         }
 
+        /// <summary>
+        /// Reads all the lines of the source and passes them to <see cref="PythonData.ReaderBatch"/>
+        /// </summary>
+        private IEnumerable<BaseData> ReadBatch(PythonData factory, IStreamReader reader)
+        {
+            var lines = new List<string>();
+            while (!reader.EndOfStream)
+            {
+                lines.Add(reader.ReadLine());
+            }
+
+            try
+            {
+                return factory.ReaderBatch(_config, lines, _date).Where(x => x.EndTime != default(DateTime));
+            }
+            catch (Exception err)
+            {
+                OnReaderError("ReaderBatch", err);
+                return Enumerable.Empty<BaseData>();
+            }
+        }
+
+        /// <summary>
+        /// Reads the whole content of a <see cref="FileFormat.Columnar"/> source and passes it to <see cref="PythonData.ReaderColumnar"/>.
+        /// In backtesting the parsed columns are cached on disk by the source, date and content, and the version of the parser
+        /// </summary>
+        private IEnumerable<BaseData> ReadColumnar(SubscriptionDataSource source, IStreamReader reader)
+        {
+            string content;
+            if (reader.StreamReader != null)
+            {
+                content = reader.StreamReader.ReadToEnd();
+            }
+            else
+            {
+                var lines = new List<string>();
+                while (!reader.EndOfStream)
+                {
+                    lines.Add(reader.ReadLine());
+                }
+                content = string.Join("\n", lines);
+            }
+
+            try
+            {
+                if (_factory is not PythonData { ImplementsReaderColumnar: true } factory)
+                {
+                    throw new NotSupportedException($"TextSubscriptionDataSourceReader.ReadColumnar(): {FileFormat.Columnar} is only supported by Python custom data implementing ReaderColumnar, {_config.Type.Name} does not");
+                }
+
+                string cacheFile = null;
+                if (!IsLiveMode && !DataCacheProvider.IsDataEphemeral)
+                {
+                    var key = string.Join("|", factory.ReaderVersion, _config.Symbol.ID, source.Source,
+                        _date.ToStringInvariant(DateFormat.EightCharacter), content.ToMD5());
+                    Directory.CreateDirectory(ColumnarCacheDirectory);
+                    PruneColumnarCache();
+                    cacheFile = Path.Combine(ColumnarCacheDirectory, key.ToMD5() + ".pkl");
+
+                    if (File.Exists(cacheFile))
+                    {
+                        try
+                        {
+                            var data = factory.ReadColumnarCache(_config, cacheFile);
+                            // the files in use are kept by the pruning
+                            File.SetLastWriteTimeUtc(cacheFile, DateTime.UtcNow);
+                            return data.Where(x => x.EndTime != default(DateTime));
+                        }
+                        catch (Exception err)
+                        {
+                            // the source is parsed again and the file replaced
+                            Log.Error(err, $"TextSubscriptionDataSourceReader.ReadColumnar(): Failed to read {cacheFile}");
+                        }
+                    }
+                }
+
+                return factory.ReaderColumnar(_config, content, _date, IsLiveMode, cacheFile).Where(x => x.EndTime != default(DateTime));
+            }
+            catch (Exception err)
+            {
+                OnReaderError(source.Source, err);
+                return Enumerable.Empty<BaseData>();
+            }
+        }
+
+        /// <summary>
+        /// Deletes the columnar cache files that weren't used for longer than the maximum age, once per process.
+        /// An edited parser or source is cached to a new file, and the previous one is deleted once it expires
+        /// </summary>
+        private static void PruneColumnarCache()
+        {
+            if (Interlocked.Exchange(ref _columnarCachePruned, 1) == 0)
+            {
+                PruneColumnarCache(ColumnarCacheDirectory, ColumnarCacheMaximumAge);
+            }
+        }
+
+        /// <summary>
+        /// Deletes the files of the directory that weren't written for longer than the maximum age
+        /// </summary>
+        internal static void PruneColumnarCache(string directory, TimeSpan maximumAge)
+        {
+            var expiry = DateTime.UtcNow - maximumAge;
+            foreach (var file in Directory.EnumerateFiles(directory))
+            {
+                try
+                {
+                    if (File.GetLastWriteTimeUtc(file) < expiry)
+                    {
+                        File.Delete(file);
+                    }
+                }
+                catch (Exception err)
+                {
+                    // the file can be in use by another process
+                    Log.Error(err, $"TextSubscriptionDataSourceReader.PruneColumnarCache(): Failed to delete {file}");
+                }
+            }
+        }
+
         /// <summary>
         /// Event invocator for the <see cref="ReaderError"/> event
         /// </summary>
@@ -1,4 +1,5 @@
 ﻿using System.Reflection;
+using System.Runtime.CompilerServices;
 using System.Runtime.InteropServices;
 
 // General Information about an assembly is controlled through the following 
@@ -7,6 +8,7 @@ using System.Runtime.InteropServices;
 [assembly: AssemblyTitle("QuantConnect.Lean.Engine")]
 [assembly: AssemblyProduct("QuantConnect.Lean.Engine")]
 [assembly: AssemblyCulture("")]
+[assembly: InternalsVisibleTo("QuantConnect.Tests")]
 
 // Setting ComVisible to false makes the types in this assembly not visible 
 // to COM components.  If you need to access a type in this assembly from 
@@ -16,8 +16,10 @@
 // ReSharper disable InconsistentNaming
 using System;
 using System.Globalization;
+using System.Linq;
 using QuantConnect.Data;
 using Python.Runtime;
+using QuantConnect.Python;
 using QuantConnect.Util;
 
 namespace QuantConnect.Indicators
@@ -557,6 +559,60 @@ namespace QuantConnect.Indicators
             return Plus(indicatorLeft, indicatorRight, name);
         }
 
+        /// <summary>
+        /// Updates the indicator with many values in a single call, like to warm it up from a history DataFrame:
+        /// IndicatorExtensions.UpdateBatch(indicator, history.index, history.close).
+        /// Python indicators implementing UpdateBatch(times, values) receive all the values in NumPy arrays at once,
+        /// the other indicators are updated with each value. The values with a missing time or value are skipped
+        /// </summary>
+        /// <param name="indicator">The indicator to update, which takes <see cref="IndicatorDataPoint"/> inputs</param>
+        /// <param name="times">The end times of the values in time order, like a pandas.DatetimeIndex</param>
+        /// <param name="values">The values, like a pandas.Series or a NumPy array</param>
+        /// <returns>True if the indicator is ready, false otherwise</returns>
+        public static bool UpdateBatch(PyObject indicator, PyObject times, PyObject values)
+        {
+            var ticks = PandasColumnarData.ToTicksArray(times);
+            var doubles = PandasColumnarData.ToDoubleArray(values);
+            if (ticks.Length != doubles.Length)
+            {
+                throw new ArgumentException($"IndicatorExtensions.UpdateBatch(): there are {ticks.Length} times and {doubles.Length} values");
+            }
+
+            var valid = Enumerable.Range(0, ticks.Length).Where(i => ticks[i] != long.MinValue && !double.IsNaN(doubles[i])).ToList();
+            if (valid.Count != ticks.Length)
+            {
+                ticks = valid.Select(i => ticks[i]).ToArray();
+                doubles = valid.Select(i => doubles[i]).ToArray();
+            }
+
+            IndicatorBase managedIndicator;
+            using (Py.GIL())
+            {
+                if (!indicator.TryConvert(out managedIndicator, true))
+                {
+                    // a python indicator that doesn't inherit from PythonIndicator
+                    managedIndicator = new PythonIndicator(indicator);
+                }
+                else if (managedIndicator is PythonIndicator derivedIndicator)
+                {
+                    derivedIndicator.SetIndicator(indicator);
+                }
+            }
+
+            if (managedIndicator is PythonIndicator { ImplementsUpdateBatch: true } pythonIndicator)
+            {
+                return pythonIndicator.UpdateBatch(ticks, doubles);
+            }
+
+            for (var i = 0; i < ticks.Length; i++)
+            {
+                // parsed from the shortest representation like python floats are converted, so the values match a python loop
+                var value = decimal.Parse(doubles[i].ToString(CultureInfo.InvariantCulture), NumberStyles.Float, CultureInfo.InvariantCulture);
+                managedIndicator.Update(new IndicatorDataPoint(new DateTime(ticks[i]), value));
+            }
+            return managedIndicator.IsReady;
+        }
+
         private static dynamic GetIndicatorAsManagedObject(PyObject indicator)
         {
             if (indicator.TryConvert(out PythonIndicator pythonIndicator, true))
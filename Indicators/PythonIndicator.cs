@@ -15,7 +15,10 @@
 
 using Python.Runtime;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using System;
+using System.Collections.Generic;
+using System.Linq;
 
 namespace QuantConnect.Indicators
 {
@@ -24,8 +27,11 @@ namespace QuantConnect.Indicators
     /// </summary>
     public class PythonIndicator : IndicatorBase<IBaseData>, IIndicatorWarmUpPeriodProvider
     {
+        private static readonly long _unixEpochTicks = new DateTime(1970, 1, 1).Ticks;
+
         private bool _isReady;
         private dynamic _indicator;
+        private dynamic _updateBatch;
 
         /// <summary>
         /// Get the indicator Name. If not defined, use the class name
@@ -115,6 +121,8 @@ namespace QuantConnect.Indicators
                         throw new NotImplementedException(message);
                     }
                 }
+
+                _updateBatch = indicator.HasAttr("UpdateBatch") ? indicator.GetPythonMethod("UpdateBatch") : null;
             }
 
             WarmUpPeriod = GetIndicatorWarmUpPeriod(indicator);
@@ -131,6 +139,61 @@ namespace QuantConnect.Indicators
         /// </summary>
         public int WarmUpPeriod { get; protected set; }
 
+        /// <summary>
+        /// True if the python indicator implements UpdateBatch(times, values), which updates it with many values at once.
+        /// It receives NumPy arrays of the end times, as datetime64[ns], and of the values, as float64, and returns
+        /// whether the indicator is ready like Update does
+        /// </summary>
+        public bool ImplementsUpdateBatch => _updateBatch != null;
+
+        /// <summary>
+        /// Updates this indicator with the values of the inputs in a single call to its python UpdateBatch method,
+        /// or with each input if it doesn't implement it. The <see cref="IndicatorBase.Updated"/> event is fired with the last value only
+        /// </summary>
+        /// <param name="inputs">The inputs in time order</param>
+        /// <returns>True if this indicator is ready, false otherwise</returns>
+        public bool UpdateBatch(IReadOnlyList<IBaseData> inputs)
+        {
+            if (!ImplementsUpdateBatch)
+            {
+                foreach (var input in inputs)
+                {
+                    Update(input);
+                }
+                return IsReady;
+            }
+
+            return UpdateBatch(inputs.Select(x => x.EndTime.Ticks).ToArray(), inputs.Select(x => (double)x.Value).ToArray());
+        }
+
+        /// <summary>
+        /// Updates this indicator with the values in a single call to its python UpdateBatch method
+        /// </summary>
+        /// <param name="times">The end times of the values in ticks, in time order</param>
+        /// <param name="values">The values</param>
+        /// <returns>True if this indicator is ready, false otherwise</returns>
+        internal bool UpdateBatch(long[] times, double[] values)
+        {
+            if (times.Length == 0)
+            {
+                return IsReady;
+            }
+
+            using (Py.GIL())
+            {
+                using var pyTimes = PandasColumnarData.ToNumpy(times.Select(x => x - _unixEpochTicks).ToArray(), "datetime64[ns]");
+                using var pyValues = PandasColumnarData.ToNumpy(values);
+                _isReady = _updateBatch(pyTimes, pyValues) ?? _indicator.IsReady;
+                decimal value = _indicator.Value;
+
+                Samples += times.Length;
+                Current = new IndicatorDataPoint(new DateTime(times[^1]), value);
+            }
+
+            OnUpdated(Current);
+            return IsReady;
+        }
+
         /// <summary>
         /// Computes the next value of this indicator from the given state
         /// </summary>
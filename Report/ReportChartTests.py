@@ -108,6 +108,8 @@ backtest = [time, equity, benchmark]
 empty = [[], [], []]
 result = charts.GetCrisisEventsPlots(empty, 'empty_crisis')
 result = charts.GetCrisisEventsPlots(backtest, 'dummy_crisis')
+result = charts.RenderConcurrently([['GetCrisisEventsPlots', [empty, 'empty_crisis']], ['GetCrisisEventsPlots', [backtest, 'dummy_crisis']]])
+result = ReportCharts('svg').GetCrisisEventsPlots(backtest, 'dummy_crisis')
 
 ## Test GetRollingBetaPlot
 empty = [[], [], [], []]
@@ -11,16 +11,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
 import re
+import sys
 import matplotlib
 import numpy as np
 import pandas as pd
+import multiprocessing
 from base64 import b64encode
 from datetime import date, datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from pandas.plotting import register_matplotlib_converters
-from clr import AddReference
-AddReference("System")
-from System import *
 
 register_matplotlib_converters()
 
@@ -53,32 +55,51 @@ class ReportCharts:
             "CryptoFuture": "#E55812"
         }
 
-    def fig_to_base64(self, filename = '', fig = None, dpi = 200):
-        base64 = 'data:image/png;base64,'
-        if fig is not None:
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
-            with open(filename, "rb") as fp:
-                base64 += b64encode(fp.read()).decode('utf-8').replace('\n', '')
-            return base64
-
-    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
-                           name = "returns-per-trade.png", width = 7, height = 5,
-                           live_color = "#ff9914", backtest_color = "#71c3fc"):
-
-        if len(returns_per_trade) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
+    # Placeholder charts only depend on their size and settings, they are rendered once per process
+    placeholders = {}
+
+    def __init__(self, image_format = 'png', dpi = 200, max_workers = None, decimation = 'minmax'):
+        '''Initialize the ReportCharts
+        Args:
+            image_format: Format of the images, 'png' or 'svg'. The paths of the svg charts are simplified to keep them small
+            dpi: Resolution of the png images
+            max_workers: Number of processes used by RenderConcurrently. If None or 0, the charts are rendered in the current process
+            decimation: Method used to reduce the points of the time series charts, 'minmax', 'lttb' or None to plot every point'''
+        if image_format not in ('png', 'svg'):
+            raise ValueError(f'ReportCharts: image format must be png or svg. Format: {image_format}')
+        if decimation not in ('minmax', 'lttb', None):
+            raise ValueError(f'ReportCharts: decimation must be minmax, lttb or None. Decimation: {decimation}')
+        self.image_format = image_format
+        self.dpi = dpi
+        self.max_workers = max_workers
+        self.decimation = decimation
+
+    def fig_to_base64(self, filename = '', fig = None, dpi = None):
+        '''Encodes the figure as a base64 data URI. The image is rendered in memory, the filename is not used'''
+        if fig is None:
+            return None
+
+        mime = 'svg+xml' if self.image_format == 'svg' else 'png'
+        with io.BytesIO() as buffer, matplotlib.rc_context({'path.simplify': True, 'path.simplify_threshold': 1.0}
+                                                           if self.image_format == 'svg' else {}):
+            fig.savefig(buffer, format=self.image_format, dpi=dpi or self.dpi, bbox_inches='tight')
+            return f'data:image/{mime};base64,' + b64encode(buffer.getvalue()).decode('utf-8')
+
+    def get_placeholder(self, width, height, text = None, fontsize = None):
+        '''Gets the base64 of an empty chart with an optional centered text, rendering it only the first time'''
+        key = (self.image_format, self.dpi, width, height, text, fontsize)
+        if key in ReportCharts.placeholders:
+            return ReportCharts.placeholders[key]
+
+        fig = plt.figure()
+        fig.set_size_inches(width, height)
 
+        if text is not None:
             ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
+            ax.text(0.5, 0.5, text, color="#d5d5d5",
                     horizontalalignment='center',
                     verticalalignment='center',
-                    fontsize=30,
+                    fontsize=fontsize,
                     transform=ax.transAxes)
 
             ax.axis('off')
@@ -86,10 +107,71 @@ class ReportCharts:
             for _, spine in ax.spines.items():
                 spine.set_visible(False)
 
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+        base64 = self.fig_to_base64(fig=fig)
+        plt.cla()
+        plt.clf()
+        plt.close('all')
+        ReportCharts.placeholders[key] = base64
+        return base64
+
+    def get_insufficient_data(self, width, height, fontsize):
+        '''Gets the base64 of the chart shown when there is not enough data to plot'''
+        return self.get_placeholder(width, height, 'Insufficient Data', fontsize)
+
+    def decimate(self, x, ys, width, max_points = None):
+        '''Reduces the points of time series that share the same x values before plotting them.
+        The first and last points and the minimum and maximum of every series are always kept
+        Args:
+            x: List of the x values
+            ys: List of the series of y values, each one with the length of x
+            width: Width of the chart in inches
+            max_points: Maximum number of points. If None, twice the number of pixel columns of the chart. If 0, the series are not decimated
+        Returns:
+            Tuple of the decimated x values and list of decimated series'''
+        if max_points is None:
+            max_points = 2 * int(width * self.dpi)
+        if self.decimation is None or not max_points or len(x) <= max_points or any(len(y) != len(x) for y in ys):
+            return x, ys
+
+        x = list(x)
+        values = [np.asarray(list(y), dtype=float) for y in ys]
+        if self.decimation == 'lttb':
+            positions = np.asarray(x)
+            if not np.issubdtype(positions.dtype, np.number):
+                positions = pd.DatetimeIndex(x).asi8
+            positions = positions.astype(float)
+            indices = np.unique(np.concatenate([get_lttb_indices(positions, y, max_points) for y in values]))
+        else:
+            indices = get_minmax_indices(values, max(max_points // 2, 1))
+
+        return [x[i] for i in indices], [y[indices] for y in values]
+
+    def RenderConcurrently(self, calls):
+        '''Renders several charts, in a process pool when max_workers is set
+        Args:
+            calls: List of [method name, list of arguments] pairs, e.g. [['GetCrisisEventsPlots', [data, name]]].
+                The arguments are pickled for the worker processes, so they must be Python objects, not CLR objects
+        Returns:
+            List with the results of the methods in the order of the calls'''
+        calls = [(str(method), list(args)) for method, args in calls]
+        executable = get_python_executable()
+        if not self.max_workers or len(calls) < 2 or executable is None:
+            return [getattr(self, method)(*args) for method, args in calls]
+
+        # The report runs inside an embedded interpreter: forking it is unsafe and sys.executable is not
+        # python, so the workers are spawned from the python executable of the same installation
+        context = multiprocessing.get_context('spawn')
+        context.set_executable(executable)
+        settings = (self.image_format, self.dpi, self.decimation)
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as executor:
+            return list(executor.map(render, [settings] * len(calls), *zip(*calls)))
+
+    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
+                           name = "returns-per-trade.png", width = 7, height = 5,
+                           live_color = "#ff9914", backtest_color = "#71c3fc"):
+
+        if len(returns_per_trade) == 0:
+            base64 = self.get_insufficient_data(width, height, 30)
             return base64
 
         if len(live_returns_per_trade) > 0:
@@ -137,10 +219,11 @@ class ReportCharts:
 
     def GetCumulativeReturns(self, data = None, live_data = None, benchmark_symbol = 'SPY',
                                  name = "cumulative-return.png", width = 11.5, height = 2.5, live_color = "#ff9914",
-                                 backtest_color = "#71c3fc", gray = "#b3bcc0"):
+                                 backtest_color = "#71c3fc", gray = "#b3bcc0", max_points = None):
         '''
         data: [ [strategyTime], [strategyPoints], [benchTime], [benchResults] ]
         live_data: [ [strategyTime], [strategyPoints], [benchTime], [benchResults] ]
+        max_points: Maximum number of points of each series, see decimate
         '''
 
         # Initialize lists here instead of method signature to avoid
@@ -151,30 +234,7 @@ class ReportCharts:
             live_data = [[],[],[],[]]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         plt.figure()
@@ -188,7 +248,8 @@ class ReportCharts:
 
         for i, array in enumerate(values):
             if any(array[0]):
-                ax.plot(array[0], array[1], linewidth=0.5, color=colors[i], drawstyle='steps-post')
+                time, (points,) = self.decimate(array[0], [array[1]], width, max_points)
+                ax.plot(time, points, linewidth=0.5, color=colors[i], drawstyle='steps-post')
             else:
                 # We have nothing for this graph. Wipe any mention of it
                 labels_removed.append(labels[i])
@@ -200,30 +261,7 @@ class ReportCharts:
 
         # Return if we don't have any valid labels
         if not any(labels):
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         live_labels = []
@@ -236,7 +274,8 @@ class ReportCharts:
 
             for i, array in enumerate(values):
                 if any(array[0]):
-                    ax.plot(array[0], array[1], linewidth=0.5, color=colors[i], drawstyle='steps-post')
+                    time, (points,) = self.decimate(array[0], [array[1]], width, max_points)
+                    ax.plot(time, points, linewidth=0.5, color=colors[i], drawstyle='steps-post')
                     rectangles.append(plt.Rectangle((0, 0), 1, 1, fc=colors[i]))
 
         ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
@@ -266,30 +305,7 @@ class ReportCharts:
                             name = "daily-returns.png", width = 11.5, height = 2.5,
                             live_color = "#ff9914", backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(returns[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         returns[0] = list(returns[0])
@@ -359,30 +375,7 @@ class ReportCharts:
 
         if len(returns) == 0:
             print("No monthly returns found")
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 30)
             return base64
 
         # Make data frame
@@ -468,30 +461,7 @@ class ReportCharts:
             live_data = [[], []]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 30)
             return base64
 
         # Cast to list just in case
@@ -529,33 +499,10 @@ class ReportCharts:
         return base64
 
     def GetDrawdown(self, data = [[],[]], live_data = [[],[]], worst = [{}], name = "drawdowns.png",
-                        width = 11.5, height = 2.5, gray = "#b3bcc0"):
+                        width = 11.5, height = 2.5, gray = "#b3bcc0", max_points = None):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         time = list(data[0]) + list(live_data[0])
@@ -569,7 +516,9 @@ class ReportCharts:
 
         # Backtest
         #ax.plot(time, drawdown, color=gray, zorder=2)
-        ax.fill_between(time, drawdown, 0, color=gray, zorder=3, step='post')
+        # The worst drawdown periods are looked up in the full series, only the plotted points are decimated
+        plot_time, (plot_drawdown,) = self.decimate(time, [drawdown], width, max_points)
+        ax.fill_between(plot_time, plot_drawdown, 0, color=gray, zorder=3, step='post')
 
         for index, values in enumerate(worst):
             start = values['Begin']
@@ -616,13 +565,7 @@ class ReportCharts:
     def GetCrisisEventsPlots(self, data = [[],[],[]], name = '', width = 7, height = 5,
                              backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-            base64 = self.fig_to_base64(f'{name}.png', fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.get_placeholder(width, height)
 
         plt.figure()
         ax = plt.gca()
@@ -658,30 +601,7 @@ class ReportCharts:
                         backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
 
         if len(data[0]) == 0 and len(live_data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         # Data will come in the following format:
@@ -749,30 +669,7 @@ class ReportCharts:
                                 width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                                 backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         plt.figure()
@@ -838,30 +735,7 @@ class ReportCharts:
     def GetAssetAllocation(self, data = [[],[]], live_data = [[],[]],
                               name="asset-allocation.png", width = 7, height = 5):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 30)
             return {"Backtest Asset Allocation": base64}
 
         symbols = [data[0], live_data[0]]
@@ -904,33 +778,10 @@ class ReportCharts:
         return pies
 
     def GetLeverage(self, data = [[],[]], live_data = [[],[]], name = "leverage.png",width = 11.5,
-                        height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914",):
+                        height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914", max_points = None):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
         labels = ['Backtest']
@@ -940,13 +791,15 @@ class ReportCharts:
         fig = ax.get_figure()
 
         # Backtest
-        ax.fill_between(data[0], 0, data[1], color = backtest_color, alpha = 0.75, step='post')
+        time, (leverage,) = self.decimate(data[0], [data[1]], width, max_points)
+        ax.fill_between(time, 0, leverage, color = backtest_color, alpha = 0.75, step='post')
 
         # Live
         if len(live_data[0]) != 0:
             labels.append('Live')
 
-        ax.fill_between(live_data[0], 0, live_data[1], color=live_color, alpha=0.75, step = 'post')
+        live_time, (live_leverage,) = self.decimate(live_data[0], [live_data[1]], width, max_points)
+        ax.fill_between(live_time, 0, live_leverage, color=live_color, alpha=0.75, step = 'post')
 
         rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=live_color)]
         ax.legend(rectangles, [label for label in labels], handlelength=0.8, handleheight=0.8,
@@ -972,34 +825,17 @@ class ReportCharts:
 
     def GetExposure(self, time = [], long_securities = [], short_securities = [], long_data = [[]], short_data = [[]],
                         live_time = [], live_long_securities = [], live_short_securities = [], live_long_data = [[]],
-                        live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5):
+                        live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5, max_points = None):
         if len(time) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
+            base64 = self.get_insufficient_data(width, height, 20)
             return base64
 
+        # The long and short series are decimated together so the stacked areas keep sharing the same times
+        time, data = self.decimate(time, list(long_data) + list(short_data), width, max_points)
+        long_data, short_data = data[:len(long_data)], data[len(long_data):]
+        live_time, data = self.decimate(live_time, list(live_long_data) + list(live_short_data), width, max_points)
+        live_long_data, live_short_data = data[:len(live_long_data)], data[len(live_long_data):]
+
         for k, v in list(self.color_map.items()):
             self.color_map[k + ' - Short'] = '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6)
 
@@ -1146,3 +982,73 @@ class ReportCharts:
         plt.clf()
         plt.close('all')
         return base64
+
+def get_python_executable():
+    '''Gets the python executable that can start the workers of the process pool, None if there is none'''
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    name = 'python.exe' if os.name == 'nt' else f'python{sys.version_info.major}.{sys.version_info.minor}'
+    for folder in [sys.base_exec_prefix, os.path.join(sys.base_exec_prefix, 'bin')]:
+        executable = os.path.join(folder, name)
+        if os.path.isfile(executable):
+            return executable
+    return None
+
+def render(settings, method, args):
+    '''Renders a chart in a worker process of ReportCharts.RenderConcurrently'''
+    image_format, dpi, decimation = settings
+    return getattr(ReportCharts(image_format, dpi, decimation=decimation), method)(*args)
+
+def get_minmax_indices(values, buckets):
+    '''Gets the indices of the first and last points and of the minimum and maximum of every series in each bucket of points
+    Args:
+        values: List of arrays of the same length
+        buckets: Number of buckets the points are split into
+    Returns:
+        Sorted array of unique indices'''
+    length = len(values[0])
+    size = -(-length // buckets)
+    buckets = -(-length // size)
+    offsets = np.arange(buckets) * size
+
+    indices = [np.array([0, length - 1])]
+    for y in values:
+        # Missing values are never picked unless the whole bucket is missing
+        padded = np.full(buckets * size, np.nan)
+        padded[:length] = y
+        padded = padded.reshape(buckets, size)
+        indices.append(offsets + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1))
+        indices.append(offsets + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1))
+
+    indices = np.unique(np.concatenate(indices))
+    return indices[indices < length]
+
+def get_lttb_indices(x, y, threshold):
+    '''Gets the indices of the points selected by the Largest Triangle Three Buckets algorithm, plus the minimum and maximum of the series
+    Args:
+        x: Array of the x values as numbers
+        y: Array of the y values
+        threshold: Number of points to select
+    Returns:
+        Array of indices'''
+    length = len(y)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    y = np.where(np.isnan(y), 0, y)
+    edges = np.linspace(1, length - 1, threshold - 1).astype(int)
+    indices = np.zeros(threshold, dtype=int)
+    indices[-1] = length - 1
+
+    # The third vertex of the triangles is the average point of the next bucket, the last one is the last point
+    counts = np.diff(np.append(edges, length))
+    average_x = np.add.reduceat(x, edges) / counts
+    average_y = np.add.reduceat(y, edges) / counts
+
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        a = indices[i]
+        areas = np.abs((x[a] - average_x[i + 1]) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (average_y[i + 1] - y[a]))
+        indices[i + 1] = start + np.argmax(areas)
+
+    return np.concatenate([indices, [np.argmin(y), np.argmax(y)]])
@@ -14,6 +14,7 @@
 */
 
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Python;
 
 
@@ -35,7 +36,11 @@ namespace QuantConnect.Report.ReportElements
                 dynamic module = Py.Import("ReportCharts");
                 var classObj = module.ReportCharts;
 
-                Charting = classObj.Invoke();
+                // 'png' or 'svg' images, and the number of processes used to render charts concurrently, none by default
+                Charting = classObj.Invoke(
+                    Config.Get("report-chart-format", "png").ToPython(),
+                    200.ToPython(),
+                    Config.GetInt("report-chart-workers").ToPython());
             }
         }
     }
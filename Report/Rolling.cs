@@ -14,7 +14,6 @@
 */
 
 using Deedle;
-using MathNet.Numerics.Statistics;
 using System;
 using System.Collections.Generic;
 using System.Linq;
@@ -35,11 +34,8 @@ namespace QuantConnect.Report
         /// <returns>Rolling beta</returns>
         public static Series<DateTime, double> Beta(Series<DateTime, double> equityCurve, Series<DateTime, double> benchmarkSeries, int windowSize = 132)
         {
-            var dailyReturnsSeries = equityCurve.ResampleEquivalence(date => date.Date, s => s.LastValue())
-                .PercentChange();
-
-            var benchmarkReturns = benchmarkSeries.ResampleEquivalence(date => date.Date, s => s.LastValue())
-                .CumulativeReturns();
+            var dailyReturnsSeries = DailyReturns(equityCurve);
+            var benchmarkReturns = DailyReturns(benchmarkSeries);
 
             var returns = Frame.CreateEmpty<DateTime, string>();
             returns["strategy"] = dailyReturnsSeries;
@@ -47,16 +43,42 @@ namespace QuantConnect.Report
                 .FillMissing(Direction.Forward)
                 .DropSparseRows();
 
-            var correlation = returns
-                .Window(windowSize)
-                .SelectValues(x => Correlation.Pearson(x["strategy"].Values, x["benchmark"].Values));
+            var keys = returns.RowKeys.ToList();
+            var strategy = returns.GetColumn<double>("strategy").Values.ToList();
+            var benchmark = returns.GetColumn<double>("benchmark").Values.ToList();
 
-            var portfolioStandardDeviation = dailyReturnsSeries.Window(windowSize).SelectValues(s => s.StdDev());
-            var benchmarkStandardDeviation = benchmarkReturns.Window(windowSize).SelectValues(s => s.StdDev());
+            var rollingBetaKeys = new List<DateTime>();
+            var rollingBetaValues = new List<double>();
+            var statistics = new RollingStatistics();
 
-            return (correlation * (portfolioStandardDeviation / benchmarkStandardDeviation))
-                .FillMissing(Direction.Forward)
-                .DropMissing();
+            for (var i = 0; i < keys.Count; i++)
+            {
+                statistics.Add(strategy[i], benchmark[i]);
+                if (i >= windowSize)
+                {
+                    statistics.Remove(strategy[i - windowSize], benchmark[i - windowSize]);
+                }
+                if (statistics.Count < windowSize)
+                {
+                    continue;
+                }
+
+                var beta = statistics.HasInvalidSamples ? double.NaN : statistics.Covariance / statistics.VarianceY;
+                if (double.IsNaN(beta) || double.IsInfinity(beta))
+                {
+                    // Forward fill the windows where beta is undefined
+                    if (rollingBetaValues.Count == 0)
+                    {
+                        continue;
+                    }
+                    beta = rollingBetaValues[rollingBetaValues.Count - 1];
+                }
+
+                rollingBetaKeys.Add(keys[i]);
+                rollingBetaValues.Add(beta);
+            }
+
+            return new Series<DateTime, double>(rollingBetaKeys, rollingBetaValues);
         }
 
         /// <summary>
@@ -65,7 +87,7 @@ namespace QuantConnect.Report
         /// <param name="equityCurve">Equity curve to calculate rolling sharpe for</param>
         /// <param name="months">Number of months to calculate the rolling period for</param>
         /// <param name="riskFreeRate">Risk free rate</param>
-        /// <returns>Rolling sharpe ratio</returns>
+        /// <returns>Rolling sharpe ratio, one value per day</returns>
         public static Series<DateTime, double> Sharpe(Series<DateTime, double> equityCurve, int months, double riskFreeRate = 0.0)
         {
             if (equityCurve.IsEmpty)
@@ -73,30 +95,67 @@ namespace QuantConnect.Report
                 return equityCurve;
             }
 
-            var dailyReturns = equityCurve.ResampleEquivalence(date => date.Date, s => s.LastValue())
-                .PercentChange();
+            var dailyReturns = DailyReturns(equityCurve);
+            if (dailyReturns.IsEmpty)
+            {
+                // The equity curve covers a single day
+                return dailyReturns;
+            }
 
-            var rollingSharpeData = new List<KeyValuePair<DateTime, double>>();
-            var firstDate = equityCurve.FirstKey();
+            var returnKeys = dailyReturns.Observations.Select(kvp => kvp.Key).ToList();
+            var returnValues = dailyReturns.Observations.Select(kvp => kvp.Value).ToList();
 
-            foreach (var date in equityCurve.Keys)
+            var rollingSharpeKeys = new List<DateTime>();
+            var rollingSharpeValues = new List<double>();
+            var firstDate = dailyReturns.FirstKey();
+            var statistics = new RollingStatistics();
+            var start = 0;
+            var end = 0;
+
+            foreach (var date in dailyReturns.Keys)
             {
+                // The window holds the daily returns between n months ago and the date, both included
+                for (; end < returnKeys.Count && returnKeys[end] <= date; end++)
+                {
+                    statistics.Add(returnValues[end]);
+                }
+
                 var nMonthsAgo = date.AddMonths(-months);
+                for (; start < end && returnKeys[start] < nMonthsAgo; start++)
+                {
+                    statistics.Remove(returnValues[start]);
+                }
+
                 if (nMonthsAgo < firstDate)
                 {
                     continue;
                 }
 
-                var algoPerformanceLookback = dailyReturns.Between(nMonthsAgo, date);
-                rollingSharpeData.Add(
-                    new KeyValuePair<DateTime, double>(
-                        date,
-                        Statistics.Statistics.SharpeRatio(algoPerformanceLookback.Values.ToList(), riskFreeRate)
-                    )
-                );
+                rollingSharpeKeys.Add(date);
+                rollingSharpeValues.Add(statistics.HasInvalidSamples || statistics.Count == 0
+                    ? double.NaN
+                    : SharpeRatio(statistics.MeanX, statistics.VarianceX, riskFreeRate));
             }
 
-            return new Series<DateTime, double>(rollingSharpeData.Select(kvp => kvp.Key), rollingSharpeData.Select(kvp => kvp.Value));
+            return new Series<DateTime, double>(rollingSharpeKeys, rollingSharpeValues);
+        }
+
+        /// <summary>
+        /// Sharpe ratio from the mean and the variance of the daily returns, equivalent to <see cref="Statistics.Statistics.SharpeRatio"/>
+        /// </summary>
+        private static double SharpeRatio(double mean, double variance, double riskFreeRate, double tradingDaysPerYear = 252)
+        {
+            var annualPerformance = Math.Pow(mean + 1, tradingDaysPerYear) - 1;
+            return (annualPerformance - riskFreeRate) / Math.Sqrt(variance * tradingDaysPerYear);
+        }
+
+        /// <summary>
+        /// Daily percent change of the last value of each day of the series
+        /// </summary>
+        private static Series<DateTime, double> DailyReturns(Series<DateTime, double> series)
+        {
+            return series.ResampleEquivalence(date => date.Date, s => s.LastValue())
+                .PercentChange();
         }
     }
 }
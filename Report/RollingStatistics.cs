@@ -0,0 +1,127 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// Running mean, variance and covariance of a window of paired samples.
+    /// Samples are added to and removed from the window in O(1) using the Welford updates
+    /// </summary>
+    public class RollingStatistics
+    {
+        private double _meanX;
+        private double _meanY;
+        private double _sumSquaresX;
+        private double _sumSquaresY;
+        private double _sumProducts;
+        private int _invalidCount;
+
+        /// <summary>
+        /// Number of samples in the window, including the invalid ones
+        /// </summary>
+        public int Count { get; private set; }
+
+        /// <summary>
+        /// True if any sample of the window is NaN or infinite, which makes its statistics undefined
+        /// </summary>
+        public bool HasInvalidSamples => _invalidCount > 0;
+
+        /// <summary>
+        /// Mean of the first value of the samples
+        /// </summary>
+        public double MeanX => ValidCount > 0 ? _meanX : double.NaN;
+
+        /// <summary>
+        /// Mean of the second value of the samples
+        /// </summary>
+        public double MeanY => ValidCount > 0 ? _meanY : double.NaN;
+
+        /// <summary>
+        /// Sample variance of the first value of the samples
+        /// </summary>
+        public double VarianceX => ValidCount > 1 ? _sumSquaresX / (ValidCount - 1) : double.NaN;
+
+        /// <summary>
+        /// Sample variance of the second value of the samples
+        /// </summary>
+        public double VarianceY => ValidCount > 1 ? _sumSquaresY / (ValidCount - 1) : double.NaN;
+
+        /// <summary>
+        /// Sample covariance of the two values of the samples
+        /// </summary>
+        public double Covariance => ValidCount > 1 ? _sumProducts / (ValidCount - 1) : double.NaN;
+
+        private int ValidCount => Count - _invalidCount;
+
+        /// <summary>
+        /// Adds a sample to the window
+        /// </summary>
+        /// <param name="x">First value of the sample</param>
+        /// <param name="y">Second value of the sample, zero when only one series is tracked</param>
+        public void Add(double x, double y = 0)
+        {
+            Count++;
+            if (!IsValid(x, y))
+            {
+                _invalidCount++;
+                return;
+            }
+
+            var n = ValidCount;
+            var deltaX = x - _meanX;
+            var deltaY = y - _meanY;
+            _meanX += deltaX / n;
+            _meanY += deltaY / n;
+            _sumSquaresX += deltaX * (x - _meanX);
+            _sumSquaresY += deltaY * (y - _meanY);
+            _sumProducts += deltaX * (y - _meanY);
+        }
+
+        /// <summary>
+        /// Removes a sample that was previously added to the window
+        /// </summary>
+        /// <param name="x">First value of the sample</param>
+        /// <param name="y">Second value of the sample</param>
+        public void Remove(double x, double y = 0)
+        {
+            Count--;
+            if (!IsValid(x, y))
+            {
+                _invalidCount--;
+                return;
+            }
+
+            var n = ValidCount;
+            if (n == 0)
+            {
+                _meanX = _meanY = _sumSquaresX = _sumSquaresY = _sumProducts = 0;
+                return;
+            }
+
+            var deltaX = x - _meanX;
+            var deltaY = y - _meanY;
+            _meanX -= deltaX / n;
+            _meanY -= deltaY / n;
+            _sumSquaresX -= deltaX * (x - _meanX);
+            _sumSquaresY -= deltaY * (y - _meanY);
+            _sumProducts -= deltaX * (y - _meanY);
+        }
+
+        private static bool IsValid(double x, double y)
+        {
+            return !double.IsNaN(x) && !double.IsInfinity(x) && !double.IsNaN(y) && !double.IsInfinity(y);
+        }
+    }
+}
@@ -14,11 +14,15 @@
 */
 
 using System.Collections.Generic;
+using System.Linq;
 using NUnit.Framework;
 using Python.Runtime;
 using QuantConnect.Algorithm;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Selection;
+using QuantConnect.Securities;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+using QuantConnect.Tests.Engine.DataFeeds;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Alphas
 {
@@ -62,5 +66,60 @@ namespace QuantConnect.Tests.Algorithm.Framework.Alphas
             Assert.Ignore("The CommonAlphaModelTests need to be refactored to support multiple securities with different prices for each security");
             return null;
         }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ReleasingAPairKeepsTheConsolidatorsOfTheSymbolsUsedByAnotherPair(Language language)
+        {
+            var algorithm = CreatePricePoolAlgorithm(out var aig, out var bac, out var ibm);
+            var model = language == Language.CSharp ? CreateCSharpAlphaModel() : CreatePythonAlphaModel();
+
+            // three pairs share one consolidator per symbol
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(aig, bac, ibm));
+            Assert.AreEqual(1, GetConsolidatorCount(algorithm, aig));
+            Assert.AreEqual(1, GetConsolidatorCount(algorithm, bac));
+            Assert.AreEqual(1, GetConsolidatorCount(algorithm, ibm));
+
+            // the pairs with IBM release AIG and BAC, which are still used by the AIG/BAC pair
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(ibm));
+            Assert.AreEqual(1, GetConsolidatorCount(algorithm, aig));
+            Assert.AreEqual(1, GetConsolidatorCount(algorithm, bac));
+            Assert.AreEqual(0, GetConsolidatorCount(algorithm, ibm));
+        }
+
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void ConsolidatorIsRemovedWhenTheLastPairReleasesIt(Language language)
+        {
+            var algorithm = CreatePricePoolAlgorithm(out var aig, out var bac, out var ibm);
+            var model = language == Language.CSharp ? CreateCSharpAlphaModel() : CreatePythonAlphaModel();
+
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(aig, bac, ibm));
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(ibm));
+
+            // the AIG/BAC pair was the last one using AIG and BAC
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(bac));
+            Assert.AreEqual(0, GetConsolidatorCount(algorithm, aig));
+            Assert.AreEqual(0, GetConsolidatorCount(algorithm, bac));
+            Assert.AreEqual(0, GetConsolidatorCount(algorithm, ibm));
+        }
+
+        private static QCAlgorithm CreatePricePoolAlgorithm(out Security aig, out Security bac, out Security ibm)
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            aig = algorithm.AddEquity("AIG", _resolution);
+            bac = algorithm.AddEquity("BAC", _resolution);
+            ibm = algorithm.AddEquity("IBM", _resolution);
+            return algorithm;
+        }
+
+        private static int GetConsolidatorCount(QCAlgorithm algorithm, Security security)
+        {
+            return algorithm.SubscriptionManager
+                .SubscriptionDataConfigService
+                .GetSubscriptionDataConfigs(security.Symbol)
+                .Sum(x => x.Consolidators.Count);
+        }
     }
 }
\ No newline at end of file
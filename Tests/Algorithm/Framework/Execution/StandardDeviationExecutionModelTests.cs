@@ -135,6 +135,56 @@ namespace QuantConnect.Tests.Algorithm.Framework.Execution
             }
         }
 
+        [TestCase(Language.CSharp)]
+        [TestCase(Language.Python)]
+        public void TargetsAfterATargetWithoutDataAreExecuted(Language language)
+        {
+            var actualOrdersSubmitted = new List<SubmitOrderRequest>();
+
+            var time = new DateTime(2018, 8, 2, 16, 0, 0);
+            var historyProvider = new Mock<IHistoryProvider>();
+            historyProvider.Setup(m => m.GetHistory(It.IsAny<IEnumerable<HistoryRequest>>(), It.IsAny<DateTimeZone>()))
+                .Returns((IEnumerable<HistoryRequest> requests, DateTimeZone timeZone) => new[] { 270m, 260m, 250m }.Select((x, i) =>
+                    new Slice(time.AddMinutes(i),
+                        requests.Select(request => (BaseData)new TradeBar(time.AddMinutes(i), request.Symbol, x, x, x, x, 100m)).ToList(),
+                        time.AddMinutes(i))));
+
+            var algorithm = new QCAlgorithm();
+            algorithm.SetPandasConverter();
+            algorithm.SetHistoryProvider(historyProvider.Object);
+            algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(algorithm));
+            algorithm.SetDateTime(time.AddMinutes(5));
+
+            var aapl = algorithm.AddEquity(Symbols.AAPL.Value);
+            aapl.SetMarketPrice(new TradeBar { Value = 240 });
+            var spy = algorithm.AddEquity(Symbols.SPY.Value);
+            spy.SetMarketPrice(new TradeBar { Value = 240 });
+
+            algorithm.SetFinishedWarmingUp();
+
+            var orderProcessor = new Mock<IOrderProcessor>();
+            orderProcessor.Setup(m => m.Process(It.IsAny<SubmitOrderRequest>()))
+                .Returns((SubmitOrderRequest request) => new OrderTicket(algorithm.Transactions, request))
+                .Callback((OrderRequest request) => actualOrdersSubmitted.Add((SubmitOrderRequest)request));
+            orderProcessor.Setup(m => m.GetOpenOrders(It.IsAny<Func<Order, bool>>()))
+                .Returns(new List<Order>());
+            algorithm.Transactions.SetOrderProcessor(orderProcessor.Object);
+
+            var model = GetExecutionModel(language);
+            algorithm.SetExecution(model);
+
+            // the model has no data for AAPL, which has the largest order value so it's executed first
+            var changes = SecurityChangesTests.CreateNonInternal(new[] { spy }, Enumerable.Empty<Security>());
+            model.OnSecuritiesChanged(algorithm, changes);
+
+            var targets = new IPortfolioTarget[] { new PortfolioTarget(Symbols.AAPL, 50), new PortfolioTarget(Symbols.SPY, 10) };
+            model.Execute(algorithm, targets);
+
+            Assert.AreEqual(1, actualOrdersSubmitted.Count);
+            Assert.AreEqual(Symbols.SPY, actualOrdersSubmitted[0].Symbol);
+            Assert.AreEqual(10, actualOrdersSubmitted[0].Quantity);
+        }
+
         [TestCase(Language.CSharp, new[] { 270d, 260d, 250d }, MarketDataType.TradeBar)]
         [TestCase(Language.Python, new[] { 250d, 250d, 250d }, MarketDataType.TradeBar)]
         [TestCase(Language.CSharp, new[] { 270d, 260d, 250d }, MarketDataType.QuoteBar)]
@@ -0,0 +1,124 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using Moq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Data;
+using QuantConnect.Data.Market;
+using QuantConnect.Orders;
+using QuantConnect.Securities;
+using QuantConnect.Tests.Engine.DataFeeds;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Execution
+{
+    [TestFixture]
+    public class UnorderedQuantityCacheTests
+    {
+        private QCAlgorithm _algorithm;
+        private Security _aapl;
+        private Slice _spyOnlySlice;
+        private dynamic _evaluator;
+
+        [SetUp]
+        public void SetUp()
+        {
+            var time = new DateTime(2018, 8, 2, 16, 0, 0);
+            _algorithm = new QCAlgorithm();
+            _algorithm.SetPandasConverter();
+            _algorithm.SubscriptionManager.SetDataManager(new DataManagerStub(_algorithm));
+            _algorithm.SetDateTime(time);
+            _algorithm.Transactions.SetOrderProcessor(new Mock<IOrderProcessor>().Object);
+
+            _aapl = _algorithm.AddEquity(Symbols.AAPL.Value);
+            _aapl.SetMarketPrice(new TradeBar { Value = 100 });
+            var spy = _algorithm.AddEquity(Symbols.SPY.Value);
+            spy.SetMarketPrice(new TradeBar { Value = 100 });
+            _algorithm.SetFinishedWarmingUp();
+
+            _spyOnlySlice = new Slice(time, new List<BaseData> { new TradeBar(time, Symbols.SPY, 100, 100, 100, 100, 100) }, time);
+
+            using (Py.GIL())
+            {
+                _evaluator = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Execution.UnorderedQuantityCache import UnorderedQuantityCache
+
+class Evaluator:
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.cache = UnorderedQuantityCache()
+        self.targets = PortfolioTargetCollection()
+
+    def Evaluate(self, targets):
+        '''Gets the targets to evaluate as symbol:unordered quantity'''
+        self.targets.AddRange(targets)
+        return [f'{target.Symbol.Value}:{float(quantity):g}' for target, quantity in self.cache.GetTargets(self.algorithm, self.targets, targets)]
+").GetAttr("Evaluator").Invoke(_algorithm.ToPython());
+            }
+
+            // both quantities are cached, and evaluated without a slice
+            CollectionAssert.AreEquivalent(new[] { "AAPL:20", "SPY:10" },
+                Evaluate(new PortfolioTarget(Symbols.AAPL, 20), new PortfolioTarget(Symbols.SPY, 10)));
+            CollectionAssert.AreEquivalent(new[] { "AAPL:20", "SPY:10" }, Evaluate());
+            _algorithm.SetCurrentSlice(_spyOnlySlice);
+        }
+
+        [Test]
+        public void CachedTargetsWithoutDataInTheSliceAreSkipped()
+        {
+            CollectionAssert.AreEquivalent(new[] { "SPY:10" }, Evaluate());
+        }
+
+        [Test]
+        public void NewTargetInvalidatesTheCachedQuantity()
+        {
+            CollectionAssert.AreEquivalent(new[] { "AAPL:30", "SPY:10" }, Evaluate(new PortfolioTarget(Symbols.AAPL, 30)));
+            CollectionAssert.AreEquivalent(new[] { "SPY:10" }, Evaluate());
+        }
+
+        [Test]
+        public void HoldingsChangeInvalidatesTheCachedQuantity()
+        {
+            _aapl.Holdings.SetHoldings(100, 5);
+
+            CollectionAssert.AreEquivalent(new[] { "AAPL:15", "SPY:10" }, Evaluate());
+            CollectionAssert.AreEquivalent(new[] { "SPY:10" }, Evaluate());
+        }
+
+        [Test]
+        public void ExternalOrderInvalidatesTheCachedQuantities()
+        {
+            // an order submitted outside of the execution model
+            _algorithm.Transactions.GetIncrementOrderId();
+
+            CollectionAssert.AreEquivalent(new[] { "AAPL:20", "SPY:10" }, Evaluate());
+            CollectionAssert.AreEquivalent(new[] { "SPY:10" }, Evaluate());
+        }
+
+        private string[] Evaluate(params IPortfolioTarget[] targets)
+        {
+            using (Py.GIL())
+            {
+                return ((PyObject)_evaluator.Evaluate(targets)).As<string[]>();
+            }
+        }
+    }
+}
@@ -230,6 +230,10 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
                 Assert.AreEqual(result[0].Length(), 2);
                 Assert.AreEqual(result[0][0].Length(), 7);
                 Assert.AreEqual(result[1].Length(), 2);
+
+                // The columns of the second view are aligned with the first one: CAN outperforms USA
+                Assert.AreEqual(1, result[0][1][1].As<double>());
+                Assert.AreEqual(-1, result[0][1][6].As<double>());
             }
         }
 
@@ -151,6 +151,117 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.LessOrEqual(totalCost, _algorithm.Portfolio.TotalPortfolioValue);
         }
 
+        [TestCase(5)]
+        [TestCase(63)]
+        public void ReturnsMatrixMatchesPandasStatistics(int period)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.ReturnsMatrix import ReturnsMatrix
+
+def Test(period):
+    np.random.seed(0)
+    matrix = ReturnsMatrix(period)
+    values = pd.DataFrame(np.random.normal(0, 0.01, (3 * period, 4)), columns = ['A', 'B', 'C', 'D'])
+    values = values.mask(np.random.random(values.shape) < 0.2)
+    for time, row in values.iterrows():
+        for key, value in row.dropna().items():
+            matrix.Add(key, time, value)
+        if time == period:
+            matrix.RemoveColumn('B')
+            values.loc[:time, 'B'] = np.nan
+
+    # the last returns of each symbol, like the data frame of the rolling windows of the symbols
+    keys = ['A', 'C', 'D', 'B']
+    expected = pd.DataFrame({ key: values[key].dropna().iloc[-period:] for key in keys })[keys]
+    returns = matrix.GetReturns(keys)
+    return (np.allclose(matrix.Covariance(keys), expected.cov(), equal_nan = True),
+        np.allclose(matrix.Mean(keys), expected.mean(), equal_nan = True),
+        list(returns.index) == list(expected.index),
+        np.allclose(returns, expected, equal_nan = True))
+").GetAttr("Test");
+
+                var result = test(period);
+                Assert.IsTrue((bool)result[0], "Covariance");
+                Assert.IsTrue((bool)result[1], "Mean");
+                Assert.IsTrue((bool)result[2], "Times");
+                Assert.IsTrue((bool)result[3], "Returns");
+            }
+        }
+
+        [TestCase(5)]
+        [TestCase(10)]
+        public void ReturnsMatrixKeepsTheReturnsOfTheSymbolsWhenASymbolIsWarmedUp(int period)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.ReturnsMatrix import ReturnsMatrix
+
+def Test(period):
+    np.random.seed(1)
+    matrix = ReturnsMatrix(period)
+    values = pd.DataFrame(np.random.normal(0, 0.01, (4 * period, 3)), columns = ['A', 'B', 'C'])
+    for time in values.index[:2 * period]:
+        matrix.Add('A', time, values.at[time, 'A'])
+        matrix.Add('B', time, values.at[time, 'B'])
+
+    # C is added mid-run and its history is replayed from the start
+    for time in values.index[:2 * period]:
+        matrix.Add('C', time, values.at[time, 'C'])
+
+    keys = ['A', 'B', 'C']
+    counts = []
+    covariances = []
+    for time in values.index[2 * period:]:
+        for key in keys:
+            matrix.Add(key, time, values.at[time, key])
+        expected = values.loc[time - period + 1:time]
+        counts.extend(matrix.Count(key) for key in keys)
+        covariances.append(np.allclose(matrix.Covariance(keys), expected.cov()))
+    return counts, covariances
+").GetAttr("Test");
+
+                var result = test(period);
+                var counts = ((PyObject)result[0]).As<int[]>();
+                var covariances = ((PyObject)result[1]).As<bool[]>();
+                Assert.IsTrue(counts.All(x => x == period));
+                Assert.IsTrue(covariances.All(x => x));
+            }
+        }
+
+        [Test]
+        public void ReturnsMatrixSymbolsWithMissingOrOffsetTimesAreReady()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.ReturnsMatrix import ReturnsMatrix
+
+def Test():
+    matrix = ReturnsMatrix(5)
+    for time in range(20):
+        matrix.Add('A', time, time / 100)
+        # B trades every other day and C at times offset from A
+        if time % 2 == 0:
+            matrix.Add('B', time, time / 50)
+        matrix.Add('C', time + 0.5, time / 25)
+    return [matrix.Count(key) for key in ['A', 'B', 'C']], list(matrix.GetReturns(['B'])['B'])
+").GetAttr("Test");
+
+                var result = test();
+                CollectionAssert.AreEqual(new[] { 5, 5, 5 }, ((PyObject)result[0]).As<int[]>());
+                CollectionAssert.AreEqual(new[] { 0.2, 0.24, 0.28, 0.32, 0.36 }, ((PyObject)result[1]).As<double[]>());
+            }
+        }
+
         protected void SetPortfolioConstruction(Language language, PortfolioBias bias)
         {
             var model = GetPortfolioConstructionModel(language, Resolution.Daily, bias);
@@ -0,0 +1,246 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
+{
+    [TestFixture]
+    public class PythonPortfolioOptimizerTests
+    {
+        [TestCase("MinimumVariancePortfolioOptimizer", 5, -1)]
+        [TestCase("MinimumVariancePortfolioOptimizer", 200, -1)]
+        [TestCase("MinimumVariancePortfolioOptimizer", 20, 0)]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer", 5, -1)]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer", 200, -1)]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer", 20, 0)]
+        public void AnalyticModeIsAtLeastAsGoodAsSLSQP(string optimizerName, int size, double minimumWeight)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+def Test(size, minimum_weight):
+    np.random.seed(0)
+    returns = pd.DataFrame(np.random.normal(0.001, 0.01, (2 * size + 50, size)))
+    covariance = returns.cov().values
+
+    slsqp = {optimizerName}(minimum_weight, 1).Optimize(returns)
+    analytic = {optimizerName}(minimum_weight, 1, analytic = True).Optimize(returns)
+
+    # Rescaling to a unit budget recovers the solutions of the constrained problem,
+    # the analytic one is exact so it cannot have a larger variance
+    slsqp, analytic = slsqp / np.sum(slsqp), analytic / np.sum(analytic)
+    return bool(np.all(analytic >= minimum_weight - 1e-8)
+        and np.all(analytic <= 1 + 1e-8)
+        and analytic @ covariance @ analytic <= slsqp @ covariance @ slsqp * (1 + 1e-6))
+").GetAttr("Test");
+
+                Assert.IsTrue((bool)test(size, minimumWeight));
+            }
+        }
+
+        [TestCase("MinimumVariancePortfolioOptimizer", "target_return = 0.001")]
+        [TestCase("MinimumVariancePortfolioOptimizer", "target_return = 0.001, analytic = True")]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer", "")]
+        [TestCase("MaximumSharpeRatioPortfolioOptimizer", "analytic = True")]
+        [TestCase("RiskParityPortfolioOptimizer", "")]
+        [TestCase("UnconstrainedMeanVariancePortfolioOptimizer", "")]
+        public void OptimizeBatchMatchesOptimize(string optimizerName, string arguments)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+def Test():
+    np.random.seed(0)
+    returns = np.random.normal(0.001, 0.01, (20, 63, 5))
+    optimizer = {optimizerName}({arguments})
+
+    expected = np.array([optimizer.Optimize(pd.DataFrame(x)) for x in returns])
+    return np.allclose(optimizer.OptimizeBatch(returns), expected, atol = 1e-6)
+").GetAttr("Test");
+
+                Assert.IsTrue((bool)test());
+            }
+        }
+
+        [TestCase("MinimumVariancePortfolioOptimizer")]
+        [TestCase("RiskParityPortfolioOptimizer")]
+        public void OptimizeBatchInWorkerProcessesMatchesOptimize(string optimizerName)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.{optimizerName} import {optimizerName}
+
+def Test():
+    np.random.seed(0)
+    returns = np.random.normal(0.001, 0.01, (4, 63, 5))
+    optimizer = {optimizerName}()
+
+    expected = np.array([optimizer.Optimize(pd.DataFrame(x)) for x in returns])
+    return np.allclose(optimizer.OptimizeBatch(returns, max_workers = 2), expected, atol = 1e-6)
+").GetAttr("Test");
+
+                Assert.IsTrue((bool)test());
+            }
+        }
+
+        [TestCase("method = 'CCD'", false)]
+        [TestCase("method = 'CCD'", true)]
+        [TestCase("shrinkage = True", false)]
+        [TestCase("shrinkage = True", true)]
+        public void RiskParityModesEqualizeRiskContributions(string arguments, bool factorModel)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def Test(factorModel):
+    np.random.seed(0)
+    returns = pd.DataFrame(np.random.normal(0.001, 0.01, (100, 50)))
+    covariance = None
+    if factorModel:
+        covariance = (np.random.normal(1, 0.2, (50, 2)), np.diag([1e-4, 4e-5]), np.random.uniform(1e-5, 1e-4, 50))
+
+    optimizer = RiskParityPortfolioOptimizer({arguments})
+    weights = optimizer.Optimize(returns, covariance = covariance)
+
+    if factorModel:
+        loadings, factors, specific = covariance
+        covariance = loadings @ factors @ loadings.T + np.diag(specific)
+    elif optimizer.shrinkage:
+        covariance = optimizer.get_ledoit_wolf_covariance(returns.values)
+    else:
+        covariance = returns.cov().values
+
+    contributions = weights * (covariance @ weights)
+    return bool(np.allclose(contributions, contributions.mean(), rtol = 1e-4))
+").GetAttr("Test");
+
+                Assert.IsTrue((bool)test(factorModel));
+            }
+        }
+
+        [Test]
+        public void RiskParityWarmStartStartsFromThePreviousSolution()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def Test():
+    np.random.seed(0)
+    returns = pd.DataFrame(np.random.normal(0.001, 0.01, (100, 6)), columns = list('ABCDEF'))
+    first, second = returns[list('ABCDE')], returns[list('BCDEF')]
+
+    optimizer = RiskParityPortfolioOptimizer(warm_start = True)
+    optimizer.Optimize(first)
+    previous = optimizer.previous_solution.copy()
+    initial_guess = optimizer.get_initial_guess(second.columns)
+    weights = optimizer.Optimize(second)
+
+    # the securities still in the portfolio start from their previous solution, the new one from equal weights
+    return (bool(np.allclose(initial_guess, np.append(previous[list('BCDE')].values, 1 / 5))),
+        bool(np.allclose(weights, RiskParityPortfolioOptimizer().Optimize(second), atol = 1e-6)),
+        list(optimizer.previous_solution.index) == list('BCDEF'))
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Initial guess");
+                Assert.IsTrue((bool)result[1], "Weights");
+                Assert.IsTrue((bool)result[2], "Previous solution");
+            }
+        }
+
+        [Test]
+        public void RiskParityWarmStartKeepsThePreviousSolutionWhenTheOptimizationFails()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def Test():
+    np.random.seed(0)
+    returns = pd.DataFrame(np.random.normal(0.001, 0.01, (100, 5)))
+    optimizer = RiskParityPortfolioOptimizer(method = 'CCD', warm_start = True)
+    optimizer.Optimize(returns)
+    previous = optimizer.previous_solution.copy()
+
+    optimizer.cyclical_coordinate_descent = lambda covariance, diagonal, budget, start: (start, False)
+    weights = optimizer.Optimize(returns)
+    return bool(np.allclose(weights, 1 / 5)), bool(optimizer.previous_solution.equals(previous))
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Equal weights");
+                Assert.IsTrue((bool)result[1], "Previous solution");
+            }
+        }
+
+        [Test]
+        public void RiskParityShrinkageEstimatesTheCovarianceWhenItIsNotProvided()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def Test():
+    np.random.seed(0)
+    returns = pd.DataFrame(np.random.normal(0.001, 0.01, (60, 40)))
+    weights = RiskParityPortfolioOptimizer(shrinkage = True).Optimize(returns)
+
+    # the shrunk covariance scales the sample covariances by the same factor in (0, 1)
+    covariance = RiskParityPortfolioOptimizer().get_ledoit_wolf_covariance(returns.values)
+    sample = np.cov(returns.values.T, bias = True)
+    off_diagonal = ~np.eye(40, dtype = bool)
+    ratio = covariance[off_diagonal] / sample[off_diagonal]
+    contributions = weights * (covariance @ weights)
+
+    return (bool(np.allclose(ratio, ratio[0]) and 0 < ratio[0] < 1),
+        bool(np.allclose(contributions, contributions.mean(), rtol = 1e-4)),
+        not np.allclose(weights, RiskParityPortfolioOptimizer().Optimize(returns), atol = 1e-4))
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Shrinkage");
+                Assert.IsTrue((bool)result[1], "Risk contributions");
+                Assert.IsTrue((bool)result[2], "Differs from the sample covariance weights");
+            }
+        }
+    }
+}
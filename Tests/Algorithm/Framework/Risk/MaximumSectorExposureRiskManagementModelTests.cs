@@ -0,0 +1,207 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NodaTime;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Algorithm.Framework.Risk;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.Market;
+using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Securities;
+using QuantConnect.Securities.Equity;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+using QuantConnect.Tests.Common.Securities;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Risk
+{
+    [TestFixture]
+    public class MaximumSectorExposureRiskManagementModelTests
+    {
+        [Test]
+        public void ReducesTheTargetsOfTheSectorsOverTheLimit()
+        {
+            var targets = AssertPythonTargetsMatchCSharp((algorithm, securities, model) =>
+            {
+                // 40% of the portfolio in sector B and 10% in sector T
+                return new[]
+                {
+                    ManageRisk(model, algorithm,
+                        new PortfolioTarget(securities["B01"].Symbol, 200),
+                        new PortfolioTarget(securities["B02"].Symbol, -200),
+                        new PortfolioTarget(securities["T01"].Symbol, 100))
+                };
+            });
+
+            Assert.AreEqual(2, targets[0].Count);
+            Assert.AreEqual(100, targets[0][0].Quantity);
+            Assert.AreEqual(-100, targets[0][1].Quantity);
+        }
+
+        [Test]
+        public void TargetsOverrideTheHoldings()
+        {
+            var targets = AssertPythonTargetsMatchCSharp((algorithm, securities, model) =>
+            {
+                securities["B01"].Holdings.SetHoldings(100, 300);
+                securities["B02"].Holdings.SetHoldings(100, 100);
+
+                return new[]
+                {
+                    // the holdings of B01 are over the limit
+                    ManageRisk(model, algorithm),
+                    // but not its target
+                    ManageRisk(model, algorithm, new PortfolioTarget(securities["B01"].Symbol, 50)),
+                    // the target of B02 is also over the limit along with its holdings
+                    ManageRisk(model, algorithm, new PortfolioTarget(securities["B02"].Symbol, 300))
+                };
+            });
+
+            Assert.AreEqual(2, targets[0].Count);
+            Assert.AreEqual(0, targets[1].Count);
+            Assert.AreEqual(2, targets[2].Count);
+        }
+
+        [Test]
+        public void SecuritiesGettingFundamentalDataLaterAreIncluded()
+        {
+            var targets = AssertPythonTargetsMatchCSharp((algorithm, securities, model) =>
+            {
+                var results = new List<List<IPortfolioTarget>>
+                {
+                    // X01 doesn't have a sector yet, sector B is below the limit
+                    ManageRisk(model, algorithm,
+                        new PortfolioTarget(securities["B01"].Symbol, 150),
+                        new PortfolioTarget(securities["X01"].Symbol, 150))
+                };
+
+                SetSector(securities["X01"], "B");
+                results.Add(ManageRisk(model, algorithm));
+                return results;
+            });
+
+            Assert.AreEqual(0, targets[0].Count);
+            Assert.AreEqual(2, targets[1].Count);
+            Assert.AreEqual(100, targets[1][0].Quantity);
+        }
+
+        private static List<List<IPortfolioTarget>> AssertPythonTargetsMatchCSharp(
+            Func<QCAlgorithm, Dictionary<string, Security>, IRiskManagementModel, IEnumerable<List<IPortfolioTarget>>> run)
+        {
+            var expected = Run(Language.CSharp, run);
+            var actual = Run(Language.Python, run);
+
+            Assert.AreEqual(expected.Count, actual.Count);
+            for (var i = 0; i < expected.Count; i++)
+            {
+                CollectionAssert.AreEqual(expected[i].Select(x => x.Symbol), actual[i].Select(x => x.Symbol));
+                for (var j = 0; j < expected[i].Count; j++)
+                {
+                    Assert.AreEqual((double)expected[i][j].Quantity, (double)actual[i][j].Quantity, 1e-6);
+                }
+            }
+            return expected;
+        }
+
+        private static List<List<IPortfolioTarget>> Run(Language language,
+            Func<QCAlgorithm, Dictionary<string, Security>, IRiskManagementModel, IEnumerable<List<IPortfolioTarget>>> run)
+        {
+            var algorithm = new QCAlgorithm();
+            algorithm.SetPandasConverter();
+            algorithm.Portfolio.SetCash(100000);
+
+            var universe = new UserDefinedUniverse(SecurityTests.CreateTradeBarConfig(),
+                new UniverseSettings(Resolution.Minute, 1, false, false, TimeSpan.Zero), TimeSpan.FromDays(1), new List<Symbol>());
+            algorithm.UniverseManager.Add(universe.Configuration.Symbol, universe);
+
+            // X01 gets its fundamental data later, options don't have fundamental data
+            var securities = new[] { ("B01", "B"), ("B02", "B"), ("T01", "T"), ("X01", null) }
+                .Select(x => AddEquity(algorithm, universe, x.Item1, x.Item2))
+                .ToDictionary(x => x.Symbol.Value);
+            var option = AddSecurity(algorithm, universe, new Security(Symbols.SPY_C_192_Feb19_2016,
+                SecurityExchangeHours.AlwaysOpen(DateTimeZone.Utc),
+                new Cash(Currencies.USD, 0, 1),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache()));
+
+            IRiskManagementModel model;
+            if (language == Language.Python)
+            {
+                using (Py.GIL())
+                {
+                    const string name = nameof(MaximumSectorExposureRiskManagementModel);
+                    var instance = Py.Import(name).GetAttr(name).Invoke(0.2.ToPython());
+                    model = new RiskManagementModelPythonWrapper(instance);
+                }
+            }
+            else
+            {
+                model = new MaximumSectorExposureRiskManagementModel(0.2m);
+            }
+
+            model.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(securities.Values.Append(option).ToArray()));
+            return run(algorithm, securities, model).ToList();
+        }
+
+        private static List<IPortfolioTarget> ManageRisk(IRiskManagementModel model, QCAlgorithm algorithm, params IPortfolioTarget[] targets)
+        {
+            return model.ManageRisk(algorithm, targets).OrderBy(x => x.Symbol.Value).ToList();
+        }
+
+        private static Security AddEquity(QCAlgorithm algorithm, Universe universe, string ticker, string sector)
+        {
+            var security = new Equity(Symbol.Create(ticker, SecurityType.Equity, Market.USA),
+                SecurityExchangeHours.AlwaysOpen(DateTimeZone.Utc),
+                new Cash(Currencies.USD, 0, 1),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache());
+
+            if (sector != null)
+            {
+                SetSector(security, sector);
+            }
+            return AddSecurity(algorithm, universe, security);
+        }
+
+        private static Security AddSecurity(QCAlgorithm algorithm, Universe universe, Security security)
+        {
+            security.SetMarketPrice(new Tick(algorithm.Time, security.Symbol, 100, 100));
+            algorithm.Securities.Add(security);
+            universe.AddMember(algorithm.UtcTime, security, false);
+            return security;
+        }
+
+        private static void SetSector(Security security, string sector)
+        {
+            security.SetMarketPrice(new Fundamentals
+            {
+                Symbol = security.Symbol,
+                Value = 100,
+                HasFundamentalData = true,
+                CompanyReference = new CompanyReference { IndustryTemplateCode = sector }
+            });
+        }
+    }
+}
@@ -81,6 +81,11 @@ namespace QuantConnect.Tests.Algorithm.Framework.Risk
                 var price = decimalPrices[i];
                 security.Object.SetMarketPrice(new Tick(DateTime.Now, security.Object.Symbol, price, price));
                 security.Setup((m => m.Invested)).Returns(parameters.InvestedArray[i]);
+                if (holding.Quantity != 0 != parameters.InvestedArray[i])
+                {
+                    // Invested changes with the holdings, which notify the models tracking them
+                    holding.SetHoldings(parameters.InitialPrice, parameters.InvestedArray[i] ? quantity : 0);
+                }
 
                 var targets = algorithm.RiskManagement.ManageRisk(algorithm, null).ToList();
                 var shouldLiquidate = parameters.ShouldLiquidateArray[i];
@@ -0,0 +1,77 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Selection;
+using QuantConnect.Data.UniverseSelection;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Selection
+{
+    [TestFixture]
+    public class EmaCrossUniverseSelectionModelTests
+    {
+        private readonly List<Symbol> _symbols = Enumerable.Range(0, 500)
+            .Select(x => Symbol.Create($"{x:0000}", SecurityType.Equity, Market.USA))
+            .ToList();
+
+        [Test]
+        public void PythonModelSelectsTheSameSymbolsAsTheCSharpModel()
+        {
+            var algorithm = new QCAlgorithm();
+            var csharpModel = new EmaCrossUniverseSelectionModel(10, 30, 20);
+            Func<QCAlgorithm, IEnumerable<CoarseFundamental>, IEnumerable<Symbol>> selectCoarse;
+
+            using (Py.GIL())
+            {
+                var name = "EmaCrossUniverseSelectionModel";
+                dynamic pythonModel = Py.Import(name).GetAttr(name).Invoke(10.ToPython(), 30.ToPython(), 20.ToPython());
+                selectCoarse = QC500UniverseSelectionModelTests.ConvertToUniverseSelectionSymbolDelegate<IEnumerable<CoarseFundamental>>(pythonModel.SelectCoarse);
+            }
+
+            var random = new Random(0);
+            var prices = _symbols.ToDictionary(x => x, x => 100m);
+            var time = new DateTime(2020, 1, 1);
+            var selections = 0;
+
+            for (var day = 0; day < 100; day++)
+            {
+                // some symbols trend up and others down, and a few are missing every day
+                var coarse = _symbols
+                    .Where(x => random.NextDouble() > 0.05)
+                    .Select(x =>
+                    {
+                        var drift = 0.002m * (x.Value.ToInt32() % 5 - 2);
+                        prices[x] *= 1 + drift + (decimal)(random.NextDouble() - 0.5) * 0.02m;
+                        return new CoarseFundamental { Symbol = x, EndTime = time, Value = prices[x], Volume = 1000, DollarVolume = 1000 * prices[x] };
+                    })
+                    .ToList();
+
+                var expected = csharpModel.SelectCoarse(algorithm, coarse).ToList();
+                var actual = selectCoarse(algorithm, coarse).ToList();
+
+                CollectionAssert.AreEqual(expected, actual);
+                selections += expected.Count > 0 ? 1 : 0;
+                time = time.AddDays(1);
+            }
+
+            Assert.Greater(selections, 50);
+        }
+    }
+}
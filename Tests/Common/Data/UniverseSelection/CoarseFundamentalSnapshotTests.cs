@@ -0,0 +1,91 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Data.UniverseSelection;
+
+namespace QuantConnect.Tests.Common.Data.UniverseSelection
+{
+    [TestFixture]
+    public class CoarseFundamentalSnapshotTests
+    {
+        private readonly List<CoarseFundamental> _coarse = Enumerable.Range(0, 3000)
+            .Select(x => new CoarseFundamental
+            {
+                Symbol = Symbol.Create($"{x:0000}", SecurityType.Equity, Market.USA),
+                EndTime = new DateTime(2020, 1, 2),
+                Value = x % 7 == 0 ? 0 : 10 + x % 13,
+                Volume = x % 11 == 0 ? 0 : 1000 + x,
+                DollarVolume = 1000 * (x % 97),
+                HasFundamentalData = x % 5 != 0
+            })
+            .ToList();
+
+        [TestCase(false)]
+        [TestCase(true)]
+        public void CopiesTheCoarseFundamentalValuesToColumns(bool hasFundamentalDataOnly)
+        {
+            using (Py.GIL())
+            {
+                var snapshot = new CoarseFundamentalSnapshot(_coarse, hasFundamentalDataOnly);
+                var expected = _coarse.Where(x => !hasFundamentalDataOnly || x.HasFundamentalData).ToList();
+
+                Assert.AreEqual(expected.Count, snapshot.Count);
+                CollectionAssert.AreEqual(expected.Select(x => x.Symbol), snapshot.Symbols);
+                CollectionAssert.AreEqual(expected.Select(x => (double)x.Price), snapshot.Price.InvokeMethod("tolist").As<List<double>>());
+                CollectionAssert.AreEqual(expected.Select(x => (double)x.Volume), snapshot.Volume.InvokeMethod("tolist").As<List<double>>());
+                CollectionAssert.AreEqual(expected.Select(x => (double)x.DollarVolume), snapshot.DollarVolume.InvokeMethod("tolist").As<List<double>>());
+                CollectionAssert.AreEqual(expected.Select(x => x.HasFundamentalData), snapshot.HasFundamentalData.InvokeMethod("tolist").As<List<bool>>());
+
+                using var dataFrame = snapshot.GetDataFrame();
+                Assert.AreEqual(expected.Count, dataFrame.GetAttr("shape")[0].As<int>());
+                Assert.AreEqual(expected[1].ID.ToString(), dataFrame.GetAttr("index")[1].As<string>());
+            }
+        }
+
+        [Test]
+        public void VectorizedSelectionMatchesSortingTheCoarseFundamentalObjects()
+        {
+            using (Py.GIL())
+            {
+                var test = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from Selection.FundamentalUniverseSelectionModel import FundamentalUniverseSelectionModel
+
+def SelectCoarse(coarse):
+    return [x.Symbol for x in sorted([x for x in coarse if x.HasFundamentalData and x.Volume > 0 and x.Price > 0],
+                                     key = lambda x: x.DollarVolume, reverse=True)[:1000]]
+
+def SelectCoarseSnapshot(coarse):
+    snapshot = CoarseFundamentalSnapshot(coarse)
+    selected = np.flatnonzero(snapshot.HasFundamentalData & (snapshot.Volume > 0) & (snapshot.Price > 0))
+    sortedByDollarVolume = selected[FundamentalUniverseSelectionModel.GetLargestIndices(snapshot.DollarVolume[selected], 1000)]
+    return list(snapshot.GetSymbols(sortedByDollarVolume))
+");
+
+                var expected = test.GetAttr("SelectCoarse").Invoke(_coarse.ToPython()).As<List<Symbol>>();
+                var actual = test.GetAttr("SelectCoarseSnapshot").Invoke(_coarse.ToPython()).As<List<Symbol>>();
+
+                Assert.AreEqual(1000, expected.Count);
+                CollectionAssert.AreEqual(expected, actual);
+            }
+        }
+    }
+}
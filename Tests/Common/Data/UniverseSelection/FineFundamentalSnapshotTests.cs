@@ -0,0 +1,79 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.UniverseSelection;
+
+namespace QuantConnect.Tests.Common.Data.UniverseSelection
+{
+    [TestFixture]
+    public class FineFundamentalSnapshotTests
+    {
+        private readonly List<FineFundamental> _fine = Enumerable.Range(0, 100)
+            .Select(x => new FineFundamental
+            {
+                Symbol = Symbol.Create($"{x:0000}", SecurityType.Equity, Market.USA),
+                EndTime = new DateTime(2020, 1, 2),
+                CompanyReference = new CompanyReference
+                {
+                    CountryId = x % 10 == 0 ? null : "USA",
+                    IndustryTemplateCode = x % 2 == 0 ? "N" : "B"
+                },
+                // the default IPO date is out of the range of datetime64[ns]
+                SecurityReference = new SecurityReference { IPODate = x % 3 == 0 ? default : new DateTime(2000, 1, 1).AddDays(x) },
+                CompanyProfile = new CompanyProfile { MarketCap = 1000000L * x }
+            })
+            .ToList();
+
+        [Test]
+        public void ReadsTheRequestedFieldsInColumns()
+        {
+            using (Py.GIL())
+            {
+                var fields = new[] { "CompanyReference.CountryId", "CompanyReference.IndustryTemplateCode", "SecurityReference.IPODate", "MarketCap" };
+                var snapshot = new FineFundamentalSnapshot(_fine, fields);
+                var test = PyModule.FromString("testModule",
+                    @"
+import pandas as pd
+
+def Test(data):
+    assert list(data.columns) == ['CompanyReference.CountryId', 'CompanyReference.IndustryTemplateCode', 'SecurityReference.IPODate', 'MarketCap']
+    assert data['CompanyReference.CountryId'].isna().sum() == 10
+    assert list(data['CompanyReference.IndustryTemplateCode'].cat.categories) == ['B', 'N']
+    assert (data['SecurityReference.IPODate'] < pd.Timestamp(1700, 1, 1)).sum() == 34
+    assert data['SecurityReference.IPODate'].iloc[1] == pd.Timestamp(2000, 1, 2)
+    assert data['MarketCap'].iloc[5] == 5000000
+    return len(data)
+").GetAttr("Test");
+
+                Assert.AreEqual(_fine.Count, snapshot.Count);
+                Assert.AreEqual(_fine.Count, test.Invoke(snapshot.GetDataFrame()).As<int>());
+                CollectionAssert.AreEqual(new[] { _fine[7].Symbol, _fine[3].Symbol }, snapshot.GetSymbols(new PyList(new[] { 7.ToPython(), 3.ToPython() })));
+            }
+        }
+
+        [TestCase("CompanyReference.Unknown")]
+        [TestCase("CompanyReference")]
+        public void ThrowsOnUnsupportedFields(string field)
+        {
+            Assert.Throws<ArgumentException>(() => new FineFundamentalSnapshot(_fine, new[] { field }));
+        }
+    }
+}
@@ -199,5 +199,32 @@ namespace QuantConnect.Tests.Common
             Assert.IsFalse(SymbolCache.TryGetSymbol("SPY", out symbol));
             Assert.IsFalse(SymbolCache.TryGetTicker(Symbols.SPY, out ticker));
         }
+
+        [Test]
+        public void VersionChangesWhenMappingsChange()
+        {
+            var version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            // setting the same mapping again does not invalidate it
+            version = SymbolCache.Version;
+            SymbolCache.Set("SPY", Symbols.SPY);
+            Assert.AreEqual(version, SymbolCache.Version);
+
+            SymbolCache.Set("SPY", Symbols.AAPL);
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            Assert.IsFalse(SymbolCache.TryRemove("QQQ"));
+            Assert.AreEqual(version, SymbolCache.Version);
+
+            Assert.IsTrue(SymbolCache.TryRemove("SPY"));
+            Assert.AreNotEqual(version, SymbolCache.Version);
+
+            version = SymbolCache.Version;
+            SymbolCache.Clear();
+            Assert.AreNotEqual(version, SymbolCache.Version);
+        }
     }
 }
@@ -22,6 +22,7 @@ using System.Threading;
 using System.Threading.Tasks;
 using Accord.Math.Comparers;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Data.Market;
 using QuantConnect.Interfaces;
@@ -225,6 +226,111 @@ namespace QuantConnect.Tests.Engine.DataFeeds
             Assert.AreEqual(!shouldBeCached, TestTradeBarFactory.ReaderWasCalled);
         }
 
+        [Test]
+        public void ColumnarSourceIsReadFromTheCacheInBacktesting()
+        {
+            var dataType = CreateColumnarDataType();
+            var ticker = $"COLUMNAR{Guid.NewGuid():N}";
+            var existingFiles = GetColumnarCacheFiles();
+            try
+            {
+                var data = ReadColumnar(dataType, ticker, false, false);
+                var cacheFiles = GetColumnarCacheFiles().Except(existingFiles).ToList();
+                Assert.AreEqual(1, cacheFiles.Count);
+                Assert.AreEqual(1, GetColumnarReaderCalls(dataType));
+
+                // the files that are read are kept by the pruning
+                File.SetLastWriteTimeUtc(cacheFiles[0], DateTime.UtcNow.AddDays(-10));
+                var cachedData = ReadColumnar(dataType, ticker, false, false);
+                Assert.AreEqual(1, GetColumnarReaderCalls(dataType));
+                Assert.Greater(File.GetLastWriteTimeUtc(cacheFiles[0]), DateTime.UtcNow.AddDays(-1));
+
+                foreach (var result in new[] { data, cachedData })
+                {
+                    Assert.AreEqual(2, result.Count);
+                    Assert.AreEqual(new DateTime(2022, 5, 6), result[1].Time);
+                    Assert.AreEqual(11.5m, result[1].Value);
+                }
+            }
+            finally
+            {
+                DeleteNewColumnarCacheFiles(existingFiles);
+            }
+        }
+
+        [Test]
+        public void CorruptColumnarCacheFileIsParsedAgain()
+        {
+            var dataType = CreateColumnarDataType();
+            var ticker = $"COLUMNAR{Guid.NewGuid():N}";
+            var existingFiles = GetColumnarCacheFiles();
+            try
+            {
+                ReadColumnar(dataType, ticker, false, false);
+                var cacheFile = GetColumnarCacheFiles().Except(existingFiles).Single();
+                File.WriteAllText(cacheFile, "not a pickle");
+
+                var data = ReadColumnar(dataType, ticker, false, false);
+                Assert.AreEqual(2, GetColumnarReaderCalls(dataType));
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(11.5m, data[1].Value);
+
+                // the corrupt file was replaced
+                ReadColumnar(dataType, ticker, false, false);
+                Assert.AreEqual(2, GetColumnarReaderCalls(dataType));
+            }
+            finally
+            {
+                DeleteNewColumnarCacheFiles(existingFiles);
+            }
+        }
+
+        [TestCase(true, false)]
+        [TestCase(false, true)]
+        public void ColumnarSourceIsNotCachedInLiveModeOrForEphemeralData(bool isLiveMode, bool isDataEphemeral)
+        {
+            var dataType = CreateColumnarDataType();
+            var ticker = $"COLUMNAR{Guid.NewGuid():N}";
+            var existingFiles = GetColumnarCacheFiles();
+            try
+            {
+                ReadColumnar(dataType, ticker, isLiveMode, isDataEphemeral);
+                var data = ReadColumnar(dataType, ticker, isLiveMode, isDataEphemeral);
+
+                Assert.AreEqual(2, GetColumnarReaderCalls(dataType));
+                Assert.AreEqual(2, data.Count);
+                CollectionAssert.IsEmpty(GetColumnarCacheFiles().Except(existingFiles));
+            }
+            finally
+            {
+                DeleteNewColumnarCacheFiles(existingFiles);
+            }
+        }
+
+        [Test]
+        public void PruneColumnarCacheDeletesTheFilesNotUsedForLongerThanTheMaximumAge()
+        {
+            var directory = Directory.CreateDirectory(Path.Combine(Path.GetTempPath(), Guid.NewGuid().ToString("N"))).FullName;
+            try
+            {
+                var expired = Path.Combine(directory, "expired.pkl");
+                var recent = Path.Combine(directory, "recent.pkl");
+                File.WriteAllText(expired, string.Empty);
+                File.WriteAllText(recent, string.Empty);
+                File.SetLastWriteTimeUtc(expired, DateTime.UtcNow.AddDays(-31));
+                File.SetLastWriteTimeUtc(recent, DateTime.UtcNow.AddDays(-29));
+
+                TextSubscriptionDataSourceReader.PruneColumnarCache(directory, TimeSpan.FromDays(30));
+
+                Assert.IsFalse(File.Exists(expired));
+                Assert.IsTrue(File.Exists(recent));
+            }
+            finally
+            {
+                Directory.Delete(directory, true);
+            }
+        }
+
         [Test, Explicit("Performance test")]
         public void CacheMissPerformance()
         {
@@ -352,6 +458,66 @@ namespace QuantConnect.Tests.Engine.DataFeeds
             Log.Trace($"Took {timer.ElapsedMilliseconds}ms. Data count {counter}");
         }
 
+        private List<BaseData> ReadColumnar(PyObject dataType, string ticker, bool isLiveMode, bool isDataEphemeral)
+        {
+            Type type;
+            using (Py.GIL())
+            {
+                type = dataType.CreateType();
+            }
+            var config = new SubscriptionDataConfig(type, Symbol.Create(ticker, SecurityType.Base, Market.USA), Resolution.Daily,
+                TimeZones.Utc, TimeZones.Utc, false, false, false, isCustom: true);
+            var dataCacheProvider = new CustomEphemeralDataCacheProvider
+            {
+                Data = "Date,Close\n2022-05-05,10.5\n2022-05-06,11.5",
+                IsDataEphemeral = isDataEphemeral
+            };
+            var reader = new TextSubscriptionDataSourceReader(dataCacheProvider, config, _initialDate, isLiveMode);
+            var source = new SubscriptionDataSource("columnar.csv", SubscriptionTransportMedium.LocalFile, FileFormat.Columnar);
+            return reader.Read(source).ToList();
+        }
+
+        private static PyObject CreateColumnarDataType()
+        {
+            using (Py.GIL())
+            {
+                return PyModule.FromString("columnarModule",
+                    @"
+from AlgorithmImports import *
+from io import StringIO
+
+class ColumnarData(PythonData):
+    calls = 0
+
+    def ReaderColumnar(self, config, content, date, isLiveMode):
+        ColumnarData.calls += 1
+        data = pd.read_csv(StringIO(content), parse_dates=['Date'])
+        return { 'Time': data['Date'], 'Value': data['Close'] }").GetAttr("ColumnarData");
+            }
+        }
+
+        private static int GetColumnarReaderCalls(PyObject dataType)
+        {
+            using (Py.GIL())
+            {
+                return dataType.GetAttr("calls").As<int>();
+            }
+        }
+
+        private static HashSet<string> GetColumnarCacheFiles()
+        {
+            var directory = Path.Combine(Globals.Cache, "columnar");
+            return Directory.Exists(directory) ? Directory.GetFiles(directory).ToHashSet() : new HashSet<string>();
+        }
+
+        private static void DeleteNewColumnarCacheFiles(HashSet<string> existingFiles)
+        {
+            foreach (var file in GetColumnarCacheFiles().Except(existingFiles))
+            {
+                File.Delete(file);
+            }
+        }
+
         private class TestTradeBarFactory : TradeBar
         {
             /// <summary>
@@ -403,6 +403,89 @@ class CustomSimpleMovingAverage(PythonIndicator):
             }
         }
 
+        [Test]
+        public void UpdateBatchSendsAllTheValuesInASingleCall()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(
+                    Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+
+class CustomSimpleMovingAverage(PythonIndicator):
+    def __init__(self, name, period):
+        self.Name = name
+        self.Value = 0
+        self.window = RollingStatistics(period)
+        self.batches = 0
+
+    def Update(self, input):
+        self.window.Update(input.Value)
+        self.Value = self.window.Mean
+        return self.window.IsReady
+
+    def UpdateBatch(self, times, values):
+        self.batches += 1
+        self.window.UpdateBatch(values)
+        self.Value = self.window.Mean
+        return self.window.IsReady
+
+def get_data():
+    index = pd.date_range('2022-11-15', periods=6, freq='D')
+    return index, pd.Series([1.0, 10.0, np.nan, 100.0, 1000.0, 10000.0], index=index)
+");
+                var pythonIndicator = module.GetAttr("CustomSimpleMovingAverage").Invoke("custom".ToPython(), 3.ToPython());
+                var indicator = pythonIndicator.As<PythonIndicator>();
+                indicator.SetIndicator(pythonIndicator);
+                var updates = 0;
+                indicator.Updated += (_, _) => updates++;
+                Assert.IsTrue(indicator.ImplementsUpdateBatch);
+
+                var data = module.GetAttr("get_data").Invoke();
+                Assert.IsTrue(IndicatorExtensions.UpdateBatch(pythonIndicator, data[0], data[1]));
+
+                // the NaN value is skipped
+                Assert.AreEqual(1, pythonIndicator.GetAttr("batches").As<int>());
+                Assert.AreEqual(5, indicator.Samples);
+                Assert.IsTrue(indicator.IsReady);
+                Assert.AreEqual(3700m, indicator.Current.Value);
+                Assert.AreEqual(new DateTime(2022, 11, 20), indicator.Current.EndTime);
+
+                indicator.Update(new IndicatorDataPoint(new DateTime(2022, 11, 21), 100000m));
+                Assert.AreEqual(37000m, indicator.Current.Value);
+                Assert.AreEqual(6, indicator.Samples);
+                Assert.AreEqual(2, updates);
+            }
+        }
+
+        [Test]
+        public void UpdateBatchUpdatesCSharpIndicatorsWithEachValue()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(
+                    Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+
+def get_data():
+    index = pd.date_range('2022-11-15', periods=4, freq='D')
+    return index, pd.Series([1.0, 10.0, 100.0, 1000.0], index=index)
+");
+                var sma = new SimpleMovingAverage(2);
+                var updates = 0;
+                sma.Updated += (_, _) => updates++;
+
+                var data = module.GetAttr("get_data").Invoke();
+                Assert.IsTrue(IndicatorExtensions.UpdateBatch(sma.ToPython(), data[0], data[1]));
+
+                Assert.AreEqual(4, updates);
+                Assert.AreEqual(550m, sma.Current.Value);
+                Assert.AreEqual(new DateTime(2022, 11, 18), sma.Current.EndTime);
+            }
+        }
+
         [Test]
         public void PythonIndicatorExtensionInRegressionAlgorithm()
         {
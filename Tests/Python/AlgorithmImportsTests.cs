@@ -0,0 +1,142 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Configuration;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class AlgorithmImportsTests
+    {
+        // Loads a new copy of AlgorithmImports, which reads the configuration when it's imported
+        private const string LoadLazyAlgorithmImports = @"
+import os
+import sys
+import json
+import importlib.util
+import AlgorithmImports
+
+def load():
+    spec = importlib.util.spec_from_file_location('LazyAlgorithmImports', AlgorithmImports.__file__)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['LazyAlgorithmImports'] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_warm():
+    # the first import of a build is eager and builds the index
+    load()
+    return load()
+";
+
+        [SetUp]
+        public void SetUp()
+        {
+            Config.Set("python-lazy-algorithm-imports", "true");
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            Config.Set("python-lazy-algorithm-imports", "false");
+        }
+
+        [Test]
+        public void NamesAreResolvedOnFirstUse()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadLazyAlgorithmImports + @"
+def Test():
+    module = load_warm()
+    lazy = module._index is not None
+    imported = 'Resolution' in vars(module)
+
+    scope = {}
+    exec('from LazyAlgorithmImports import *\nresolution = Resolution.Daily\nalgorithm = QCAlgorithmFramework', scope)
+    from QuantConnect import Resolution
+    from QuantConnect.Algorithm import QCAlgorithm
+    return lazy, imported, scope['resolution'] == Resolution.Daily, scope['algorithm'] == QCAlgorithm, 'Symbol' in scope
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Index loaded");
+                Assert.IsFalse((bool)result[1], "Namespaces imported");
+                Assert.IsTrue((bool)result[2], "Resolution");
+                Assert.IsTrue((bool)result[3], "QCAlgorithmFramework");
+                Assert.IsFalse((bool)result[4], "Unreferenced name bound");
+            }
+        }
+
+        [Test]
+        public void StarImportsAreReExported()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadLazyAlgorithmImports + @"
+import types
+
+def Test():
+    load_warm()
+
+    # common.py: from AlgorithmImports import *, main.py: from common import *
+    common = types.ModuleType('LazyAlgorithmImportsCommon')
+    sys.modules[common.__name__] = common
+    exec('from LazyAlgorithmImports import *\ndef get_resolution():\n    return Resolution.Minute', common.__dict__)
+
+    scope = {}
+    exec('from LazyAlgorithmImportsCommon import *\nresolutions = [get_resolution(), Resolution.Daily]\nsymbol = Symbol', scope)
+    from QuantConnect import Resolution, Symbol
+    return scope['resolutions'] == [Resolution.Minute, Resolution.Daily], scope['symbol'] == Symbol
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Resolutions");
+                Assert.IsTrue((bool)result[1], "Symbol");
+            }
+        }
+
+        [Test]
+        public void IndexIsRebuiltWhenTheSourceChanges()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadLazyAlgorithmImports + @"
+def Test():
+    module = load_warm()
+    with open(module._indexPath) as file:
+        index = json.load(file)
+    index['build']['source'] = 'edited'
+    with open(module._indexPath, 'w') as file:
+        json.dump(index, file)
+
+    # the stale index is ignored, the import is eager and builds it again
+    module = load()
+    with open(module._indexPath) as file:
+        index = json.load(file)
+    return module._index is None, 'Resolution' in vars(module), index['build'] == module._get_build()
+").GetAttr("Test");
+
+                var result = test();
+                Assert.IsTrue((bool)result[0], "Stale index ignored");
+                Assert.IsTrue((bool)result[1], "Namespaces imported");
+                Assert.IsTrue((bool)result[2], "Index rebuilt");
+            }
+        }
+    }
+}
@@ -237,6 +237,48 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [TestCase(null)]
+        [TestCase(typeof(TradeBar))]
+        [TestCase(typeof(QuoteBar))]
+        public void ColumnarConversionMatchesPandasData(Type dataType)
+        {
+            var time = new DateTime(2020, 1, 2, 9, 31, 0);
+            var slices = Enumerable.Range(0, 10).Select(i =>
+            {
+                var start = time.AddMinutes(i);
+                var data = new List<BaseData>
+                {
+                    new TradeBar(start, Symbols.SPY, i + 101m, i + 102m, i + 100m, i + 101m, 10m * i, Time.OneMinute),
+                    new QuoteBar(start, Symbols.SPY, new Bar(i + 101m, i + 102m, i + 100m, i + 101m), 5m, new Bar(i + 102m, i + 103m, i + 101m, i + 102m), 6m, Time.OneMinute),
+                    // EURUSD has no sizes, so they are dropped from its rows
+                    new QuoteBar(start, Symbols.EURUSD, new Bar(i + 1.01m, i + 1.02m, i + 1.00m, i + 1.01m), 0m, new Bar(i + 1.02m, i + 1.03m, i + 1.01m, i + 1.02m), 0m, Time.OneMinute)
+                };
+                if (i % 2 == 0)
+                {
+                    data.Add(new TradeBar(start, Symbols.AAPL, i + 201m, i + 202m, i + 200m, i + 201m, 0m, Time.OneMinute));
+                }
+                return new Slice(start.AddMinutes(1), data, start.AddMinutes(1));
+            }).ToList();
+
+            var columnar = new PandasConverter().GetDataFrame(slices, dataType);
+            var pandasData = new PandasConverter { Columnar = false }.GetDataFrame(slices, dataType);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+def Test(columnar, pandasData):
+    return bool(columnar.equals(pandasData)
+        and columnar.index.equals(pandasData.index)
+        and list(columnar.columns) == list(pandasData.columns)
+        and list(columnar.index.names) == list(pandasData.index.names))
+").GetAttr("Test");
+
+                Assert.IsFalse(pandasData.GetAttr("empty").As<bool>());
+                Assert.IsTrue((bool)test(columnar, pandasData));
+            }
+        }
+
         [Test]
         public void HandlesNullableValues()
         {
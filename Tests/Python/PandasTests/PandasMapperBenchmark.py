@@ -0,0 +1,96 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+Micro-benchmark of the indexing overhead of PandasMapper against vanilla pandas.
+Every case indexes a Lean dataframe the same way three times: with vanilla pandas and the SID, and with the
+PandasMapper wrappers and either the SID or the ticker. It prints the time per call and the overhead.
+
+To run it directly you will need to import QuantConnect Dlls using clrloader from the appropriate
+location, see PandasMapperTests.py for the code to do it.
+'''
+
+from clr import AddReference
+AddReference("QuantConnect.Common")
+
+from QuantConnect import *
+from contextlib import contextmanager
+from timeit import Timer
+
+# Import our mapper which wraps core pandas functions (included in build dir)
+import PandasMapper
+import numpy as np
+import pandas as pd
+
+WRAPPED = [
+    (pd.core.indexing._LocationIndexer, '__getitem__'),
+    (pd.core.indexing._ScalarAccessIndexer, '__getitem__'),
+    (pd.core.indexes.base.Index, 'get_loc'),
+    (pd.core.frame.DataFrame, '__getitem__'),
+    (pd.core.indexes.base.Index, '__contains__')
+]
+
+@contextmanager
+def vanilla_pandas():
+    '''Temporarily restores the pandas functions wrapped by PandasMapper'''
+    wrappers = [(owner, name, getattr(owner, name)) for owner, name in WRAPPED]
+    try:
+        for owner, name, wrapper in wrappers:
+            setattr(owner, name, getattr(wrapper, '__wrapped__', wrapper))
+        yield
+    finally:
+        for owner, name, wrapper in wrappers:
+            setattr(owner, name, wrapper)
+
+def get_dataframe(size, rows = 390):
+    '''Creates a dataframe of close prices with a SID column per ticker, like history.close.unstack(level=0)'''
+    tickers = [f'TICKER{i}' for i in range(size)]
+    symbols = [Symbol.Create(x, SecurityType.Equity, Market.USA) for x in tickers]
+    for ticker, symbol in zip(tickers, symbols):
+        SymbolCache.Set(ticker, symbol)
+
+    columns = [str(x.ID) for x in symbols]
+    return pd.DataFrame(np.random.random((rows, size)), columns = columns), tickers, columns
+
+def measure(statement, number):
+    '''Returns the best time per call in microseconds'''
+    return min(Timer(statement).repeat(repeat = 5, number = number)) / number * 1e6
+
+def run(size = 100, number = 2000):
+    df, tickers, columns = get_dataframe(size)
+    ticker, sid = tickers[size // 2], columns[size // 2]
+    some_tickers, some_sids = tickers[::10], columns[::10]
+
+    cases = {
+        'df[key]': lambda key: lambda: df[key],
+        'df[[keys]]': lambda keys: lambda: df[keys],
+        'df.loc[:, key]': lambda key: lambda: df.loc[:, key],
+        'df.iloc[-1][key]': lambda key: lambda: df.iloc[-1][key],
+        'df.at[0, key]': lambda key: lambda: df.at[0, key],
+        'key in df': lambda key: lambda: key in df,
+        'missing in df': lambda key: lambda: 'MISSING' in df
+    }
+
+    print(f'PandasMapper overhead. {size} columns, pandas {pd.__version__}')
+    print(f'{"case":<20}{"vanilla (us)":>14}{"SID (us)":>14}{"ticker (us)":>14}{"overhead":>10}')
+    for name, case in cases.items():
+        keys = (some_sids, some_tickers) if 'keys' in name else (sid, ticker)
+        with vanilla_pandas():
+            vanilla = measure(case(keys[0]), number)
+        mapped_sid = measure(case(keys[0]), number)
+        mapped_ticker = measure(case(keys[1]), number)
+        print(f'{name:<20}{vanilla:>14.2f}{mapped_sid:>14.2f}{mapped_ticker:>14.2f}{mapped_ticker / vanilla:>9.1f}x')
+
+if __name__ == '__main__':
+    run()
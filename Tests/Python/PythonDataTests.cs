@@ -14,6 +14,9 @@
 */
 
 using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
 using NodaTime;
 using Python.Runtime;
 using NUnit.Framework;
@@ -98,6 +101,162 @@ class CustomDataTest(PythonData):
             }
         }
 
+        [Test]
+        public void ReaderBatchCreatesTheDataOfTheRowsWithTime()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def ReaderBatch(self, config, lines, date):
+        rows = [line.split(',') for line in lines if line[:1].isdigit()]
+        return pd.DataFrame({
+            'Time': pd.to_datetime([row[0] for row in rows], errors='coerce'),
+            'Value': [float(row[1]) for row in rows],
+            'Open': pd.to_numeric([row[2] for row in rows], errors='coerce'),
+            'Label': [row[3] for row in rows] })");
+
+                var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+                var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, DateTimeZone.Utc,
+                    DateTimeZone.Utc, false, false, false, isCustom: true);
+                var lines = new[] { "Date,Close,Open,Label", "2022-05-05,10.5,10,a", "2022-13-45,11,10.5,b", "2022-05-06,11.5,,c" };
+
+                Assert.IsTrue(customDataTest.ImplementsReaderBatch);
+                var data = customDataTest.ReaderBatch(config, lines, DateTime.UtcNow).Cast<PythonData>().ToList();
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(new DateTime(2022, 5, 5), data[0].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 5), data[0].EndTime);
+                Assert.AreEqual(Symbols.SPY, data[0].Symbol);
+                Assert.AreEqual(10.5m, data[0].Value);
+                Assert.AreEqual(10m, data[0]["Open"]);
+                Assert.AreEqual("a", data[0]["label"]);
+                Assert.AreEqual(11.5m, data[1].Value);
+                Assert.IsFalse(data[1].HasProperty("Open"));
+                Assert.IsTrue(data[1].IsOfType(type));
+            }
+        }
+
+        [Test]
+        public void ReaderBatchIsOptional()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def Reader(self, config, line, date, isLiveMode):
+        return None");
+
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+
+                Assert.IsFalse(customDataTest.ImplementsReaderBatch);
+            }
+        }
+
+        [Test]
+        public void ColumnarReaderParsesTheWholeContentAndCachesTheColumns()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+from io import StringIO
+
+class CustomDataTest(PythonData):
+    def GetSource(self, config, date, isLiveMode):
+        return SubscriptionDataSource('data.csv', SubscriptionTransportMedium.LocalFile, FileFormat.Columnar)
+
+    def ReaderColumnar(self, config, content, date, isLiveMode):
+        data = pd.read_csv(StringIO(content), parse_dates=['Date'])
+        return { 'Time': data['Date'], 'Value': data['Close'], 'Open': data['Open'] }");
+
+                var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+                var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, DateTimeZone.Utc,
+                    DateTimeZone.Utc, false, false, false, isCustom: true);
+                var cacheFile = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}.pkl");
+
+                try
+                {
+                    Assert.AreEqual(FileFormat.Columnar, customDataTest.GetSource(config, DateTime.UtcNow, false).Format);
+                    Assert.IsTrue(customDataTest.ImplementsReaderColumnar);
+                    Assert.IsNotEmpty(customDataTest.ReaderVersion);
+
+                    var data = customDataTest.ReaderColumnar(config, "Date,Close,Open\n2022-05-05,10.5,10\n2022-05-06,11.5,11", DateTime.UtcNow, false, cacheFile);
+                    Assert.IsTrue(File.Exists(cacheFile));
+
+                    var cachedData = customDataTest.ReadColumnarCache(config, cacheFile);
+                    foreach (var result in new[] { data, cachedData })
+                    {
+                        Assert.AreEqual(2, result.Count);
+                        Assert.AreEqual(new DateTime(2022, 5, 6), result[1].Time);
+                        Assert.AreEqual(11.5m, result[1].Value);
+                        Assert.AreEqual(11m, ((PythonData)result[1])["Open"]);
+                    }
+                }
+                finally
+                {
+                    File.Delete(cacheFile);
+                }
+            }
+        }
+
+        [Test]
+        public void ReaderVersionChangesWhenTheModuleIsEdited()
+        {
+            var file = Path.Combine(Path.GetTempPath(), $"{Guid.NewGuid():N}.py");
+            try
+            {
+                using (Py.GIL())
+                {
+                    dynamic load = PyModule.FromString("testModule",
+                        @"
+import sys
+import importlib.util
+
+def load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module.CustomDataTest()").GetAttr("load");
+
+                    var versions = new List<string>();
+                    // only a constant used by the parser is edited, the code of ReaderColumnar is the same
+                    foreach (var (name, column) in new[] { ("ReaderVersionTestA", "Close"), ("ReaderVersionTestB", "Open") })
+                    {
+                        File.WriteAllText(file, $@"
+from AlgorithmImports import *
+
+VALUE_COLUMN = '{column}'
+
+def parse(data):
+    return data[VALUE_COLUMN]
+
+class CustomDataTest(PythonData):
+    def ReaderColumnar(self, config, content, date, isLiveMode):
+        return parse(pd.read_csv(content))");
+
+                        versions.Add(new PythonData(load(name, file)).ReaderVersion);
+                    }
+
+                    Assert.AreNotEqual(versions[0], versions[1]);
+                }
+            }
+            finally
+            {
+                File.Delete(file);
+            }
+        }
+
         private static BaseData GetDataFromModule(dynamic testModule)
         {
             var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
@@ -0,0 +1,88 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Data.Market;
+using QuantConnect.Python;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class PythonGilSessionTests
+    {
+        private DataConsolidatorPythonWrapper _consolidator;
+
+        [SetUp]
+        public void SetUp()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(),
+                    "from AlgorithmImports import *\n" +
+                    "class CustomConsolidator():\n" +
+                    "   def __init__(self):\n" +
+                    "       self.InputType = TradeBar\n" +
+                    "       self.OutputType = TradeBar\n" +
+                    "       self.Consolidated = None\n" +
+                    "       self.WorkingData = None\n" +
+                    "   def Update(self, data):\n" +
+                    "       self.WorkingData = data\n");
+
+                _consolidator = new DataConsolidatorPythonWrapper(module.GetAttr("CustomConsolidator").Invoke());
+            }
+
+            PythonGilSession.StatisticsEnabled = true;
+            PythonGilSession.ResetStatistics();
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            PythonGilSession.StatisticsEnabled = false;
+            PythonGilSession.ResetStatistics();
+        }
+
+        [TestCase(true, 1)]
+        [TestCase(false, 3)]
+        public void CallbacksInsideOfASessionDoNotAcquireTheGil(bool session, int expectedTransitions)
+        {
+            using (session ? PythonGilSession.Begin() : null)
+            {
+                for (var i = 0; i < 3; i++)
+                {
+                    _consolidator.Update(new TradeBar { Symbol = Symbols.SPY, Time = DateTime.Today.AddMinutes(i), Value = i });
+                }
+            }
+
+            Assert.AreEqual(expectedTransitions, PythonGilSession.Transitions);
+            Assert.AreEqual(3, PythonGilSession.GetCalls("Consolidator"));
+            Assert.Greater(PythonGilSession.GetTime("Consolidator"), TimeSpan.Zero);
+            Assert.AreEqual(0, PythonGilSession.GetCalls("OnData"));
+        }
+
+        [Test]
+        public void NothingIsCountedWhenStatisticsAreDisabled()
+        {
+            PythonGilSession.StatisticsEnabled = false;
+
+            _consolidator.Update(new TradeBar { Symbol = Symbols.SPY, Time = DateTime.Today, Value = 1 });
+
+            Assert.AreEqual(0, PythonGilSession.Transitions);
+            Assert.AreEqual(0, PythonGilSession.GetCalls("Consolidator"));
+        }
+    }
+}
@@ -19,8 +19,10 @@ using System.IO;
 using System.Collections.Generic;
 using System.Linq;
 using Python.Runtime;
+using QuantConnect.Configuration;
 using QuantConnect.Packets;
 using QuantConnect.Report;
+using QuantConnect.Report.ReportElements;
 using Newtonsoft.Json;
 
 namespace QuantConnect.Tests.Report
@@ -39,6 +41,90 @@ namespace QuantConnect.Tests.Report
             }
         }
 
+        [TestCase("minmax")]
+        [TestCase("lttb")]
+        public void DecimationKeepsChartsVisuallyUnchangedAndUsesLessMemory(string decimation)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import io
+import tracemalloc
+import numpy as np
+import pandas as pd
+import matplotlib.image as mpimg
+from base64 import b64decode
+from ReportCharts import ReportCharts
+
+def render(chart, *args, **kwargs):
+    tracemalloc.start()
+    base64 = chart(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return mpimg.imread(io.BytesIO(b64decode(base64.split(',')[1]))), peak
+
+def Test(decimation):
+    np.random.seed(0)
+    size = 200000
+    times = list(pd.date_range('2015-01-01', periods=size, freq='5min').to_pydatetime())
+    equity = np.cumsum(np.random.normal(0, 0.1, size))
+    benchmark = np.cumsum(np.random.normal(0, 0.1, size))
+    data = [times, list(equity), times, list(benchmark)]
+
+    charts = ReportCharts(decimation=decimation)
+    full, full_memory = render(charts.GetCumulativeReturns, data, max_points=0)
+    decimated, decimated_memory = render(charts.GetCumulativeReturns, data)
+
+    # The share of the pixels that change noticeably
+    changed = float((np.abs(full - decimated).max(axis=2) > 0.25).mean()) if full.shape == decimated.shape else 1.0
+    return str(full.shape), str(decimated.shape), changed, full_memory, decimated_memory
+").GetAttr("Test");
+
+                var result = test(decimation);
+                Assert.AreEqual((string)result[0], (string)result[1], "The size of the images differs");
+                Assert.Less((double)result[2], 0.01, "More than 1% of the pixels changed");
+                Assert.Less((long)result[4], (long)result[3], "The decimated chart didn't use less memory");
+            }
+        }
+
+        [TestCase(0)]
+        [TestCase(2)]
+        public void CrisisChartsAreRenderedInWorkerProcesses(int workers)
+        {
+            var equity = new Series("Equity");
+            var benchmark = new Series("Benchmark");
+            var random = new Random(0);
+            var value = 100000m;
+            for (var time = new DateTime(2014, 9, 1); time <= new DateTime(2015, 11, 1); time = time.AddDays(1))
+            {
+                value *= 1 + (decimal)random.NextDouble() / 100 - 0.005m;
+                equity.AddPoint(time, value);
+                benchmark.AddPoint(time, value / 1000);
+            }
+
+            var strategyEquityChart = new Chart("Strategy Equity");
+            strategyEquityChart.AddSeries(equity);
+            var benchmarkChart = new Chart("Benchmark");
+            benchmarkChart.AddSeries(benchmark);
+            var backtest = new BacktestResult
+            {
+                Charts = new Dictionary<string, Chart> { [strategyEquityChart.Name] = strategyEquityChart, [benchmarkChart.Name] = benchmarkChart }
+            };
+
+            Config.Set("report-chart-workers", workers.ToStringInvariant());
+            try
+            {
+                // New Normal 2014-2019, European Debt Crisis 2014 and Market Sell-Off 2015
+                var html = new CrisisReportElement("crisis plots", ReportKey.CrisisPlots, backtest, null).Render();
+                Assert.AreEqual(3, html.Split("data:image/png;base64,").Length - 1);
+            }
+            finally
+            {
+                Config.Set("report-chart-workers", "0");
+            }
+        }
+
         [Test]
         public void ExposureReportWorksForEverySecurityType()
         {
@@ -0,0 +1,167 @@
+﻿/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Deedle;
+using NUnit.Framework;
+using QuantConnect.Report;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace QuantConnect.Tests.Report
+{
+    [TestFixture]
+    public class RollingTests
+    {
+        [TestCase(6)]
+        [TestCase(12)]
+        public void SharpeMatchesSharpeRatioOfEachWindow(int months)
+        {
+            var equity = CreateEquityCurve(800, 0.0005, 0.01, 1);
+            var dailyReturns = equity.PercentChange();
+
+            var rolling = Rolling.Sharpe(equity, months);
+
+            Assert.AreEqual(equity.Keys.Count(x => x.AddMonths(-months) >= equity.FirstKey()), rolling.KeyCount);
+            foreach (var kvp in rolling.Observations)
+            {
+                var window = dailyReturns.Between(kvp.Key.AddMonths(-months), kvp.Key).Values.ToList();
+                var expected = QuantConnect.Statistics.Statistics.SharpeRatio(window, 0);
+
+                Assert.AreEqual(expected, kvp.Value, 1e-9);
+            }
+        }
+
+        [Test]
+        public void SharpeIsDailyForIntradayEquityCurves()
+        {
+            var start = new DateTime(2020, 1, 1);
+            var keys = Enumerable.Range(0, 400 * 24).Select(x => start.AddHours(x)).ToList();
+            var equity = new Series<DateTime, double>(keys, keys.Select((x, i) => 100000 + i + 50 * Math.Sin(i)));
+
+            var rolling = Rolling.Sharpe(equity, 6);
+
+            Assert.IsTrue(rolling.Keys.All(x => x == x.Date));
+            Assert.AreEqual(rolling.KeyCount, rolling.Keys.Distinct().Count());
+        }
+
+        [Test]
+        public void SharpeIsEmptyForASingleDay()
+        {
+            var start = new DateTime(2020, 1, 1, 9, 30, 0);
+            var keys = Enumerable.Range(0, 10).Select(x => start.AddMinutes(x)).ToList();
+            var equity = new Series<DateTime, double>(keys, keys.Select((x, i) => 100000.0 + i));
+
+            var rolling = Rolling.Sharpe(equity, 6);
+
+            Assert.IsTrue(rolling.IsEmpty);
+        }
+
+        [TestCase(22 * 6)]
+        [TestCase(252)]
+        public void BetaMatchesBetaOfEachWindow(int windowSize)
+        {
+            var benchmark = CreateEquityCurve(600, 0.0003, 0.01, 2);
+            var benchmarkReturns = benchmark.PercentChange();
+            var noise = CreateEquityCurve(600, 0, 0.005, 3).PercentChange();
+            var strategyReturns = benchmarkReturns * 1.5 + noise;
+            var equity = (strategyReturns.FillMissing(0) + 1).CumulativeProduct() * 100000;
+
+            var rolling = Rolling.Beta(equity, benchmark, windowSize);
+
+            Assert.AreEqual(600 - windowSize, rolling.KeyCount);
+            var keys = strategyReturns.DropMissing().Keys.ToList();
+            foreach (var kvp in rolling.Observations)
+            {
+                var window = keys.Where(x => x <= kvp.Key).Skip(keys.Count(x => x <= kvp.Key) - windowSize).ToList();
+                var expected = QuantConnect.Statistics.Statistics.Beta(
+                    window.Select(x => strategyReturns[x]).ToList(),
+                    window.Select(x => benchmarkReturns[x]).ToList());
+
+                Assert.AreEqual(expected, kvp.Value, 1e-9);
+            }
+        }
+
+        [Test]
+        public void RollingStatisticsMatchesTheStatisticsOfTheWindow()
+        {
+            var random = new Random(0);
+            var x = Enumerable.Range(0, 1000).Select(_ => random.NextDouble() * 100).ToList();
+            var y = x.Select(value => value * 0.5 + random.NextDouble()).ToList();
+            var statistics = new RollingStatistics();
+
+            for (var i = 0; i < x.Count; i++)
+            {
+                statistics.Add(x[i], y[i]);
+                if (i >= 50)
+                {
+                    statistics.Remove(x[i - 50], y[i - 50]);
+                }
+            }
+
+            var windowX = x.Skip(950).ToList();
+            var windowY = y.Skip(950).ToList();
+            Assert.AreEqual(50, statistics.Count);
+            Assert.AreEqual(windowX.Average(), statistics.MeanX, 1e-9);
+            Assert.AreEqual(Covariance(windowX, windowX), statistics.VarianceX, 1e-7);
+            Assert.AreEqual(Covariance(windowY, windowY), statistics.VarianceY, 1e-7);
+            Assert.AreEqual(Covariance(windowX, windowY), statistics.Covariance, 1e-7);
+        }
+
+        [Test]
+        public void RollingStatisticsIgnoresInvalidSamplesOnceRemoved()
+        {
+            var statistics = new RollingStatistics();
+            statistics.Add(1);
+            statistics.Add(double.PositiveInfinity);
+            statistics.Add(3);
+
+            Assert.IsTrue(statistics.HasInvalidSamples);
+
+            statistics.Remove(1);
+            statistics.Remove(double.PositiveInfinity);
+            statistics.Add(5);
+
+            Assert.IsFalse(statistics.HasInvalidSamples);
+            Assert.AreEqual(2, statistics.Count);
+            Assert.AreEqual(4, statistics.MeanX, 1e-12);
+            Assert.AreEqual(2, statistics.VarianceX, 1e-12);
+        }
+
+        private static double Covariance(List<double> x, List<double> y)
+        {
+            var meanX = x.Average();
+            var meanY = y.Average();
+            return x.Zip(y, (a, b) => (a - meanX) * (b - meanY)).Sum() / (x.Count - 1);
+        }
+
+        private static Series<DateTime, double> CreateEquityCurve(int days, double drift, double volatility, int seed)
+        {
+            var random = new Random(seed);
+            var start = new DateTime(2015, 1, 1);
+            var value = 100000.0;
+            var keys = Enumerable.Range(0, days).Select(x => start.AddDays(x)).ToList();
+            var values = keys.Select(_ =>
+            {
+                // Box-Muller transform of two uniform samples
+                var normal = Math.Sqrt(-2 * Math.Log(1 - random.NextDouble())) * Math.Cos(2 * Math.PI * random.NextDouble());
+                value *= 1 + drift + volatility * normal;
+                return value;
+            }).ToList();
+
+            return new Series<DateTime, double>(keys, values);
+        }
+    }
+}
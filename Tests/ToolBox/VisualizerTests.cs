@@ -0,0 +1,180 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.ToolBox
+{
+    [TestFixture]
+    public class VisualizerTests
+    {
+        private const string DataFile = "../../../Data/equity/usa/minute/aapl/20140605_trade.zip";
+
+        // Loads the visualizer without the CLI, the data file of each test is selected with load_data_file
+        private const string LoadVisualizer = @"
+import tempfile
+import importlib.util
+import numpy as np
+import pandas as pd
+from clr import AddReference
+AddReference('QuantConnect.ToolBox')
+
+spec = importlib.util.spec_from_file_location('QuantConnectVisualizer', '../../../ToolBox/Visualizer/QuantConnect.Visualizer.py')
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+Visualizer = module.Visualizer
+
+def create(data_file, arguments):
+    from QuantConnect.Python import PandasConverter
+    visualizer = Visualizer.__new__(Visualizer)
+    visualizer.arguments = {'--output': tempfile.gettempdir(), '--size': '800,400', '--chunk-size': '100'}
+    visualizer.arguments.update(arguments)
+    visualizer.pandas_converter = PandasConverter()
+    visualizer.load_data_file(data_file)
+    return visualizer
+
+def get_batch(visualizer):
+    return visualizer.filter_data(visualizer.get_data())
+";
+
+        [TestCase("10:00", "11:30", 182)]
+        [TestCase("2013-10-08 10:00", null, 361)]
+        [TestCase(null, "2013-10-07 10:00", 30)]
+        [TestCase("2013-10-08 10:00", "11:30", 91)]
+        public void FilterTimeKeepsTheRowsBetweenTheGivenTimes(string start, string end, int expected)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test(start, end):
+    index = pd.date_range('2013-10-07 09:31', '2013-10-07 16:00', freq='min').append(
+        pd.date_range('2013-10-08 09:31', '2013-10-08 16:00', freq='min'))
+    df = pd.DataFrame({'close': np.arange(len(index), dtype=float)}, index=index)
+    df = Visualizer.filter_time(df, start, end)
+    return len(df), bool((df.index.time >= pd.Timestamp('09:31').time()).all())
+").GetAttr("Test");
+
+                var result = test(start, end);
+                Assert.AreEqual(expected, (int)result[0]);
+                Assert.IsTrue((bool)result[1]);
+            }
+        }
+
+        [Test]
+        public void DecimateKeepsTheFirstLastAndExtremeRowsOfEachBucket()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test():
+    random = np.random.default_rng(1)
+    df = pd.DataFrame({'bidclose': np.cumsum(random.normal(size=1000)), 'askclose': np.cumsum(random.normal(size=1000))},
+        index=pd.date_range('2013-10-07', periods=1000, freq='s'))
+    df.iloc[5, 0] = np.nan
+    decimated = Visualizer.decimate(df, 10)
+    return (len(decimated),
+        bool(decimated.index[0] == df.index[0] and decimated.index[-1] == df.index[-1]),
+        bool((decimated.max() == df.max()).all() and (decimated.min() == df.min()).all()),
+        len(Visualizer.decimate(df.iloc[:20], 10)))
+").GetAttr("Test");
+
+                var result = test();
+                Assert.LessOrEqual((int)result[0], 2 * 2 * 10 + 2, "Decimated rows");
+                Assert.IsTrue((bool)result[1], "First and last rows");
+                Assert.IsTrue((bool)result[2], "Extremes");
+                Assert.AreEqual(20, (int)result[3], "Rows of a short data frame");
+            }
+        }
+
+        [Test]
+        public void BatchModePlotsTheCloseColumn()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test(data_file):
+    df = get_batch(create(data_file, {}))
+    return list(df.columns), len(df)
+").GetAttr("Test");
+
+                var result = test(DataFile);
+                CollectionAssert.AreEqual(new[] { "close" }, ((PyObject)result[0]).As<string[]>());
+                Assert.AreEqual(686, (int)result[1]);
+            }
+        }
+
+        [Test]
+        public void FilteredModePlotsTheGivenColumnsAndTimes()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test(data_file):
+    df = get_batch(create(data_file, {'--columns': 'open, close', '--start': '10:00', '--end': '11:30'}))
+    times = df.index.time
+    return list(df.columns), len(df), bool((times >= pd.Timestamp('10:00').time()).all() and (times <= pd.Timestamp('11:30').time()).all())
+").GetAttr("Test");
+
+                var result = test(DataFile);
+                CollectionAssert.AreEqual(new[] { "open", "close" }, ((PyObject)result[0]).As<string[]>());
+                Assert.Greater((int)result[1], 0);
+                Assert.IsTrue((bool)result[2]);
+            }
+        }
+
+        [TestCase(null)]
+        [TestCase("open,close")]
+        public void StreamModeMatchesTheBatchModeWhenTheRowsFitThePlot(string columns)
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test(data_file, columns):
+    arguments = {'--columns': columns, '--start': '10:00'}
+    stream = create(data_file, arguments).get_data_stream()
+    batch = get_batch(create(data_file, arguments))
+    return list(stream.columns) == list(batch.columns), stream.index.equals(batch.index), bool(np.allclose(stream, batch))
+").GetAttr("Test");
+
+                var result = test(DataFile, columns);
+                Assert.IsTrue((bool)result[0], "Columns");
+                Assert.IsTrue((bool)result[1], "Times");
+                Assert.IsTrue((bool)result[2], "Values");
+            }
+        }
+
+        [Test]
+        public void StreamModeDecimatesTheRowsToThePlotWidth()
+        {
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString(Guid.NewGuid().ToString(), LoadVisualizer + @"
+def Test(data_file):
+    stream = create(data_file, {'--size': '50,400'}).get_data_stream()
+    batch = get_batch(create(data_file, {}))
+    return len(stream), bool(stream.index[0] == batch.index[0] and stream.index[-1] == batch.index[-1]), \
+        bool((stream.max() == batch.max()).all() and (stream.min() == batch.min()).all())
+").GetAttr("Test");
+
+                var result = test(DataFile);
+                Assert.LessOrEqual((int)result[0], 2 * 50 + 2, "Decimated rows");
+                Assert.IsTrue((bool)result[1], "First and last rows");
+                Assert.IsTrue((bool)result[2], "Extremes");
+            }
+        }
+    }
+}
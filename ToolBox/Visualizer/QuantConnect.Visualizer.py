@@ -1,35 +1,48 @@
 """
 Usage:
-    QuantConnect.Visualizer.py DATAFILE [--assembly assembly_path] [--output output_folder] [--size height,width]
+    QuantConnect.Visualizer.py DATAFILE... [--assembly assembly_path] [--output output_folder] [--size height,width]
+                               [--columns columns] [--start start_time] [--end end_time] [--stream] [--chunk-size chunk_size]
 
 Arguments:
     DATAFILE   Absolute or relative path to a zipped data file to plot.
                Optionally the zip entry file can be declared by using '#' as separator.
+               Several files can be given, they are plotted one after the other loading the assemblies only once.
 
 Options:
     -h --help                    show this.
     -a --assembly assembly_path  path to the folder with the assemblies dll/exe [default: ../.].
     -o --output output_folder    path to the output folder, each new plot will be saved there with a random name [default: ./output_folder].
     -s, --size height,width      plot size in pixels [default: 800,400].
+    -c --columns columns         comma separated columns to plot, by default the close, price or open interest columns.
+    --start start_time           plot the data from this date time, or from this time of the day if no date is given, e.g. 2013-10-07 10:00 or 10:00.
+    --end end_time               plot the data up to this date time, or up to this time of the day if no date is given.
+    --stream                     read the data in chunks keeping only the plotted columns, decimated to the plot width.
+    --chunk-size chunk_size      data points per chunk in stream mode [default: 100000].
 
 Examples:
     QuantConnect.Visualizer.py ../relative/path/to/file.zip
     QuantConnect.Visualizer.py absolute/path/to/file.zip#zipEntry.csv
     QuantConnect.Visualizer.py absolute/path/to/file.zip -o path/to/image.png -s 1024,800
+    QuantConnect.Visualizer.py absolute/path/to/file.zip --start 10:00 --end 11:30 --columns bidclose,askclose
+    QuantConnect.Visualizer.py path/to/first.zip path/to/second.zip --stream
 """
 
 import json
 import os
+import re
 import sys
 import uuid
+import numpy as np
+import pandas as pd
 from clr import AddReference
+from itertools import islice
 from pathlib import Path
-from numpy import NaN
 
 import matplotlib as mpl
 
 mpl.use('Agg')
 
+import matplotlib.pyplot as plt
 from docopt import docopt
 from matplotlib.dates import DateFormatter
 
@@ -41,13 +54,19 @@ class Visualizer:
     This class is instantiated with the dictionary docopt generates from the CLI arguments.
 
     It contains the methods for set up and load the C# assemblies into Python. The QuantConnect.ToolBox assembly folder
-    can be declared in the module's CLI.
+    can be declared in the module's CLI. The assemblies are loaded once, then each data file is selected with load_data_file.
     """
     def __init__(self, arguments):
         self.arguments = arguments
-        zipped_data_file = Path(self.arguments['DATAFILE'].split('#')[0])
-        if not zipped_data_file.exists():
-            raise FileNotFoundError(f'File {zipped_data_file.resolve().absolute()} does not exist')
+        data_files = self.arguments['DATAFILE']
+        # The data files are resolved before moving to the assemblies folder
+        self.data_files = []
+        for data_file in [data_files] if isinstance(data_files, str) else data_files:
+            zipped_data_file = Path(data_file.split('#')[0])
+            if not zipped_data_file.exists():
+                raise FileNotFoundError(f'File {zipped_data_file.resolve().absolute()} does not exist')
+            zip_entry = data_file[len(data_file.split('#')[0]):]
+            self.data_files.append(str(zipped_data_file.resolve().absolute()) + zip_entry)
         self.palette = ['#f5ae29', '#657584', '#b1b9c3', '#222222']
         # Loads the Toolbox to access Visualizer
         self.setup_and_load_toolbox()
@@ -57,11 +76,20 @@ class Visualizer:
         from QuantConnect.Interfaces import IMapFileProvider
         localDiskMapFileProvider = LocalDiskMapFileProvider()
         Composer.Instance.AddPart[IMapFileProvider](localDiskMapFileProvider)
-        # Initizlize LeanDataReader and PandasConverter
-        from QuantConnect.ToolBox import LeanDataReader
+        # Initizlize PandasConverter, the LeanDataReader of each data file is created by load_data_file
         from QuantConnect.Python import PandasConverter
-        self.lean_data_reader = LeanDataReader(self.arguments['DATAFILE'])
         self.pandas_converter = PandasConverter()
+
+    def load_data_file(self, data_file):
+        """
+        Selects the data file to plot, creating its LeanDataReader and a new random name for its plot.
+
+        :param data_file: absolute path to a zipped data file, optionally with the zip entry after a '#' separator.
+        :return: void.
+        """
+        from QuantConnect.ToolBox import LeanDataReader
+        self.data_file = data_file
+        self.lean_data_reader = LeanDataReader(data_file)
         # Generate random name for the plot.
         self.plot_filename = self.generate_plot_filename()
 
@@ -113,26 +141,145 @@ class Visualizer:
         symbol = df.index.levels[0][0]
         return df.loc[symbol]
 
+    def get_data_stream(self):
+        """
+        Streaming version of get_data followed by filter_data: the data is read and converted in chunks, each chunk
+        is filtered and decimated to the plot width, so only a few points per pixel are kept in memory.
+        Only the plotted columns are converted, they are taken from the CLI or selected from the first chunk.
+        The symbol plotted is the first one read.
+
+        :return: a filtered and decimated pandas.DataFrame with the data from the file.
+        """
+        from System import String
+        from System.Collections.Generic import List
+        from QuantConnect.Data import BaseData
+
+        chunk_size = int(self.arguments['--chunk-size'] or 100000)
+        width = self.get_size_px()[0]
+        data_points = iter(self.lean_data_reader.Parse())
+        columns = self.select_columns([]) if self.arguments.get('--columns') else None
+        symbol = None
+        chunks = []
+
+        while True:
+            chunk = List[BaseData]()
+            for data_point in islice(data_points, chunk_size):
+                chunk.Add(data_point)
+            if chunk.Count == 0:
+                break
+
+            if columns is None:
+                df = self.pandas_converter.GetDataFrame[BaseData](chunk)
+                columns = self.select_columns(df.columns)
+            else:
+                projection = List[String]()
+                for column in columns:
+                    projection.Add(column)
+                df = self.pandas_converter.GetDataFrame[BaseData](chunk, projection)
+            if df.empty:
+                continue
+            if symbol is None:
+                symbol = df.index.get_level_values(0)[0]
+            if symbol in df.index.get_level_values(0):
+                # Columns without values in the chunk are not converted
+                df = df.loc[symbol].reindex(columns=columns)
+                chunks.append(self.decimate(self.filter_data(df), width))
+
+        if not chunks:
+            raise Exception("Data frame is empty")
+        return self.decimate(pd.concat(chunks), width)
+
     def filter_data(self, df):
         """
         Applies the filters defined in the CLI arguments to the parsed data.
-        Not fully implemented yet, it only selects the close columns.
+        By default it selects the close, price or open interest columns.
 
         :param df: pandas.DataFrame with all the data form the selected file.
         :return: a filtered pandas.DataFrame.
+        """
+        df = df.loc[:, self.select_columns(df.columns)]
+
+        start, end = self.arguments.get('--start'), self.arguments.get('--end')
+        if start or end:
+            df = self.filter_time(df, start, end)
 
-        TODO: implement column and time filters.
+        is_future_tick = 'future' in self.data_file and 'tick' in self.data_file and 'quote' in self.data_file
+        if is_future_tick:
+            df = df.replace(0, np.nan)
+        return df
+
+    def select_columns(self, columns):
+        """
+        Selects the columns to plot, the ones defined in the CLI or by default the close, price or open interest columns.
+
+        :param columns: the columns of the data.
+        :return: list with the names of the columns to plot.
         """
-        if 'tick' in self.arguments['DATAFILE']:
-            cols_to_plot = [col for col in df.columns if 'price' in col]
+        if self.arguments.get('--columns'):
+            return [col.strip() for col in self.arguments['--columns'].split(',')]
+        if 'openinterest' in self.data_file:
+            return ['openinterest']
+        if 'tick' in self.data_file:
+            cols_to_plot = [col for col in columns if 'price' in col]
         else:
-            cols_to_plot = [col for col in df.columns if 'close' in col]
-        if 'openinterest' in self.arguments['DATAFILE']:
-            cols_to_plot = ['openinterest']
-        cols_to_plot = cols_to_plot[:2] if len(cols_to_plot) == 3 else cols_to_plot
-        df = df.loc[:, cols_to_plot]
+            cols_to_plot = [col for col in columns if 'close' in col]
+        return cols_to_plot[:2] if len(cols_to_plot) == 3 else cols_to_plot
+
+    @staticmethod
+    def filter_time(df, start, end):
+        """
+        Keeps the rows between two times, both included.
+
+        :param df: pandas.DataFrame indexed by time.
+        :param start: first date time, or time of the day if it has no date. None to keep every row up to end.
+        :param end: last date time, or time of the day if it has no date. None to keep every row from start.
+        :return: a filtered pandas.DataFrame.
+        """
+        time_of_day = re.compile(r'^\d{1,2}:\d{2}(:\d{2})?$')
+        for value, is_start in [(start, True), (end, False)]:
+            if value is None:
+                continue
+            if time_of_day.match(value.strip()):
+                times, value = df.index.time, pd.Timestamp(value.strip()).time()
+            else:
+                times, value = df.index, pd.Timestamp(value)
+            df = df[times >= value] if is_start else df[times <= value]
         return df
 
+    @staticmethod
+    def decimate(df, buckets):
+        """
+        Reduces the rows to the first and last ones plus the minimum and maximum of every column in each bucket of rows.
+        The plotted lines keep their extremes at a fraction of the points.
+
+        :param df: pandas.DataFrame with the columns to plot.
+        :param buckets: number of buckets the rows are split into, the plot width in pixels.
+        :return: a pandas.DataFrame with at most 2 rows per column and bucket.
+        """
+        length = len(df)
+        if length <= 2 * buckets or df.shape[1] == 0:
+            return df
+
+        size = -(-length // buckets)
+        values = np.full((-(-length // size) * size, df.shape[1]), np.nan)
+        values[:length] = df.to_numpy(dtype=float)
+        values = values.reshape(-1, size, df.shape[1])
+        offsets = (np.arange(values.shape[0]) * size)[:, np.newaxis]
+
+        # Missing values are never picked unless the whole bucket is missing
+        low = offsets + np.argmin(np.where(np.isnan(values), np.inf, values), axis=1)
+        high = offsets + np.argmax(np.where(np.isnan(values), -np.inf, values), axis=1)
+        indices = np.unique(np.concatenate([[0, length - 1], low.ravel(), high.ravel()]))
+        return df.iloc[indices[indices < length]]
+
+    def get_size_px(self):
+        """
+        Gets the plot size in pixels defined in the CLI.
+
+        :return: list with the width and height of the plot.
+        """
+        return [int(p) for p in self.arguments['--size'].split(',')]
+
     def plot_and_save_image(self, data):
         """
         Plots the data and saves the plot as a png image.
@@ -140,20 +287,15 @@ class Visualizer:
         :param data: a pandas.DataFrame with the data to plot.
         :return: void
         """
-        is_future_tick = ('future' in self.arguments['DATAFILE'] and 'tick' in self.arguments['DATAFILE']
-                          and 'quote' in self.arguments['DATAFILE'])
-        if is_future_tick:
-            data = data.replace(0, NaN)
-
         plot = data.plot(grid=True, color=self.palette)
 
-        is_low_resolution_data = 'hour' in self.arguments['DATAFILE'] or 'daily' in self.arguments['DATAFILE']
+        is_low_resolution_data = 'hour' in self.data_file or 'daily' in self.data_file
         if not is_low_resolution_data:
             plot.xaxis.set_major_formatter(DateFormatter("%H:%M"))
             plot.set_xlabel(self.lean_data_reader.GetDataTimeZone().Id)
 
-        is_forex = 'forex' in self.arguments['DATAFILE']
-        is_open_interest = 'openinterest' in self.arguments['DATAFILE']
+        is_forex = 'forex' in self.data_file
+        is_open_interest = 'openinterest' in self.data_file
         if is_forex:
             plot.set_ylabel('exchange rate')
         elif is_open_interest:
@@ -162,20 +304,33 @@ class Visualizer:
             plot.set_ylabel('price (USD)')
 
         fig = plot.get_figure()
-        size_px = [int(p) for p in self.arguments['--size'].split(',')]
+        size_px = self.get_size_px()
         fig.set_size_inches(size_px[0] / fig.dpi, size_px[1] / fig.dpi)
         fig.savefig(self.plot_filename, transparent=True, dpi=fig.dpi)
+        # Release the figure, several files can be plotted in the same process
+        plt.close(fig)
         return
 
 
 if __name__ == "__main__":
     arguments = docopt(__doc__)
     visualizer = Visualizer(arguments)
-    # Gets the pandas.DataFrame from the data file
-    df = visualizer.get_data()
-    # Selects the columns you want to plot
-    df = visualizer.filter_data(df)
-    # Save the image
-    visualizer.plot_and_save_image(df)
-    print(visualizer.plot_filename)
-    sys.exit(0)
+    exit_code = 0
+    for data_file in visualizer.data_files:
+        try:
+            visualizer.load_data_file(data_file)
+            if arguments['--stream']:
+                # Reads, filters and decimates the data chunk by chunk
+                df = visualizer.get_data_stream()
+            else:
+                # Gets the pandas.DataFrame from the data file
+                df = visualizer.get_data()
+                # Selects the columns and times you want to plot
+                df = visualizer.filter_data(df)
+            # Save the image
+            visualizer.plot_and_save_image(df)
+            print(visualizer.plot_filename)
+        except Exception as e:
+            print(f'Failed to plot {data_file}: {e}', file=sys.stderr)
+            exit_code = 1
+    sys.exit(exit_code)
@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+parser = argparse.ArgumentParser(description='Measures the time to import a Python algorithm and AlgorithmImports in a new process')
+parser.add_argument('algorithm', nargs='?', default='../../../Algorithm.Python/BasicTemplateFrameworkAlgorithm.py', help='Algorithm file, relative to the launcher folder')
+parser.add_argument('--repetitions', type=int, default=5, help='Measured imports of each mode')
+parser.add_argument('--output', default='algorithm_imports_benchmark.json', help='File with the results of this run')
+args = parser.parse_args()
+
+launcherDirectory = "./Launcher/bin/Release"
+indexPath = os.path.join(launcherDirectory, "AlgorithmImports.index.json")
+
+# Runs in the launcher folder: loads the runtime as start.py does, then imports the algorithm module
+child = '''
+import os, sys, time, clr_loader
+from pythonnet import set_runtime
+set_runtime(clr_loader.get_coreclr(os.path.abspath("QuantConnect.Lean.Launcher.runtimeconfig.json")))
+start = time.perf_counter()
+from clr import AddReference
+AddReference("QuantConnect.Configuration")
+from QuantConnect.Configuration import Config
+Config.Set("python-lazy-algorithm-imports", sys.argv[2])
+sys.path.insert(0, os.getcwd())
+sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[1])))
+__import__(os.path.splitext(os.path.basename(sys.argv[1]))[0])
+print(time.perf_counter() - start)
+'''
+
+def measure(lazy):
+	'''Imports the algorithm in a new process, returning the seconds it took'''
+	output = subprocess.run([sys.executable, "-c", child, args.algorithm, "true" if lazy else "false"],
+		cwd=launcherDirectory, capture_output=True, text=True, check=True).stdout
+	return float(output.strip().splitlines()[-1])
+
+def remove_index():
+	if os.path.exists(indexPath):
+		os.remove(indexPath)
+
+samples = { "eager": [], "lazy-cold": [], "lazy-warm": [] }
+for x in range(args.repetitions):
+	samples["eager"].append(measure(False))
+	# the cold import of the lazy mode is an eager import that also builds the index the warm imports use
+	remove_index()
+	samples["lazy-cold"].append(measure(True))
+	samples["lazy-warm"].append(measure(True))
+
+results = {}
+for mode, values in samples.items():
+	median = statistics.median(values)
+	results[mode] = { "median": median, "samples": values }
+	print(f'{mode} import of {args.algorithm} median: {median:.3f} sec samples: [{", ".join(f"{x:.3f}" for x in values)}]')
+
+with open(args.output, 'w') as file:
+	json.dump(results, file, indent=4)
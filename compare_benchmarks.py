@@ -1,10 +1,55 @@
 import sys
 import json
+import random
+import argparse
+import statistics
+from math import comb
+from itertools import combinations
 
-print(f'Will compare benchmark results {sys.argv[2]} against reference {sys.argv[1]}')
+parser = argparse.ArgumentParser(description='Compares benchmark results against reference results')
+parser.add_argument('reference', help='Reference benchmark results')
+parser.add_argument('new', help='New benchmark results')
+parser.add_argument('--alpha', type=float, default=0.05, help='Significance level of the regression test')
+parser.add_argument('--min-effect', type=float, default=0.02, help='Smallest relative drop of the median data points per second considered a regression')
+parser.add_argument('--threshold', type=float, default=0.10, help='Relative drop allowed when there are not enough samples for the test')
+args = parser.parse_args()
 
-referenceBenchmark = json.load(open(sys.argv[1]))
-newBenchmark = json.load(open(sys.argv[2]))
+print(f'Will compare benchmark results {args.new} against reference {args.reference}')
+
+referenceBenchmark = json.load(open(args.reference))
+newBenchmark = json.load(open(args.new))
+
+def ranks(values):
+	'''Ranks of the values, ties get the mean of their ranks'''
+	order = sorted(range(len(values)), key=lambda i: values[i])
+	result = [0.0] * len(values)
+	start = 0
+	while start < len(order):
+		end = start
+		while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+			end += 1
+		for i in range(start, end + 1):
+			result[order[i]] = (start + end) / 2 + 1
+		start = end + 1
+	return result
+
+def regression_p_value(reference, new, permutations = 20000):
+	'''One sided Mann-Whitney test by permutation of the rank sums: the probability of the new samples
+	ranking as low as they do among the reference ones if both came from the same distribution'''
+	pooled = ranks(reference + new)
+	n = len(new)
+	observed = sum(pooled[len(reference):])
+
+	total = comb(len(pooled), n)
+	if total <= permutations:
+		groups = combinations(pooled, n)
+	else:
+		rng = random.Random(0)
+		groups = (rng.sample(pooled, n) for x in range(permutations))
+		total = permutations
+
+	extreme = sum(1 for group in groups if sum(group) <= observed + 1e-9)
+	return extreme / total
 
 failed = False
 for language in ["CSharp", "Python"]:
@@ -16,13 +61,32 @@ for language in ["CSharp", "Python"]:
 			continue
 		newResult = newBenchmark[language][key]
 
-		# allow 5% noise
-		expectedValue = value["average-dps"] * 0.90
-		if expectedValue > newResult["average-dps"]:
+		referenceSamples = [x for x in value.get("samples", []) if x is not None]
+		newSamples = [x for x in newResult.get("samples", []) if x is not None]
+		if not newSamples:
 			failed = True
-			print(f'Performance benchmark Failed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+			print(f'Performance benchmark Failed for algorithm {key} language {language}. No samples were recorded')
+			continue
+		if not referenceSamples:
+			print(f'Performance benchmark Skipped for algorithm {key} language {language}. No reference samples')
+			continue
+
+		referenceMedian = statistics.median(referenceSamples)
+		newMedian = statistics.median(newSamples)
+		change = newMedian / referenceMedian - 1
+
+		if len(referenceSamples) < 3 or len(newSamples) < 3:
+			# not enough samples for the test, allow a fixed noise
+			regression = change < -args.threshold
+			detail = f'allowed drop {args.threshold:.0%} without enough samples for the test'
 		else:
-			print(f'Performance benchmark Passed for algorithm {key} language {language}. Was {str(newResult["average-dps"])} expected as low as {str(expectedValue)}')
+			pValue = regression_p_value(referenceSamples, newSamples)
+			regression = pValue < args.alpha and change < -args.min_effect
+			detail = f'p-value {pValue:.4f}'
+
+		result = 'Failed' if regression else 'Passed'
+		failed |= regression
+		print(f'Performance benchmark {result} for algorithm {key} language {language}. Median {newMedian}k dps vs reference {referenceMedian}k ({change:+.1%}), {detail}')
 
 if failed:
 	exit(1)
@@ -1,58 +1,172 @@
 import os
 import re
-import sys
 import json
+import queue
+import shutil
+import argparse
+import tempfile
 import subprocess
 import statistics
+from math import comb
 from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 
-dataPath = '../../../Data'
-if len(sys.argv) > 1:
-	dataPath = sys.argv[1]
+parser = argparse.ArgumentParser(description='Runs the Lean benchmark algorithms and reports their statistics')
+parser.add_argument('dataPath', nargs='?', default='../../../Data', help='Lean data folder, relative to the launcher folder')
+parser.add_argument('--warmup', type=int, default=1, help='Runs of each benchmark that are discarded')
+parser.add_argument('--repetitions', type=int, default=5, help='Measured runs of each benchmark')
+parser.add_argument('--parallel', type=int, default=1, help='Benchmarks to run at the same time')
+parser.add_argument('--pin-cpus', action='store_true', help='Pin each parallel benchmark to its own set of CPUs')
+parser.add_argument('--filter', default=None, help='Regular expression of the names of the benchmarks to run')
+parser.add_argument('--output', default='benchmark_results.json', help='File with the results of this run')
+parser.add_argument('--history', default='benchmark_history.json', help='File the results of this run are appended to')
+args = parser.parse_args()
+
+dataPath = args.dataPath
 print(f'Using data path {dataPath}')
 
-results = {}
+launcherDirectory = "./Launcher/bin/Release"
+
+def median_confidence_interval(samples, confidence = 0.95):
+	'''Distribution free confidence interval of the median from the order statistics of the samples'''
+	values = sorted(samples)
+	n = len(values)
+	# Largest k such that P(Binomial(n, 0.5) < k) <= (1 - confidence) / 2
+	k, cumulative = 0, 0.0
+	while k < n // 2:
+		cumulative += comb(n, k) / 2 ** n
+		if cumulative > (1 - confidence) / 2:
+			break
+		k += 1
+	return [values[max(k - 1, 0)], values[n - max(k, 1)]]
+
+def summarize(samples):
+	'''Median, median absolute deviation (scaled to be consistent with the standard deviation) and confidence interval'''
+	if not samples:
+		return { "median": None, "mad": None, "ci": None }
+	median = statistics.median(samples)
+	mad = 1.4826 * statistics.median([abs(x - median) for x in samples])
+	return { "median": median, "mad": mad, "ci": median_confidence_interval(samples) }
+
+def run_algorithm(language, algorithmName, algorithmLocation, cpus):
+	'''Runs the algorithm once, returning its data points per second, length in seconds and peak resident memory in MB'''
+	resultsFolder = tempfile.mkdtemp(prefix=f'{algorithmName}-')
+	try:
+		# taskset pins the process before dotnet starts, a preexec_fn is not safe with the threads of the pool
+		pinning = ["taskset", "-c", ",".join(str(x) for x in sorted(cpus))] if cpus else []
+		process = subprocess.Popen(pinning + ["dotnet", "./QuantConnect.Lean.Launcher.dll",
+			"--data-folder " + dataPath,
+			"--algorithm-language " + language,
+			"--algorithm-type-name " + algorithmName,
+			"--algorithm-location " + algorithmLocation,
+			"--results-destination-folder " + resultsFolder,
+			"--log-handler ConsoleErrorLogHandler",
+			"--close-automatically true"],
+			cwd=launcherDirectory,
+			stdout=subprocess.DEVNULL,
+			stderr=subprocess.DEVNULL)
+
+		# wait4 gives us the resource usage of this process alone, ru_maxrss is in KB on linux
+		_, status, usage = os.wait4(process.pid, 0)
+		process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+		peakRss = usage.ru_maxrss / 1024
+
+		dataPointsPerSecond = None
+		benchmarkLength = None
+		algorithmLogs = os.path.join(resultsFolder, algorithmName + "-log.txt")
+		if os.path.exists(algorithmLogs):
+			with open(algorithmLogs, 'r') as file:
+				for line in file.readlines():
+					for match in re.findall(r"(\d+)k data points per second", line):
+						dataPointsPerSecond = int(match)
+					for match in re.findall(r" completed in (\d+(?:\.\d+)?)", line):
+						benchmarkLength = float(match)
+
+		if dataPointsPerSecond is None:
+			print(f'Algorithm {algorithmName} language {language} did not report its performance. Exit code {process.returncode}')
+		return dataPointsPerSecond, benchmarkLength, peakRss
+	finally:
+		shutil.rmtree(resultsFolder, ignore_errors=True)
+
+def run_benchmark(language, algorithmName, algorithmLocation, cpuSets):
+	'''Runs the warm up and measured repetitions of a benchmark'''
+	cpus = cpuSets.get()
+	try:
+		print(f'Start running algorithm {algorithmName} language {language}...')
+		for x in range(args.warmup):
+			run_algorithm(language, algorithmName, algorithmLocation, cpus)
+
+		runs = [run_algorithm(language, algorithmName, algorithmLocation, cpus) for x in range(args.repetitions)]
+		runs = [x for x in runs if x[0] is not None]
+	finally:
+		cpuSets.put(cpus)
+
+	dataPointsPerSecond = [x[0] for x in runs]
+	benchmarkLengths = [x[1] for x in runs if x[1] is not None]
+	peakRss = [x[2] for x in runs]
+
+	dps, length, rss = summarize(dataPointsPerSecond), summarize(benchmarkLengths), summarize(peakRss)
+	result = {
+		"average-dps": statistics.mean(dataPointsPerSecond) if dataPointsPerSecond else None,
+		"median-dps": dps["median"], "mad-dps": dps["mad"], "ci-dps": dps["ci"],
+		"samples": dataPointsPerSecond,
+		"average-length": statistics.mean(benchmarkLengths) if benchmarkLengths else None,
+		"median-length": length["median"], "mad-length": length["mad"], "ci-length": length["ci"],
+		"length-samples": benchmarkLengths,
+		"peak-rss-mb": rss["median"], "rss-samples": peakRss
+	}
+	print(f'Performance for {algorithmName} language {language} median dps: {dps["median"]}k mad: {dps["mad"]} ci: {dps["ci"]} '
+		f'samples: [{",".join(str(x) for x in dataPointsPerSecond)}] median length {length["median"]} sec peak rss {rss["median"]} MB')
+	return language, algorithmName, result
+
+# Split the CPUs between the benchmarks that run at the same time
+cpuSets = queue.Queue()
+cpus = sorted(os.sched_getaffinity(0)) if args.pin_cpus else []
+for i in range(args.parallel):
+	cpuSets.put(set(cpus[i::args.parallel]) if cpus else None)
+
+benchmarks = []
 for baseDirectory in ["Algorithm.CSharp/Benchmarks", "Algorithm.Python/Benchmarks"]:
 
 	language = baseDirectory[len("Algorithm") + 1:baseDirectory.index("/")]
-	resultsPerLanguage = {}
 
 	for algorithmFile in sorted(os.listdir(baseDirectory)):
 		if algorithmFile.endswith(("py", "cs")):
 
 			algorithmName = Path(algorithmFile).stem
+			if args.filter and not re.search(args.filter, algorithmName):
+				continue
 			algorithmLocation = "QuantConnect.Algorithm.CSharp.dll" if language == "CSharp" else os.path.join("../../../", baseDirectory, algorithmFile)
-			print(f'Start running algorithm {algorithmName} language {language}...')
-
-			dataPointsPerSecond = []
-			benchmarkLengths = []
-			for x in range(1, 2):
-
-				subprocess.run(["dotnet", "./QuantConnect.Lean.Launcher.dll",
-					"--data-folder " + dataPath,
-					"--algorithm-language " + language,
-					"--algorithm-type-name " + algorithmName,
-					"--algorithm-location " + algorithmLocation,
-					"--log-handler ConsoleErrorLogHandler",
-					"--close-automatically true"],
-					cwd="./Launcher/bin/Release",
-					stdout=subprocess.DEVNULL,
-					stderr=subprocess.DEVNULL)
-
-				algorithmLogs = os.path.join("./Launcher/bin/Release", algorithmName + "-log.txt")
-				file = open(algorithmLogs, 'r')
-				for line in file.readlines():
-					for match in re.findall(r"(\d+)k data points per second", line):
-						dataPointsPerSecond.append(int(match))
-					for match in re.findall(r" completed in (\d+)", line):
-						benchmarkLengths.append(int(match))
+			benchmarks.append((language, algorithmName, algorithmLocation))
 
-			averageDps = statistics.mean(dataPointsPerSecond)
-			averageLength = statistics.mean(benchmarkLengths)
-			resultsPerLanguage[algorithmName] = { "average-dps": averageDps, "samples": dataPointsPerSecond, "average-length": averageLength }
-			print(f'Performance for {algorithmName} language {language} avg dps: {averageDps}k samples: [{",".join(str(x) for x in dataPointsPerSecond)}] avg length {averageLength} sec')
+results = { "CSharp": {}, "Python": {} }
+with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+	for language, algorithmName, result in executor.map(lambda x: run_benchmark(*x, cpuSets), benchmarks):
+		results[language][algorithmName] = result
 
-	results[language] = resultsPerLanguage
+# The time the Python benchmarks spend on the Python side, over their C# version
+for algorithmName, result in results["Python"].items():
+	reference = results["CSharp"].get(algorithmName)
+	if reference and reference["median-length"] is not None and result["median-length"] is not None:
+		result["python-seconds"] = result["median-length"] - reference["median-length"]
+		result["python-fraction"] = result["python-seconds"] / result["median-length"] if result["median-length"] else None
+		print(f'Python side time for {algorithmName}: {result["python-seconds"]:.2f} sec ({result["python-fraction"]:.0%} of the run)')
 
-with open("benchmark_results.json", "w") as outfile:
+with open(args.output, "w") as outfile:
 	json.dump(results, outfile)
+
+history = []
+if os.path.exists(args.history):
+	with open(args.history) as file:
+		history = json.load(file)
+
+commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+history.append({
+	"time": datetime.now(timezone.utc).isoformat(),
+	"commit": commit,
+	"settings": { "warmup": args.warmup, "repetitions": args.repetitions, "parallel": args.parallel, "pin-cpus": args.pin_cpus },
+	"results": results
+})
+with open(args.history, "w") as outfile:
+	json.dump(history, outfile)